@@ -11,6 +11,9 @@ THUMBNAIL_SIZE = 256
 TEMP_FILE_SUFFIX = ".tmp"
 MAX_INPUT_IMAGES = 3
 
+# Maximum concurrent Gemini requests per generation batch
+DEFAULT_GENERATION_CONCURRENCY = 5
+
 # Image processing defaults
 DEFAULT_IMAGE_FORMAT = "png"
 THUMBNAIL_FORMAT = "jpeg"
@@ -5,6 +5,8 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
+from .constants import DEFAULT_GENERATION_CONCURRENCY
+
 
 class ModelTier(str, Enum):
     """Model selection options."""
@@ -41,6 +43,8 @@ class ServerConfig:
     mask_error_details: bool = False
     max_concurrent_requests: int = 10
     image_output_dir: str = ""
+    text_summary: bool = True  # Full text summary alongside structured content
+    inline_thumbnails: bool = True  # Embed thumbnails; False returns resource links
 
     @classmethod
     def from_env(cls) -> "ServerConfig":
@@ -68,10 +72,28 @@ class ServerConfig:
             port=int(os.getenv("FASTMCP_PORT", "9000")),
             mask_error_details=os.getenv("FASTMCP_MASK_ERRORS", "false").lower() == "true",
             image_output_dir=str(output_path),
+            text_summary=os.getenv("BANANA_MCP_TEXT_SUMMARY", "true").lower() == "true",
+            inline_thumbnails=os.getenv("BANANA_MCP_INLINE_THUMBNAILS", "true").lower() == "true",
         )
 
 
-@dataclass
+def _concurrency_from_env() -> int:
+    """Read BANANA_MCP_CONCURRENCY, requiring a positive integer."""
+    raw = os.getenv("BANANA_MCP_CONCURRENCY", "").strip()
+    if not raw:
+        return DEFAULT_GENERATION_CONCURRENCY
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ValueError(
+            f"BANANA_MCP_CONCURRENCY must be a positive integer, got {raw!r}"
+        ) from None
+    if value < 1:
+        raise ValueError(f"BANANA_MCP_CONCURRENCY must be a positive integer, got {raw!r}")
+    return value
+
+
+@dataclass(slots=True)
 class BaseModelConfig:
     """Shared base configuration for all models."""
 
@@ -79,9 +101,10 @@ class BaseModelConfig:
     max_inline_image_size: int = 20 * 1024 * 1024  # 20MB
     default_image_format: str = "png"
     request_timeout: int = 60  # seconds
+    max_concurrent_generations: int = field(default_factory=_concurrency_from_env)
 
 
-@dataclass
+@dataclass(slots=True)
 class FlashImageConfig(BaseModelConfig):
     """Gemini 2.5 Flash Image configuration (speed-optimized)."""
 
@@ -92,7 +115,7 @@ class FlashImageConfig(BaseModelConfig):
     supports_media_resolution: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ProImageConfig(BaseModelConfig):
     """Gemini 3 Pro Image configuration (quality-optimized)."""
 
@@ -108,7 +131,7 @@ class ProImageConfig(BaseModelConfig):
     request_timeout: int = 90  # Pro model needs more time for 4K
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelSelectionConfig:
     """Configuration for intelligent model selection."""
 
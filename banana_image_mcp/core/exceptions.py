@@ -1,10 +1,10 @@
 """Custom exceptions for the Nano Banana MCP Server."""
 
-from enum import Enum
+from enum import StrEnum
 from typing import Any
 
 
-class ErrorCode(Enum):
+class ErrorCode(StrEnum):
     """错误码枚举 - Error code enumeration for categorized error handling.
 
     Categories:
@@ -98,7 +98,7 @@ class NanoBananaError(Exception):
     def __str__(self) -> str:
         """Format as '[ERROR_CODE] message' when error_code exists."""
         if self.error_code:
-            return f"[{self.error_code.value}] {self.message}"
+            return f"[{self.error_code}] {self.message}"
         return self.message
 
 
@@ -139,8 +139,7 @@ class ValidationError(NanoBananaError):
             ctx["field"] = field
         if value is not None:
             # Truncate long values to avoid huge error messages
-            str_value = str(value)
-            ctx["value"] = str_value[:100] if len(str_value) > 100 else str_value
+            ctx["value"] = str(value)[:100]
 
         super().__init__(message, error_code, ctx, cause)
         self.field = field
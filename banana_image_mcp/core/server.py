@@ -40,7 +40,11 @@ class NanoBananaMCP:
         from ..tools.output_stats import register_output_stats_tool
         from ..tools.upload_file import register_upload_file_tool
 
-        register_generate_image_tool(self.server)
+        register_generate_image_tool(
+            self.server,
+            text_summary=self.config.text_summary,
+            inline_thumbnails=self.config.inline_thumbnails,
+        )
         register_upload_file_tool(self.server)
         register_output_stats_tool(self.server)
         register_maintenance_tool(self.server)
@@ -3,7 +3,6 @@ Resource handler for serving stored images via file:// URIs.
 Provides both full resolution and thumbnail access.
 """
 
-import base64
 import logging
 from typing import Any
 
@@ -11,6 +10,7 @@ from fastmcp import FastMCP
 
 from ..core.exceptions import ValidationError
 from ..services import get_image_storage_service
+from ..utils.base64_utils import b64encode_str
 
 
 def register_stored_image_resources(server: FastMCP):
@@ -56,7 +56,7 @@ def register_stored_image_resources(server: FastMCP):
             return {
                 "mimeType": info.mime_type,
                 "size": info.size_bytes,
-                "data": base64.b64encode(image_bytes).decode(),
+                "data": b64encode_str(image_bytes),
                 "metadata": {
                     "width": info.width,
                     "height": info.height,
@@ -113,7 +113,7 @@ def register_stored_image_resources(server: FastMCP):
             return {
                 "mimeType": "image/jpeg",  # Thumbnails are always JPEG
                 "size": info.thumbnail_size_bytes,
-                "data": base64.b64encode(thumbnail_bytes).decode(),
+                "data": b64encode_str(thumbnail_bytes),
                 "metadata": {
                     "width": info.thumbnail_width,
                     "height": info.thumbnail_height,
@@ -80,7 +80,12 @@ def initialize_services(server_config: ServerConfig, gemini_config: GeminiConfig
     _image_storage_service = ImageStorageService(gemini_config, temp_images_dir)
     _files_api_service = FilesAPIService(_pro_gemini_client, _image_database_service)
     _enhanced_image_service = EnhancedImageService(
-        _pro_gemini_client, _files_api_service, _image_database_service, gemini_config, out_dir
+        _pro_gemini_client,
+        _files_api_service,
+        _image_database_service,
+        gemini_config,
+        out_dir,
+        max_concurrent_generations=pro_config.max_concurrent_generations,
     )
     _maintenance_service = MaintenanceService(_files_api_service, _image_database_service, out_dir)
 
@@ -1,14 +1,106 @@
 """Base image service providing common functionality for all image generation services."""
 
 from abc import ABC, abstractmethod
-import base64
+import asyncio
+from collections.abc import Coroutine, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from functools import cache
 import logging
-from typing import Any, Protocol
+import threading
+from types import MappingProxyType
+from typing import Any, Protocol, TypeVar
 
 from fastmcp.utilities.types import Image as MCPImage
 
+from ..config.constants import DEFAULT_GENERATION_CONCURRENCY
 from ..core.progress_tracker import ProgressContext
-from ..utils.image_utils import optimize_image_size, validate_image_format
+from ..utils.image_utils import optimize_image_bytes, validate_image_format
+
+T = TypeVar("T")
+
+# Size limit for images returned inline when storage is unavailable
+_INLINE_IMAGE_MAX_SIZE = 2 * 1024 * 1024
+
+
+def _run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion from synchronous code.
+
+    Uses ``asyncio.run`` directly when no event loop is running; otherwise
+    runs it on a helper thread so callers inside a loop do not deadlock.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+@cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+class ImageMetadata(Mapping[str, Any]):
+    """Base class for per-image metadata records.
+
+    Subclasses are frozen, slotted dataclasses (declared with ``eq=False`` so
+    mapping equality applies). The read-only mapping interface keeps dict-style
+    access working; `to_dict` materializes a plain dict for serialization.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _field_names(type(self)):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_field_names(type(self)))
+
+    def __len__(self) -> int:
+        return len(_field_names(type(self)))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {name: getattr(self, name) for name in _field_names(type(self))}
+
+
+@dataclass(frozen=True, slots=True)
+class EditItem:
+    """A single source image and instruction for batch editing."""
+
+    instruction: str
+    base_image_b64: str
+    mime_type: str = "image/png"
+
+
+class _ThrottledProgress:
+    """Coalesce progress updates that advance by less than ``min_delta`` percent.
+
+    Updates may arrive from several worker threads; only forward progress is
+    reported, and 100% always goes through.
+    """
+
+    def __init__(self, progress: ProgressContext, min_delta: int = 2):
+        self._progress = progress
+        self._min_delta = min_delta
+        self._last_pct: int | None = None
+        self._lock = threading.Lock()
+
+    def update(self, progress_percent: int, message: str) -> None:
+        with self._lock:
+            if (
+                progress_percent != 100
+                and self._last_pct is not None
+                and progress_percent - self._last_pct < self._min_delta
+            ):
+                return
+            self._last_pct = progress_percent
+        self._progress.update(progress_percent, message)
 
 
 class ImageGenerationConfig(Protocol):
@@ -42,6 +134,8 @@ class BaseImageService(ABC):
         self.config = config
         self.storage_service = storage_service
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._mime_type = f"image/{config.default_image_format}"
+        self._edit_operation_name = self._get_operation_name().replace("generation", "editing")
 
     @abstractmethod
     def _get_operation_name(self) -> str:
@@ -71,7 +165,7 @@ class BaseImageService(ABC):
         response_index: int,
         image_index: int,
         **kwargs: Any,
-    ) -> dict[str, Any]:
+    ) -> ImageMetadata:
         """Build model-specific metadata for generated image.
 
         Args:
@@ -81,10 +175,24 @@ class BaseImageService(ABC):
             **kwargs: Additional model-specific parameters
 
         Returns:
-            Metadata dictionary
+            Metadata record (orjson-compatible: str, int, bool and None fields only)
         """
         ...
 
+    def _resolve_defaults(self, **kwargs: Any) -> Mapping[str, Any]:
+        """Resolve metadata fields that are shared by every image in a request.
+
+        Called once per request so `_build_metadata` does not recompute config
+        defaults per image. Override in subclasses to add model-specific fields.
+
+        Args:
+            **kwargs: Model-specific parameters
+
+        Returns:
+            Read-only mapping of resolved metadata fields
+        """
+        return MappingProxyType({"mime_type": self._mime_type})
+
     def _enhance_prompt(self, prompt: str, **kwargs: Any) -> str:
         """Enhance prompt with model-specific modifications.
 
@@ -120,7 +228,18 @@ class BaseImageService(ABC):
         Returns:
             List of content parts for Gemini API
         """
+        # Fast path: plain prompt with no extras
+        if not (system_instruction or negative_prompt or input_images):
+            return [self._enhance_prompt(prompt, **kwargs)]
+
+        # Place input images before text for better context
         contents: list[Any] = []
+        if input_images:
+            contents = list(
+                self.gemini_client.create_image_parts(
+                    [b64 for b64, _ in input_images], [mime for _, mime in input_images]
+                )
+            )
 
         # Add system instruction if provided
         if system_instruction:
@@ -132,19 +251,18 @@ class BaseImageService(ABC):
             enhanced_prompt += f"\n\nConstraints (avoid): {negative_prompt}"
         contents.append(enhanced_prompt)
 
-        # Add input images if provided
-        if input_images:
-            images_b64, mime_types = zip(*input_images, strict=False)
-            image_parts = self.gemini_client.create_image_parts(list(images_b64), list(mime_types))
-            # Place images before text for better context
-            contents = list(image_parts) + contents
-
         return contents
 
+    def _concurrency_limit(self) -> int:
+        """Get the maximum number of in-flight API requests per batch."""
+        return max(
+            1, getattr(self.config, "max_concurrent_generations", DEFAULT_GENERATION_CONCURRENCY)
+        )
+
     def _process_image_output(
         self,
         image_bytes: bytes,
-        metadata: dict[str, Any],
+        metadata: Mapping[str, Any],
         use_storage: bool,
     ) -> MCPImage:
         """Process image output with optional storage.
@@ -161,22 +279,20 @@ class BaseImageService(ABC):
             # Store image and return thumbnail
             stored_info = self.storage_service.store_image(
                 image_bytes,
-                f"image/{self.config.default_image_format}",
-                metadata,
+                self._mime_type,
+                dict(metadata),
             )
 
             # Get thumbnail for preview
-            thumbnail_b64 = self.storage_service.get_thumbnail_base64(stored_info.id)
-            if thumbnail_b64:
-                thumbnail_bytes = base64.b64decode(thumbnail_b64)
+            thumbnail_bytes = self.storage_service.get_thumbnail_bytes(stored_info.id)
+            if thumbnail_bytes:
                 return MCPImage(data=thumbnail_bytes, format="jpeg")
 
         # Fallback: optimize and return directly
-        optimized_b64 = optimize_image_size(
-            base64.b64encode(image_bytes).decode(),
-            max_size=2 * 1024 * 1024,
-        )
-        optimized_bytes = base64.b64decode(optimized_b64)
+        if len(image_bytes) <= _INLINE_IMAGE_MAX_SIZE:
+            return MCPImage(data=image_bytes, format=self.config.default_image_format)
+
+        optimized_bytes = optimize_image_bytes(image_bytes, max_size=_INLINE_IMAGE_MAX_SIZE)
         return MCPImage(data=optimized_bytes, format=self.config.default_image_format)
 
     def _generation_loop(
@@ -189,9 +305,12 @@ class BaseImageService(ABC):
         progress: ProgressContext,
         aspect_ratio: str | None = None,
         **kwargs: Any,
-    ) -> tuple[list[MCPImage], list[dict[str, Any]]]:
+    ) -> tuple[list[MCPImage], list[ImageMetadata]]:
         """Execute generation loop with progress tracking.
 
+        Synchronous shim around `_generation_loop_async` so existing callers
+        keep their blocking API while the ``n`` requests run concurrently.
+
         Args:
             contents: API request contents
             n: Number of images to generate
@@ -205,32 +324,80 @@ class BaseImageService(ABC):
         Returns:
             Tuple of (images, metadata_list)
         """
-        all_images: list[MCPImage] = []
-        all_metadata: list[dict[str, Any]] = []
+        return _run_sync(
+            self._generation_loop_async(
+                contents,
+                n,
+                prompt,
+                gen_config,
+                use_storage,
+                progress,
+                aspect_ratio,
+                **kwargs,
+            )
+        )
 
-        for i in range(n):
-            try:
-                progress.update(
-                    20 + (i * 60 // n),
-                    f"Generating image {i + 1}/{n}...",
-                )
+    async def _generation_loop_async(
+        self,
+        contents: list[Any],
+        n: int,
+        prompt: str,
+        gen_config: dict[str, Any] | None,
+        use_storage: bool,
+        progress: ProgressContext,
+        aspect_ratio: str | None = None,
+        **kwargs: Any,
+    ) -> tuple[list[MCPImage], list[ImageMetadata]]:
+        """Issue all ``n`` generation requests concurrently.
 
-                # Call Gemini API with resolution support
-                # Extract resolution from kwargs for image_size parameter
-                resolution = kwargs.get("resolution", "high")
-                response = self.gemini_client.generate_content(
-                    contents,
-                    config=gen_config if gen_config else None,
-                    aspect_ratio=aspect_ratio,
-                    image_size=resolution,
-                )
-                images = self.gemini_client.extract_images(response)
+        Requests are bounded by a semaphore sized from
+        ``config.max_concurrent_generations``. Responses are streamed and each
+        image is processed on a worker pool as soon as it arrives. A failed
+        request is logged without cancelling the rest of the batch; images it
+        streamed before failing are still returned. Results keep request order.
 
-                for j, image_bytes in enumerate(images):
-                    progress.update(
-                        20 + ((i * 60 + j * 60 // max(len(images), 1)) // n),
-                        f"Processing image {i + 1}.{j + 1}...",
-                    )
+        Args:
+            contents: API request contents
+            n: Number of images to generate
+            prompt: Original prompt for metadata
+            gen_config: Generation configuration
+            use_storage: Whether to use storage
+            progress: Progress context
+            aspect_ratio: Optional aspect ratio
+            **kwargs: Additional parameters for metadata
+
+        Returns:
+            Tuple of (images, metadata_list)
+        """
+        limit = self._concurrency_limit()
+        semaphore = asyncio.Semaphore(limit)
+        # Extract resolution from kwargs for image_size parameter
+        resolution = kwargs.get("resolution", "high")
+
+        # Precompute per-request progress and skip log formatting when disabled
+        progress_pcts = [20 + (i * 60 // n) for i in range(n)]
+        gen_msgs = [f"Generating image {i + 1}/{n}..." for i in range(n)]
+        log_info = self.logger.isEnabledFor(logging.INFO)
+        throttled = _ThrottledProgress(progress)
+
+        def _stream_response(
+            i: int,
+            executor: ThreadPoolExecutor,
+            pending: list[tuple[Future[MCPImage], ImageMetadata]],
+        ) -> None:
+            # Hand each image to the executor as soon as its chunk arrives so
+            # output processing overlaps the rest of the stream. Futures are
+            # recorded in the caller's list so they survive a mid-stream error.
+            stream = self.gemini_client.generate_content_stream(
+                contents,
+                config=gen_config if gen_config else None,
+                aspect_ratio=aspect_ratio,
+                image_size=resolution,
+            )
+            for chunk in stream:
+                for image_bytes in self.gemini_client.extract_images(chunk):
+                    j = len(pending)
+                    throttled.update(progress_pcts[i], f"Processing image {i + 1}.{j + 1}...")
 
                     # Build metadata (model-specific)
                     metadata = self._build_metadata(
@@ -240,20 +407,53 @@ class BaseImageService(ABC):
                         aspect_ratio=aspect_ratio,
                         **kwargs,
                     )
-
-                    # Process output
-                    mcp_image = self._process_image_output(image_bytes, metadata, use_storage)
-                    all_images.append(mcp_image)
-                    all_metadata.append(metadata)
-
-                    self.logger.info(
-                        f"Generated image {i + 1}.{j + 1} (size: {len(image_bytes)} bytes)"
+                    future = executor.submit(
+                        self._process_image_output, image_bytes, metadata, use_storage
                     )
+                    pending.append((future, metadata))
 
+                    if log_info:
+                        self.logger.info(
+                            f"Generated image {i + 1}.{j + 1} (size: {len(image_bytes)} bytes)"
+                        )
+
+        async def _generate_one(
+            i: int, executor: ThreadPoolExecutor
+        ) -> list[tuple[MCPImage, ImageMetadata]]:
+            pending: list[tuple[Future[MCPImage], ImageMetadata]] = []
+            try:
+                async with semaphore:
+                    throttled.update(progress_pcts[i], gen_msgs[i])
+                    await asyncio.to_thread(_stream_response, i, executor, pending)
             except Exception as e:
                 self.logger.error(f"Failed to generate image {i + 1}: {e}")
-                # Continue with other images
-                continue
+                # Continue with other images; anything already submitted is
+                # still collected below so stored outputs are not orphaned
+
+            outputs = await asyncio.gather(
+                *(asyncio.wrap_future(future) for future, _ in pending),
+                return_exceptions=True,
+            )
+
+            results: list[tuple[MCPImage, ImageMetadata]] = []
+            for output, (_, metadata) in zip(outputs, pending, strict=True):
+                if isinstance(output, Exception):
+                    self.logger.error(
+                        f"Failed to process image {i + 1}.{metadata['image_index']}: {output}"
+                    )
+                    continue
+                results.append((output, metadata))
+            return results
+
+        with ThreadPoolExecutor(max_workers=limit, thread_name_prefix="image-output") as executor:
+            batches = await asyncio.gather(*(_generate_one(i, executor) for i in range(n)))
+
+        all_images: list[MCPImage] = []
+        all_metadata: list[ImageMetadata] = []
+        for batch in batches:
+            for mcp_image, metadata in batch:
+                all_images.append(mcp_image)
+                all_metadata.append(metadata)
 
         return all_images, all_metadata
 
@@ -267,7 +467,7 @@ class BaseImageService(ABC):
         aspect_ratio: str | None = None,
         use_storage: bool = True,
         **model_specific_params: Any,
-    ) -> tuple[list[MCPImage], list[dict[str, Any]]]:
+    ) -> tuple[list[MCPImage], list[ImageMetadata]]:
         """Generate images using Gemini API.
 
         Args:
@@ -301,8 +501,9 @@ class BaseImageService(ABC):
                 **model_specific_params,
             )
 
-            # Get model-specific config
+            # Get model-specific config and per-request metadata defaults
             gen_config = self._build_generation_config(**model_specific_params)
+            resolved = self._resolve_defaults(**model_specific_params)
 
             progress.update(20, "Sending requests to Gemini API...")
 
@@ -317,6 +518,7 @@ class BaseImageService(ABC):
                 aspect_ratio,
                 negative_prompt=negative_prompt,
                 system_instruction=system_instruction,
+                resolved=resolved,
                 **model_specific_params,
             )
 
@@ -347,10 +549,8 @@ class BaseImageService(ABC):
         Returns:
             Tuple of (edited_images, count)
         """
-        operation_name = self._get_operation_name().replace("generation", "editing")
-
         with ProgressContext(
-            operation_name,
+            self._edit_operation_name,
             "Editing image...",
             {"instruction": instruction[:100]},
         ) as progress:
@@ -363,14 +563,15 @@ class BaseImageService(ABC):
                 # Enhance instruction if needed
                 enhanced_instruction = self._enhance_prompt(instruction, **model_specific_params)
 
-                # Create image parts
-                image_parts = self.gemini_client.create_image_parts([base_image_b64], [mime_type])
-                contents = [*list(image_parts), enhanced_instruction]
+                # Create image part
+                image_part = self.gemini_client.create_image_part(base_image_b64, mime_type)
+                contents = [image_part, enhanced_instruction]
 
                 progress.update(40, "Sending edit request to Gemini API...")
 
-                # Get model-specific config
+                # Get model-specific config and per-request metadata defaults
                 gen_config = self._build_generation_config(**model_specific_params)
+                resolved = self._resolve_defaults(**model_specific_params)
 
                 # Generate edited image
                 response = self.gemini_client.generate_content(
@@ -381,12 +582,14 @@ class BaseImageService(ABC):
 
                 progress.update(70, "Processing edited image(s)...")
 
+                count = len(image_bytes_list)
+                progress_pcts = [70 + (i * 20 // count) for i in range(count)]
+                log_info = self.logger.isEnabledFor(logging.INFO)
+                throttled = _ThrottledProgress(progress)
+
                 mcp_images: list[MCPImage] = []
                 for i, image_bytes in enumerate(image_bytes_list):
-                    progress.update(
-                        70 + (i * 20 // max(len(image_bytes_list), 1)),
-                        f"Processing result {i + 1}/{len(image_bytes_list)}...",
-                    )
+                    throttled.update(progress_pcts[i], f"Processing result {i + 1}/{count}...")
 
                     # Build edit metadata
                     metadata = self._build_metadata(
@@ -396,13 +599,15 @@ class BaseImageService(ABC):
                         instruction=instruction,
                         source_mime_type=mime_type,
                         edit_index=i + 1,
+                        resolved=resolved,
                         **model_specific_params,
                     )
 
                     mcp_image = self._process_image_output(image_bytes, metadata, use_storage)
                     mcp_images.append(mcp_image)
 
-                    self.logger.info(f"Edited image {i + 1} (size: {len(image_bytes)} bytes)")
+                    if log_info:
+                        self.logger.info(f"Edited image {i + 1} (size: {len(image_bytes)} bytes)")
 
                 progress.update(
                     100,
@@ -413,3 +618,62 @@ class BaseImageService(ABC):
             except Exception as e:
                 self.logger.error(f"Failed to edit image: {e}")
                 raise
+
+    def edit_images(
+        self,
+        items: list[EditItem],
+        use_storage: bool = True,
+        **model_specific_params: Any,
+    ) -> list[tuple[list[MCPImage], int]]:
+        """Edit several images concurrently.
+
+        Synchronous shim around `edit_images_async`.
+
+        Args:
+            items: Source images with their editing instructions
+            use_storage: Whether to use storage service
+            **model_specific_params: Model-specific parameters
+
+        Returns:
+            List of (edited_images, count) tuples in item order
+        """
+        return _run_sync(self.edit_images_async(items, use_storage, **model_specific_params))
+
+    async def edit_images_async(
+        self,
+        items: list[EditItem],
+        use_storage: bool = True,
+        **model_specific_params: Any,
+    ) -> list[tuple[list[MCPImage], int]]:
+        """Edit several images concurrently.
+
+        Each item is sent as its own `edit_image` request, bounded by the same
+        ``config.max_concurrent_generations`` semaphore as generation. A failed
+        edit is logged and yields an empty result without cancelling the rest.
+
+        Args:
+            items: Source images with their editing instructions
+            use_storage: Whether to use storage service
+            **model_specific_params: Model-specific parameters
+
+        Returns:
+            List of (edited_images, count) tuples in item order
+        """
+        semaphore = asyncio.Semaphore(self._concurrency_limit())
+
+        async def _edit_one(i: int, item: EditItem) -> tuple[list[MCPImage], int]:
+            try:
+                async with semaphore:
+                    return await asyncio.to_thread(
+                        self.edit_image,
+                        item.instruction,
+                        item.base_image_b64,
+                        item.mime_type,
+                        use_storage,
+                        **model_specific_params,
+                    )
+            except Exception as e:
+                self.logger.error(f"Failed to edit image {i + 1}/{len(items)}: {e}")
+                return [], 0
+
+        return list(await asyncio.gather(*(_edit_one(i, item) for i, item in enumerate(items))))
@@ -6,7 +6,7 @@ Implements the complete workflow sequences:
 2. Editing: M->F->G->FS->F->D (get file, edit, save, upload new, track with parent_file_id)
 """
 
-import base64
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 import hashlib
 from io import BytesIO
@@ -18,8 +18,13 @@ from typing import Any
 from fastmcp.utilities.types import Image as MCPImage
 from PIL import Image as PILImage
 
-from ..config.constants import TEMP_FILE_SUFFIX, THUMBNAIL_SIZE
+from ..config.constants import (
+    DEFAULT_GENERATION_CONCURRENCY,
+    TEMP_FILE_SUFFIX,
+    THUMBNAIL_SIZE,
+)
 from ..config.settings import GeminiConfig
+from ..utils.base64_utils import b64encode_str
 from ..utils.image_utils import create_thumbnail, validate_image_format
 from .files_api_service import FilesAPIService
 from .gemini_client import GeminiClient
@@ -44,6 +49,7 @@ class EnhancedImageService:
         db_service: ImageDatabaseService,
         config: GeminiConfig,
         out_dir: str | None = None,
+        max_concurrent_generations: int = DEFAULT_GENERATION_CONCURRENCY,
     ):
         """
         Initialize enhanced image service.
@@ -54,12 +60,14 @@ class EnhancedImageService:
             db_service: Database service
             config: Gemini configuration
             out_dir: Output directory for images (defaults to OUT_DIR env var)
+            max_concurrent_generations: Maximum in-flight Gemini requests per batch
         """
         self.gemini_client = gemini_client
         self.files_api = files_api_service
         self.db_service = db_service
         self.config = config
         self.out_dir = out_dir or "output"
+        self.max_concurrent_generations = max(1, max_concurrent_generations)
         self.logger = logging.getLogger(__name__)
 
         # Ensure output directory exists
@@ -71,7 +79,7 @@ class EnhancedImageService:
         n: int = 1,
         negative_prompt: str | None = None,
         system_instruction: str | None = None,
-        input_images: list[tuple[str, str]] | None = None,
+        input_images: list[tuple[str | bytes, str]] | None = None,
         aspect_ratio: str | None = None,
         resolution: str | None = None,
     ) -> tuple[list[MCPImage], list[dict[str, Any]]]:
@@ -93,7 +101,8 @@ class EnhancedImageService:
             n: Number of images to generate
             negative_prompt: Optional negative prompt
             system_instruction: Optional system instruction
-            input_images: List of (base64, mime_type) tuples for input images
+            input_images: List of (data, mime_type) tuples for input images, where
+                data is either a base64 string or raw bytes
             aspect_ratio: Optional aspect ratio string (e.g., "16:9")
             resolution: Optional output resolution ("1K", "2K", "4K") - Pro model only
 
@@ -116,45 +125,65 @@ class EnhancedImageService:
 
             # Add input images if provided
             if input_images:
-                images_b64, mime_types = zip(*input_images, strict=False)
                 image_parts = self.gemini_client.create_image_parts(
-                    list(images_b64), list(mime_types)
+                    [b64 for b64, _ in input_images], [mime for _, mime in input_images]
                 )
-                contents = image_parts + contents
+                image_parts.extend(contents)
+                contents = image_parts
 
-            # Generate all images
-            all_thumbnail_images = []
-            all_metadata = []
+            # Issue up to max_concurrent_generations requests at once and hand
+            # each image to a second pool, so the save/thumbnail/upload
+            # workflow overlaps the API calls still in flight
+            limit = self.max_concurrent_generations
 
-            for i in range(n):
-                try:
-                    self.logger.debug(f"Generating image {i + 1}/{n}...")
+            def _generate_one(i: int) -> list[Future[tuple[MCPImage, dict[str, Any]]]]:
+                self.logger.debug(f"Generating image {i + 1}/{n}...")
 
-                    # Step 1-2: M->>G: generateContent -> G-->>M: inline image bytes
-                    response = self.gemini_client.generate_content(
-                        contents, aspect_ratio=aspect_ratio, image_size=resolution
+                # Step 1-2: M->>G: generateContent -> G-->>M: inline image bytes
+                response = self.gemini_client.generate_content(
+                    contents, aspect_ratio=aspect_ratio, image_size=resolution
+                )
+                images = self.gemini_client.extract_images(response)
+
+                # Process each generated image through the full workflow
+                return [
+                    process_pool.submit(
+                        self._process_generated_image,
+                        image_bytes,
+                        i + 1,
+                        j + 1,
+                        prompt,
+                        negative_prompt,
+                        system_instruction,
+                        aspect_ratio,
                     )
-                    images = self.gemini_client.extract_images(response)
-
-                    for j, image_bytes in enumerate(images):
-                        # Process each generated image through the full workflow
-                        thumbnail_image, metadata = self._process_generated_image(
-                            image_bytes,
-                            i + 1,
-                            j + 1,
-                            prompt,
-                            negative_prompt,
-                            system_instruction,
-                            aspect_ratio,
-                        )
-
-                        all_thumbnail_images.append(thumbnail_image)
-                        all_metadata.append(metadata)
+                    for j, image_bytes in enumerate(images)
+                ]
+
+            pending: list[tuple[int, Future[tuple[MCPImage, dict[str, Any]]]]] = []
+            with (
+                ThreadPoolExecutor(max_workers=limit) as process_pool,
+                ThreadPoolExecutor(max_workers=limit) as request_pool,
+            ):
+                request_futures = [request_pool.submit(_generate_one, i) for i in range(n)]
+                for i, request in enumerate(request_futures):
+                    try:
+                        pending.extend((i, future) for future in request.result())
+                    except Exception as e:
+                        self.logger.error(f"Failed to generate image {i + 1}: {e}")
+                        # Continue with other images rather than failing completely
+                        continue
 
+            all_thumbnail_images = []
+            all_metadata = []
+            for i, future in pending:
+                try:
+                    thumbnail_image, metadata = future.result()
                 except Exception as e:
                     self.logger.error(f"Failed to generate image {i + 1}: {e}")
-                    # Continue with other images rather than failing completely
                     continue
+                all_thumbnail_images.append(thumbnail_image)
+                all_metadata.append(metadata)
 
             self.logger.info(f"Successfully generated {len(all_thumbnail_images)} images")
             return all_thumbnail_images, all_metadata
@@ -266,11 +295,11 @@ class EnhancedImageService:
             validate_image_format(mime_type)
 
             # Convert to base64 for Gemini API (only internally, not in tool interface)
-            base_image_b64 = base64.b64encode(image_bytes).decode("utf-8")
+            base_image_b64 = b64encode_str(image_bytes)
 
             # Create parts for Gemini API
-            image_parts = self.gemini_client.create_image_parts([base_image_b64], [mime_type])
-            contents = [*image_parts, instruction]
+            image_part = self.gemini_client.create_image_part(base_image_b64, mime_type)
+            contents = [image_part, instruction]
 
             # Generate edited image
             response = self.gemini_client.generate_content(contents)
@@ -404,6 +433,7 @@ class EnhancedImageService:
             "width": width,
             "height": height,
             "size_bytes": len(image_bytes),
+            "size_mb": round(len(image_bytes) / 1048576, 1),
             "files_api": {"name": file_id, "uri": file_uri} if file_id else None,
         }
 
@@ -480,6 +510,7 @@ class EnhancedImageService:
             "width": width,
             "height": height,
             "size_bytes": len(image_bytes),
+            "size_mb": round(len(image_bytes) / 1048576, 1),
             "files_api": {"name": new_file_id, "uri": new_file_uri} if new_file_id else None,
         }
 
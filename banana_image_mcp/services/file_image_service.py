@@ -138,11 +138,11 @@ class FileImageService:
 
             # Add input images if provided
             if input_images:
-                images_b64, mime_types = zip(*input_images, strict=False)
                 image_parts = self.gemini_client.create_image_parts(
-                    list(images_b64), list(mime_types)
+                    [b64 for b64, _ in input_images], [mime for _, mime in input_images]
                 )
-                contents = image_parts + contents
+                image_parts.extend(contents)
+                contents = image_parts
 
             progress.update(20, "Sending requests to Gemini API...")
 
@@ -244,8 +244,8 @@ class FileImageService:
                 progress.update(20, "Preparing edit request...")
 
                 # Create parts for Gemini API
-                image_parts = self.gemini_client.create_image_parts([base_image_b64], [mime_type])
-                contents = [*image_parts, instruction]
+                image_part = self.gemini_client.create_image_part(base_image_b64, mime_type)
+                contents = [image_part, instruction]
 
                 progress.update(40, "Sending edit request to Gemini API...")
 
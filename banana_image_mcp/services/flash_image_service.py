@@ -1,13 +1,30 @@
 """Flash image service for speed-optimized image generation."""
 
+from dataclasses import dataclass
 from typing import Any
 
 from ..config.settings import FlashImageConfig
-from .base_image_service import BaseImageService
+from .base_image_service import BaseImageService, ImageMetadata
 from .gemini_client import GeminiClient
 from .image_storage_service import ImageStorageService
 
 
+@dataclass(frozen=True, slots=True, kw_only=True, eq=False)
+class FlashImageMetadata(ImageMetadata):
+    """Metadata for a Flash-generated image."""
+
+    model: str = "gemini-2.5-flash-image"
+    model_tier: str = "flash"
+    response_index: int
+    image_index: int
+    prompt: str
+    negative_prompt: str | None = None
+    system_instruction: str | None = None
+    aspect_ratio: str | None = None
+    mime_type: str
+    synthid_watermark: bool = True
+
+
 class FlashImageService(BaseImageService):
     """Gemini Flash image service for speed-optimized generation.
 
@@ -54,7 +71,7 @@ class FlashImageService(BaseImageService):
         system_instruction: str | None = None,
         aspect_ratio: str | None = None,
         **kwargs: Any,
-    ) -> dict[str, Any]:
+    ) -> FlashImageMetadata:
         """Build metadata for Flash-generated image.
 
         Args:
@@ -67,20 +84,17 @@ class FlashImageService(BaseImageService):
             **kwargs: Additional parameters (ignored)
 
         Returns:
-            Metadata dictionary with Flash-specific fields
+            Metadata record with Flash-specific fields
         """
-        return {
-            "model": "gemini-2.5-flash-image",
-            "model_tier": "flash",
-            "response_index": response_index,
-            "image_index": image_index,
-            "prompt": prompt,
-            "negative_prompt": negative_prompt,
-            "system_instruction": system_instruction,
-            "aspect_ratio": aspect_ratio,
-            "mime_type": f"image/{self.config.default_image_format}",
-            "synthid_watermark": True,
-        }
+        return FlashImageMetadata(
+            response_index=response_index,
+            image_index=image_index,
+            prompt=prompt,
+            negative_prompt=negative_prompt,
+            system_instruction=system_instruction,
+            aspect_ratio=aspect_ratio,
+            mime_type=self._mime_type,
+        )
 
     def _enhance_prompt(self, prompt: str, **kwargs: Any) -> str:
         """Enhance prompt for Flash model.
@@ -1,4 +1,4 @@
-import base64
+from collections.abc import Iterator
 import logging
 from typing import Any
 
@@ -12,6 +12,7 @@ from ..config.settings import (
     ProImageConfig,
     ServerConfig,
 )
+from ..utils.base64_utils import b64decode
 
 
 class GeminiClient:
@@ -34,8 +35,29 @@ class GeminiClient:
             self._client = genai.Client(api_key=self.config.gemini_api_key)
         return self._client
 
-    def create_image_parts(self, images_b64: list[str], mime_types: list[str]) -> list[gx.Part]:
-        """Convert base64 images to Gemini Part objects."""
+    def create_image_part(self, image_b64: str, mime_type: str) -> gx.Part:
+        """Convert a single base64 image to a Gemini Part object."""
+        if not image_b64 or not mime_type:
+            raise ValueError("Image data and MIME type are required")
+
+        try:
+            raw_data = b64decode(image_b64)
+        except Exception as e:
+            self.logger.error(f"Failed to decode image: {e}")
+            raise ValueError(f"Invalid image data: {e}") from e
+
+        if len(raw_data) == 0:
+            raise ValueError("Image data is empty")
+        return gx.Part.from_bytes(data=raw_data, mime_type=mime_type)
+
+    def create_image_parts(
+        self, images_b64: list[str | bytes], mime_types: list[str]
+    ) -> list[gx.Part]:
+        """Convert images to Gemini Part objects.
+
+        Each image may be a base64 string or raw ``bytes``; raw bytes are
+        passed to ``Part.from_bytes`` as-is without a decode step.
+        """
         if not images_b64 or not mime_types:
             return []
 
@@ -51,7 +73,7 @@ class GeminiClient:
                 continue
 
             try:
-                raw_data = base64.b64decode(b64)
+                raw_data = b64 if isinstance(b64, bytes) else b64decode(b64)
                 if len(raw_data) == 0:
                     self.logger.warning(f"Skipping empty image data at index {i}")
                     continue
@@ -63,6 +85,89 @@ class GeminiClient:
                 raise ValueError(f"Invalid image data at index {i}: {e}") from e
         return parts
 
+    def _build_request(
+        self,
+        contents: list,
+        config: dict[str, Any] | None = None,
+        aspect_ratio: str | None = None,
+        image_size: str | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """
+        Build keyword arguments for a `generate_content` style SDK call.
+
+        Args:
+            contents: Content list (text, images, etc.)
+            config: Generation configuration dict (model-specific parameters)
+            aspect_ratio: Optional aspect ratio string (e.g., "16:9")
+            image_size: Optional output resolution ("1K", "2K", "4K") - Pro model only
+            **kwargs: Additional parameters
+
+        Returns:
+            Keyword arguments for the SDK models API
+        """
+        # Remove unsupported request_options parameter
+        kwargs.pop("request_options", None)
+
+        # Check for config conflict
+        config_obj = kwargs.pop("config", None)
+        if config_obj is not None:
+            if aspect_ratio or config:
+                self.logger.warning(
+                    "Custom 'config' kwarg provided; ignoring aspect_ratio and config parameters"
+                )
+            kwargs["config"] = config_obj
+        else:
+            # Filter parameters based on model capabilities
+            filtered_config = self._filter_parameters(config or {})
+
+            # Build generation config
+            config_kwargs = {
+                "response_modalities": ["Image"],  # Force image-only responses
+            }
+
+            # Build image config if aspect_ratio or image_size provided
+            if aspect_ratio or image_size:
+                image_config_kwargs = {}
+                if aspect_ratio:
+                    image_config_kwargs["aspect_ratio"] = aspect_ratio
+                if image_size:
+                    # Normalize resolution format: "4k" -> "4K", "high" -> "4K"
+                    size_map = {
+                        "4k": "4K",
+                        "4K": "4K",
+                        "high": "4K",
+                        "2k": "2K",
+                        "2K": "2K",
+                        "1k": "1K",
+                        "1K": "1K",
+                        "low": "1K",
+                    }
+                    normalized_size = size_map.get(image_size, "4K")
+                    image_config_kwargs["image_size"] = normalized_size
+                    self.logger.info(f"Setting image_size={normalized_size}")
+                config_kwargs["image_config"] = gx.ImageConfig(**image_config_kwargs)
+
+            # Merge filtered config parameters
+            config_kwargs.update(filtered_config)
+
+            kwargs["config"] = gx.GenerateContentConfig(**config_kwargs)
+
+        # Prepare kwargs
+        api_kwargs = {
+            "model": self.gemini_config.model_name,
+            "contents": contents,
+        }
+
+        # Merge additional kwargs
+        api_kwargs.update(kwargs)
+
+        self.logger.debug(
+            f"Calling Gemini API: model={self.gemini_config.model_name}, "
+            f"config={api_kwargs.get('config')}"
+        )
+        return api_kwargs
+
     def generate_content(
         self,
         contents: list,
@@ -85,67 +190,13 @@ class GeminiClient:
             API response object
         """
         try:
-            # Remove unsupported request_options parameter
-            kwargs.pop("request_options", None)
-
-            # Check for config conflict
-            config_obj = kwargs.pop("config", None)
-            if config_obj is not None:
-                if aspect_ratio or config:
-                    self.logger.warning(
-                        "Custom 'config' kwarg provided; ignoring aspect_ratio and config parameters"
-                    )
-                kwargs["config"] = config_obj
-            else:
-                # Filter parameters based on model capabilities
-                filtered_config = self._filter_parameters(config or {})
-
-                # Build generation config
-                config_kwargs = {
-                    "response_modalities": ["Image"],  # Force image-only responses
-                }
-
-                # Build image config if aspect_ratio or image_size provided
-                if aspect_ratio or image_size:
-                    image_config_kwargs = {}
-                    if aspect_ratio:
-                        image_config_kwargs["aspect_ratio"] = aspect_ratio
-                    if image_size:
-                        # Normalize resolution format: "4k" -> "4K", "high" -> "4K"
-                        size_map = {
-                            "4k": "4K",
-                            "4K": "4K",
-                            "high": "4K",
-                            "2k": "2K",
-                            "2K": "2K",
-                            "1k": "1K",
-                            "1K": "1K",
-                            "low": "1K",
-                        }
-                        normalized_size = size_map.get(image_size, "4K")
-                        image_config_kwargs["image_size"] = normalized_size
-                        self.logger.info(f"Setting image_size={normalized_size}")
-                    config_kwargs["image_config"] = gx.ImageConfig(**image_config_kwargs)
-
-                # Merge filtered config parameters
-                config_kwargs.update(filtered_config)
-
-                kwargs["config"] = gx.GenerateContentConfig(**config_kwargs)
-
-            # Prepare kwargs
-            api_kwargs = {
-                "model": self.gemini_config.model_name,
-                "contents": contents,
-            }
-
-            # Merge additional kwargs
-            api_kwargs.update(kwargs)
-
-            self.logger.debug(
-                f"Calling Gemini API: model={self.gemini_config.model_name}, "
-                f"config={api_kwargs.get('config')}"
+            api_kwargs = self._build_request(
+                contents,
+                config=config,
+                aspect_ratio=aspect_ratio,
+                image_size=image_size,
+                **kwargs,
             )
-
             response = self.client.models.generate_content(**api_kwargs)
             return response
 
@@ -153,6 +204,44 @@ class GeminiClient:
             self.logger.error(f"Gemini API error: {e}")
             raise
 
+    def generate_content_stream(
+        self,
+        contents: list,
+        config: dict[str, Any] | None = None,
+        aspect_ratio: str | None = None,
+        image_size: str | None = None,
+        **kwargs,
+    ) -> Iterator[Any]:
+        """
+        Stream content from Gemini API, yielding response chunks as they arrive.
+
+        Image parts arrive whole within a chunk, so callers can pass each chunk
+        to `extract_images` and start processing before the response completes.
+
+        Args:
+            contents: Content list (text, images, etc.)
+            config: Generation configuration dict (model-specific parameters)
+            aspect_ratio: Optional aspect ratio string (e.g., "16:9")
+            image_size: Optional output resolution ("1K", "2K", "4K") - Pro model only
+            **kwargs: Additional parameters
+
+        Yields:
+            Partial API response objects
+        """
+        try:
+            api_kwargs = self._build_request(
+                contents,
+                config=config,
+                aspect_ratio=aspect_ratio,
+                image_size=image_size,
+                **kwargs,
+            )
+            yield from self.client.models.generate_content_stream(**api_kwargs)
+
+        except Exception as e:
+            self.logger.error(f"Gemini API streaming error: {e}")
+            raise
+
     def _filter_parameters(self, config: dict[str, Any]) -> dict[str, Any]:
         """
         Filter configuration parameters based on model capabilities.
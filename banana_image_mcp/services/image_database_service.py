@@ -9,12 +9,13 @@ Implements the DB/Index layer shown in workflows.md for tracking:
 """
 
 from datetime import datetime, timedelta
-import json
 import logging
 import os
 import sqlite3
 from typing import Any, NamedTuple
 
+from ..utils import json_utils
+
 
 class ImageRecord(NamedTuple):
     """Represents a stored image record from the database."""
@@ -117,7 +118,7 @@ class ImageDatabaseService:
         Returns:
             Database ID of the inserted/updated record
         """
-        metadata_json = json.dumps(metadata or {})
+        metadata_json = json_utils.dumps(metadata or {})
         now = datetime.now()
 
         # Default expires_at to 48 hours from now if file_id is provided
@@ -380,7 +381,7 @@ class ImageDatabaseService:
 
     def _row_to_record(self, row: sqlite3.Row) -> ImageRecord:
         """Convert database row to ImageRecord."""
-        metadata = json.loads(row["metadata"]) if row["metadata"] else {}
+        metadata = json_utils.loads(row["metadata"]) if row["metadata"] else {}
 
         # Parse timestamps
         created_at = datetime.fromisoformat(row["created_at"]) if row["created_at"] else None
@@ -3,13 +3,11 @@ Image storage and serving service for handling large generated images.
 Provides file-based storage with TTL cleanup and thumbnail generation.
 """
 
-import base64
 import builtins
 import contextlib
 from dataclasses import asdict, dataclass
 from datetime import datetime
 import io
-import json
 import logging
 import os
 from pathlib import Path
@@ -20,6 +18,8 @@ import uuid
 from PIL import Image as PILImage
 
 from ..config.settings import GeminiConfig
+from ..utils import json_utils
+from ..utils.base64_utils import b64encode_str
 
 
 @dataclass
@@ -78,8 +78,7 @@ class ImageStorageService:
             return {}
 
         try:
-            with open(self.metadata_file) as f:
-                data = json.load(f)
+            data = json_utils.loads(self.metadata_file.read_bytes())
 
             registry = {}
             for image_id, info_dict in data.items():
@@ -99,8 +98,9 @@ class ImageStorageService:
             for image_id, info in self.image_registry.items():
                 data[image_id] = asdict(info)
 
-            with open(self.metadata_file, "w") as f:
-                json.dump(data, f, indent=2)
+            # Prompts may be non-ASCII and the loader reads bytes as UTF-8, so
+            # never fall back to the locale encoding
+            self.metadata_file.write_text(json_utils.dumps(data, indent=True), encoding="utf-8")
 
         except Exception as e:
             self.logger.error(f"Failed to save image registry: {e}")
@@ -276,11 +276,15 @@ class ImageStorageService:
             self.logger.error(f"Failed to read image {image_id}: {e}")
             return None
 
+    def get_thumbnail_bytes(self, image_id: str) -> bytes | None:
+        """Get raw thumbnail bytes for inline embedding."""
+        return self.get_image_bytes(image_id, thumbnail=True)
+
     def get_thumbnail_base64(self, image_id: str) -> str | None:
         """Get thumbnail as base64 string for inline embedding."""
-        thumbnail_bytes = self.get_image_bytes(image_id, thumbnail=True)
+        thumbnail_bytes = self.get_thumbnail_bytes(image_id)
         if thumbnail_bytes:
-            return base64.b64encode(thumbnail_bytes).decode()
+            return b64encode_str(thumbnail_bytes)
         return None
 
     def list_images(self, include_expired: bool = False) -> list[StoredImageInfo]:
@@ -5,6 +5,9 @@ import logging
 from ..config.settings import ModelSelectionConfig, ModelTier
 from .base_image_service import BaseImageService
 
+# Strong quality indicators, weighted double on top of the configured keywords
+_STRONG_QUALITY_KEYWORDS = ("4k", "professional", "production", "high-res", "hd")
+
 
 class ModelSelector:
     """
@@ -33,6 +36,36 @@ class ModelSelector:
         self.pro_service = pro_service
         self.config = selection_config
         self.logger = logging.getLogger(__name__)
+        self._keyword_scores = self._build_keyword_scores(selection_config)
+
+    @staticmethod
+    def _build_keyword_scores(
+        selection_config: ModelSelectionConfig,
+    ) -> dict[str, tuple[int, int]]:
+        """
+        Merge the keyword lists into one table of per-keyword score deltas.
+
+        Keywords that appear in several lists (e.g. "4k" is both a configured
+        and a strong quality keyword) get a single entry carrying their
+        combined weight, so each distinct keyword is searched for only once.
+
+        Args:
+            selection_config: Selection strategy configuration
+
+        Returns:
+            Mapping of keyword to its (quality, speed) score contribution
+        """
+        scores: dict[str, tuple[int, int]] = {}
+        weighted_lists = (
+            (selection_config.auto_quality_keywords, 1, 0),
+            (selection_config.auto_speed_keywords, 0, 1),
+            (_STRONG_QUALITY_KEYWORDS, 2, 0),
+        )
+        for keywords, quality, speed in weighted_lists:
+            for keyword in keywords:
+                prev_quality, prev_speed = scores.get(keyword, (0, 0))
+                scores[keyword] = (prev_quality + quality, prev_speed + speed)
+        return scores
 
     def select_model(
         self,
@@ -96,22 +129,12 @@ class ModelSelector:
 
         prompt_lower = prompt.lower()
 
-        # Analyze prompt for quality indicators
-        quality_score = sum(
-            1 for keyword in self.config.auto_quality_keywords if keyword in prompt_lower
-        )
-
-        # Analyze prompt for speed indicators
-        speed_score = sum(
-            1 for keyword in self.config.auto_speed_keywords if keyword in prompt_lower
-        )
-
-        # Strong quality indicators (weighted heavily)
-        strong_quality_keywords = ["4k", "professional", "production", "high-res", "hd"]
-        strong_quality_matches = sum(
-            1 for keyword in strong_quality_keywords if keyword in prompt_lower
-        )
-        quality_score += strong_quality_matches * 2  # Double weight
+        # Analyze prompt for quality and speed indicators (strong quality
+        # keywords carry double weight)
+        for keyword, (quality, speed) in self._keyword_scores.items():
+            if keyword in prompt_lower:
+                quality_score += quality
+                speed_score += speed
 
         # Resolution parameter analysis
         resolution = kwargs.get("resolution", "").lower()
@@ -1,13 +1,66 @@
 """Gemini 3 Pro Image specialized service for high-quality generation."""
 
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any
 
 from ..config.settings import MediaResolution, ProImageConfig, ThinkingLevel
-from .base_image_service import BaseImageService
+from .base_image_service import BaseImageService, ImageMetadata
 from .gemini_client import GeminiClient
 from .image_storage_service import ImageStorageService
 
 
+def _pro_enhance(prompt: str, resolution: str) -> str:
+    """Apply Pro prompt enhancement rules.
+
+    Args:
+        prompt: Original prompt
+        resolution: Target resolution
+
+    Returns:
+        Enhanced prompt string
+    """
+    enhanced = prompt
+
+    # Pro model benefits from narrative prompts for short inputs
+    if len(prompt) < 50:
+        enhanced = (
+            f"Create a high-quality, detailed image: {prompt}. "
+            "Pay attention to composition, lighting, and fine details."
+        )
+
+    # Resolution hints for high-res outputs
+    if resolution in ("4k", "high", "2k"):
+        prompt_lower = prompt.lower()
+        if "text" in prompt_lower or "diagram" in prompt_lower:
+            enhanced += " Ensure text is sharp and clearly readable at high resolution."
+        if resolution == "4k":
+            enhanced += " Render at maximum 4K quality with exceptional detail."
+
+    return enhanced
+
+
+@dataclass(frozen=True, slots=True, kw_only=True, eq=False)
+class ProImageMetadata(ImageMetadata):
+    """Metadata for a Pro-generated image."""
+
+    model: str
+    model_tier: str = "pro"
+    response_index: int
+    image_index: int
+    resolution: str
+    thinking_level: str
+    media_resolution: str
+    grounding_enabled: bool
+    prompt: str
+    negative_prompt: str | None = None
+    system_instruction: str | None = None
+    aspect_ratio: str | None = None
+    mime_type: str
+    synthid_watermark: bool = True
+
+
 class ProImageService(BaseImageService):
     """Service for high-quality image generation using Gemini 3 Pro Image model.
 
@@ -68,6 +121,41 @@ class ProImageService(BaseImageService):
 
         return config
 
+    def _resolve_defaults(
+        self,
+        thinking_level: ThinkingLevel | None = None,
+        media_resolution: MediaResolution | None = None,
+        enable_grounding: bool | None = None,
+        **kwargs: Any,
+    ) -> Mapping[str, Any]:
+        """Resolve Pro metadata defaults once per request.
+
+        Args:
+            thinking_level: Reasoning depth requested
+            media_resolution: Vision processing detail level requested
+            enable_grounding: Whether grounding was requested
+            **kwargs: Additional parameters (ignored)
+
+        Returns:
+            Read-only mapping of resolved Pro metadata fields
+        """
+        level = thinking_level or self.pro_config.default_thinking_level
+        media_res = media_resolution or self.pro_config.default_media_resolution
+        grounding = (
+            enable_grounding
+            if enable_grounding is not None
+            else self.pro_config.enable_search_grounding
+        )
+
+        return MappingProxyType(
+            {
+                "thinking_level": level.value,
+                "media_resolution": media_res.value,
+                "grounding_enabled": grounding,
+                "mime_type": self._mime_type,
+            }
+        )
+
     def _build_metadata(
         self,
         prompt: str,
@@ -80,8 +168,9 @@ class ProImageService(BaseImageService):
         negative_prompt: str | None = None,
         system_instruction: str | None = None,
         aspect_ratio: str | None = None,
+        resolved: Mapping[str, Any] | None = None,
         **kwargs: Any,
-    ) -> dict[str, Any]:
+    ) -> ProImageMetadata:
         """Build metadata for Pro-generated image.
 
         Args:
@@ -95,37 +184,30 @@ class ProImageService(BaseImageService):
             negative_prompt: Optional negative prompt used
             system_instruction: Optional system instruction used
             aspect_ratio: Optional aspect ratio used
+            resolved: Precomputed defaults from `_resolve_defaults`
             **kwargs: Additional parameters (ignored)
 
         Returns:
-            Metadata dictionary with Pro-specific fields
+            Metadata record with Pro-specific fields
         """
-        # Apply defaults
-        level = thinking_level or self.pro_config.default_thinking_level
-        media_res = media_resolution or self.pro_config.default_media_resolution
-        grounding = (
-            enable_grounding
-            if enable_grounding is not None
-            else self.pro_config.enable_search_grounding
+        if resolved is None:
+            resolved = self._resolve_defaults(thinking_level, media_resolution, enable_grounding)
+
+        return ProImageMetadata(
+            model=self.pro_config.model_name,
+            response_index=response_index,
+            image_index=image_index,
+            resolution=resolution,
+            thinking_level=resolved["thinking_level"],
+            media_resolution=resolved["media_resolution"],
+            grounding_enabled=resolved["grounding_enabled"],
+            prompt=prompt,
+            negative_prompt=negative_prompt,
+            system_instruction=system_instruction,
+            aspect_ratio=aspect_ratio,
+            mime_type=resolved["mime_type"],
         )
 
-        return {
-            "model": self.pro_config.model_name,
-            "model_tier": "pro",
-            "response_index": response_index,
-            "image_index": image_index,
-            "resolution": resolution,
-            "thinking_level": level.value,
-            "media_resolution": media_res.value,
-            "grounding_enabled": grounding,
-            "prompt": prompt,
-            "negative_prompt": negative_prompt,
-            "system_instruction": system_instruction,
-            "aspect_ratio": aspect_ratio,
-            "mime_type": f"image/{self.config.default_image_format}",
-            "synthid_watermark": True,
-        }
-
     def _enhance_prompt(
         self,
         prompt: str,
@@ -149,20 +231,4 @@ class ProImageService(BaseImageService):
         Returns:
             Enhanced prompt string
         """
-        enhanced = prompt
-
-        # Pro model benefits from narrative prompts for short inputs
-        if len(prompt) < 50:
-            enhanced = (
-                f"Create a high-quality, detailed image: {prompt}. "
-                "Pay attention to composition, lighting, and fine details."
-            )
-
-        # Resolution hints for high-res outputs
-        if resolution in ["4k", "high", "2k"]:
-            if "text" in prompt.lower() or "diagram" in prompt.lower():
-                enhanced += " Ensure text is sharp and clearly readable at high resolution."
-            if resolution == "4k":
-                enhanced += " Render at maximum 4K quality with exceptional detail."
-
-        return enhanced
+        return _pro_enhance(prompt, resolution)
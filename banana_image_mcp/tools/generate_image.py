@@ -1,21 +1,45 @@
-import base64
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import logging
 import mimetypes
 import os
-from typing import Annotated, Literal
+from pathlib import Path
+import stat
+from typing import Annotated, Literal, TypeVar
 
 from fastmcp import Context, FastMCP
 from fastmcp.tools.tool import ToolResult
-from mcp.types import TextContent
+from mcp.types import ResourceLink, TextContent
 from pydantic import Field
 
+from .. import services
 from ..config.constants import MAX_INPUT_IMAGES
 from ..config.settings import ModelTier, ThinkingLevel
-from ..core.exceptions import ValidationError
+from ..core.exceptions import ErrorCode, ValidationError
 
+_T = TypeVar("_T")
 
-def register_generate_image_tool(server: FastMCP):
-    """Register the generate_image tool with the FastMCP server."""
+_VALID_MODES: frozenset[str] = frozenset({"auto", "generate", "edit"})
+
+_READ_CHUNK_SIZE = 65536
+
+
+def register_generate_image_tool(
+    server: FastMCP, text_summary: bool = True, inline_thumbnails: bool = True
+):
+    """Register the generate_image tool with the FastMCP server.
+
+    Args:
+        server: FastMCP server to register on
+        text_summary: Whether responses carry the full human-readable summary.
+            When False only a one-line status is returned as text, for clients
+            that consume ``structured_content`` alone.
+        inline_thumbnails: Whether thumbnails are embedded as image content.
+            When False each saved image is returned as a ``resource_link``
+            block instead, so the response carries no image bytes.
+    """
 
     @server.tool(
         annotations={
@@ -24,7 +48,7 @@ def register_generate_image_tool(server: FastMCP):
             "openWorldHint": True,
         }
     )
-    def generate_image(
+    async def generate_image(
         prompt: Annotated[
             str,
             Field(
@@ -124,18 +148,23 @@ def register_generate_image_tool(server: FastMCP):
         logger = logging.getLogger(__name__)
 
         try:
-            # 1. Collect input paths
-            input_image_paths = _collect_input_paths(
-                input_image_path_1, input_image_path_2, input_image_path_3
-            )
-
             logger.info(
-                f"Generate image request: prompt='{prompt[:50]}...', n={n}, "
-                f"paths={input_image_paths}, model_tier={model_tier}, aspect_ratio={aspect_ratio}"
+                "Generate image request: prompt='%.50s...', n=%d, paths=%s, "
+                "model_tier=%s, aspect_ratio=%s",
+                prompt,
+                n,
+                [input_image_path_1, input_image_path_2, input_image_path_3],
+                model_tier,
+                aspect_ratio,
             )
 
-            # 2. Validate inputs
-            _validate_inputs(mode, input_image_paths, file_id)
+            # 1-2. Collect and validate input paths, keeping each path's stat
+            input_image_stats = _collect_and_validate(
+                input_image_path_1, input_image_path_2, input_image_path_3, mode, file_id
+            )
+            input_image_paths = (
+                [path for path, _ in input_image_stats] if input_image_stats else None
+            )
 
             # 3. Detect mode
             detected_mode = _detect_mode(mode, file_id, input_image_paths)
@@ -145,7 +174,7 @@ def register_generate_image_tool(server: FastMCP):
                 if thinking_level:
                     _ = ThinkingLevel(thinking_level)
             except ValueError:
-                logger.warning(f"Invalid thinking_level '{thinking_level}', defaulting to HIGH")
+                logger.warning("Invalid thinking_level '%s', defaulting to HIGH", thinking_level)
                 thinking_level = "high"
 
             # 5. Select model
@@ -178,36 +207,49 @@ def register_generate_image_tool(server: FastMCP):
             # Get enhanced image service (would be injected in real implementation)
             enhanced_image_service = _get_enhanced_image_service()
 
+            # The service layer blocks on the Gemini client and disk I/O, so it
+            # runs on worker threads to keep the event loop free for other calls
+
             # Execute based on detected mode
             if detected_mode == "edit" and file_id:
                 # Edit by file_id following workflows.md sequence
-                logger.info(f"Edit mode: using file_id {file_id}")
-                thumbnail_images, metadata = enhanced_image_service.edit_image_by_file_id(
-                    file_id=file_id, edit_prompt=prompt
+                logger.info("Edit mode: using file_id %s", file_id)
+                thumbnail_images, metadata = await asyncio.to_thread(
+                    enhanced_image_service.edit_image_by_file_id,
+                    file_id=file_id,
+                    edit_prompt=prompt,
                 )
 
             elif detected_mode == "edit" and input_image_paths and len(input_image_paths) == 1:
                 # Edit by file path
-                logger.info(f"Edit mode: using file path {input_image_paths[0]}")
-                thumbnail_images, metadata = enhanced_image_service.edit_image_by_path(
-                    instruction=prompt, file_path=input_image_paths[0]
+                logger.info("Edit mode: using file path %s", input_image_paths[0])
+                thumbnail_images, metadata = await asyncio.to_thread(
+                    enhanced_image_service.edit_image_by_path,
+                    instruction=prompt,
+                    file_path=input_image_paths[0],
                 )
 
             else:
                 # Generation mode (with optional input images for conditioning)
                 logger.info("Generate mode: creating new images")
                 if aspect_ratio:
-                    logger.info(f"Using aspect ratio override: {aspect_ratio}")
+                    logger.info("Using aspect ratio override: %s", aspect_ratio)
 
                 # Prepare input images by reading from file paths
                 input_images = None
                 if input_image_paths:
-                    input_images = _load_input_images(input_image_paths, logger)
-                    logger.info(f"Loaded {len(input_images)} input images from file paths")
+                    input_images = await asyncio.to_thread(
+                        _load_input_images_raw,
+                        input_image_paths,
+                        logger,
+                        [st.st_size for _, st in input_image_stats],
+                    )
+                    logger.info("Loaded %d input images from file paths", len(input_images))
 
                 # Generate images following workflows.md pattern:
                 # M->G->FS->F->D (save full-res, create thumbnail, upload to Files API, track in DB)
-                thumbnail_images, metadata = enhanced_image_service.generate_images(
+                thumbnail_images, metadata = await asyncio.to_thread(
+                    enhanced_image_service.generate_images,
                     prompt=prompt,
                     n=n,
                     negative_prompt=negative_prompt,
@@ -219,27 +261,34 @@ def register_generate_image_tool(server: FastMCP):
 
             # Create response with file paths and thumbnails
             if metadata:
-                # Filter out any None entries from metadata (defensive programming)
-                metadata = [m for m in metadata if m is not None and isinstance(m, dict)]
+                # Filter out any None entries so the builders below see only dicts
+                metadata = [m for m in metadata if type(m) is dict]
 
                 if not metadata:
                     return _build_error_response(detected_mode, prompt)
 
                 # Build summary using helper function
-                full_summary = _build_summary(
-                    mode=detected_mode,
-                    metadata=metadata,
-                    model_info=model_info,
-                    selected_tier=selected_tier,
-                    thinking_level=thinking_level,
-                    resolution=resolution,
-                    enable_grounding=enable_grounding,
-                    file_id=file_id,
-                    input_paths=input_image_paths,
-                    aspect_ratio=aspect_ratio,
-                )
+                if text_summary:
+                    full_summary = _build_summary(
+                        mode=detected_mode,
+                        metadata=metadata,
+                        model_info=model_info,
+                        selected_tier=selected_tier,
+                        thinking_level=thinking_level,
+                        resolution=resolution,
+                        enable_grounding=enable_grounding,
+                        file_id=file_id,
+                        input_paths=input_image_paths,
+                        aspect_ratio=aspect_ratio,
+                        inline_thumbnails=inline_thumbnails,
+                    )
+                else:
+                    full_summary = _build_short_summary(detected_mode, metadata, model_info)
 
-                content = [TextContent(type="text", text=full_summary), *thumbnail_images]
+                previews = (
+                    thumbnail_images if inline_thumbnails else _build_resource_links(metadata)
+                )
+                content = [TextContent(type="text", text=full_summary), *previews]
             else:
                 # Fallback if no images generated
                 summary = "❌ No images were generated. Please check the logs for details."
@@ -267,24 +316,25 @@ def register_generate_image_tool(server: FastMCP):
 
             action_verb = "edited" if detected_mode == "edit" else "generated"
             logger.info(
-                f"Successfully {action_verb} {len(thumbnail_images)} images in {detected_mode} mode"
+                "Successfully %s %d images in %s mode",
+                action_verb,
+                len(thumbnail_images),
+                detected_mode,
             )
 
             return ToolResult(content=content, structured_content=structured_content)
 
         except ValidationError as e:
-            logger.error(f"Validation error in generate_image: {e}")
+            logger.error("Validation error in generate_image: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error in generate_image: {e}")
+            logger.error("Unexpected error in generate_image: %s", e)
             raise
 
 
 def _get_enhanced_image_service():
     """Get the enhanced image service instance."""
-    from ..services import get_enhanced_image_service
-
-    return get_enhanced_image_service()
+    return services.get_enhanced_image_service()
 
 
 # ============================================================================
@@ -292,44 +342,49 @@ def _get_enhanced_image_service():
 # ============================================================================
 
 
-def _collect_input_paths(
+def _collect_and_validate(
     path1: str | None,
     path2: str | None,
     path3: str | None,
-) -> list[str] | None:
-    """Collect non-None input image paths into a list.
+    mode: str,
+    file_id: str | None,
+) -> list[tuple[str, os.stat_result]] | None:
+    """Collect and validate input paths in a single pass.
+
+    Drops unset slots from the tool's fixed three path slots, and keeps each
+    path's stat so the loader can size its read without another ``fstat``.
 
     Args:
         path1: First optional path
         path2: Second optional path
         path3: Third optional path
-
-    Returns:
-        List of non-None paths, or None if all are None
-    """
-    paths = [p for p in [path1, path2, path3] if p]
-    return paths if paths else None
-
-
-def _validate_inputs(
-    mode: str,
-    input_paths: list[str] | None,
-    file_id: str | None,
-) -> None:
-    """Validate input parameters.
-
-    Args:
         mode: Operation mode
-        input_paths: List of input image paths
         file_id: Files API file ID
 
+    Returns:
+        List of (path, stat_result) tuples, or None if all paths are None
+
     Raises:
         ValidationError: If validation fails
     """
-    from ..core.exceptions import ErrorCode
+    _check_mode(mode)
 
-    # Validate mode
-    if mode not in ["auto", "generate", "edit"]:
+    slots = [(i, path) for i, path in enumerate((path1, path2, path3), 1) if path]
+    if len(slots) > MAX_INPUT_IMAGES:
+        raise ValidationError(
+            f"Maximum {MAX_INPUT_IMAGES} input images allowed",
+            error_code=ErrorCode.VALIDATION_FILE_COUNT_EXCEEDED,
+            field="input_image_paths",
+            value=len(slots),
+        )
+
+    inputs = [(path, _stat_input_path(i, path)) for i, path in slots]
+    return inputs if inputs else None
+
+
+def _check_mode(mode: str) -> None:
+    """Raise ValidationError unless ``mode`` is a known operation mode."""
+    if mode not in _VALID_MODES:
         raise ValidationError(
             "Mode must be 'auto', 'generate', or 'edit'",
             error_code=ErrorCode.VALIDATION_INVALID_MODE,
@@ -337,31 +392,39 @@ def _validate_inputs(
             value=mode,
         )
 
-    # Validate input paths
-    if input_paths:
-        if len(input_paths) > MAX_INPUT_IMAGES:
-            raise ValidationError(
-                f"Maximum {MAX_INPUT_IMAGES} input images allowed",
-                error_code=ErrorCode.VALIDATION_FILE_COUNT_EXCEEDED,
-                field="input_image_paths",
-                value=len(input_paths),
-            )
 
-        for i, path in enumerate(input_paths):
-            if not os.path.exists(path):
-                raise ValidationError(
-                    f"Input image {i + 1} not found: {path}",
-                    error_code=ErrorCode.FILE_NOT_FOUND,
-                    field=f"input_image_path_{i + 1}",
-                    value=path,
-                )
-            if not os.path.isfile(path):
-                raise ValidationError(
-                    f"Input image {i + 1} is not a file: {path}",
-                    error_code=ErrorCode.VALIDATION_INVALID_PATH,
-                    field=f"input_image_path_{i + 1}",
-                    value=path,
-                )
+def _stat_input_path(index: int, path: str) -> os.stat_result:
+    """Stat an input image path, requiring an existing regular file.
+
+    One stat covers both the existence and regular-file checks.
+
+    Args:
+        index: 1-based input slot, used in error messages
+        path: Input image path
+
+    Returns:
+        The path's stat result
+
+    Raises:
+        ValidationError: If the path is missing or not a regular file
+    """
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        raise ValidationError(
+            f"Input image {index} not found: {path}",
+            error_code=ErrorCode.FILE_NOT_FOUND,
+            field=f"input_image_path_{index}",
+            value=path,
+        ) from None
+    if not stat.S_ISREG(st.st_mode):
+        raise ValidationError(
+            f"Input image {index} is not a file: {path}",
+            error_code=ErrorCode.VALIDATION_INVALID_PATH,
+            field=f"input_image_path_{index}",
+            value=path,
+        )
+    return st
 
 
 def _detect_mode(
@@ -413,16 +476,14 @@ def _select_model(
     Returns:
         Tuple of (service, selected_tier, model_info)
     """
-    from ..services import get_model_selector
-
     # Parse model tier
     try:
         tier = ModelTier(model_tier) if model_tier else ModelTier.AUTO
     except ValueError:
-        logger.warning(f"Invalid model_tier '{model_tier}', defaulting to AUTO")
+        logger.warning("Invalid model_tier '%s', defaulting to AUTO", model_tier)
         tier = ModelTier.AUTO
 
-    model_selector = get_model_selector()
+    model_selector = services.get_model_selector()
 
     selected_service, selected_tier = model_selector.select_model(
         prompt=prompt,
@@ -436,45 +497,65 @@ def _select_model(
 
     model_info = model_selector.get_model_info(selected_tier)
     logger.info(
-        f"Selected {model_info['emoji']} {model_info['name']} "
-        f"({selected_tier.value}) for this request"
+        "Selected %s %s (%s) for this request",
+        model_info["emoji"],
+        model_info["name"],
+        selected_tier.value,
     )
 
     return selected_service, selected_tier, model_info
 
 
-def _load_input_images(
-    paths: list[str],
-    logger: logging.Logger,
-) -> list[tuple[str, str]]:
-    """Load input images from file paths.
+@lru_cache(maxsize=32)
+def _ext_to_mime(ext: str) -> str:
+    """Map a file extension to an image MIME type, defaulting to PNG."""
+    # Load the system MIME database on first use, as guess_type would; an
+    # earlier init() by the host application is left untouched
+    if not mimetypes.inited:
+        mimetypes.init()
+    mime_type = mimetypes.types_map.get(ext.lower())
+    if not mime_type or not mime_type.startswith("image/"):
+        return "image/png"
+    return mime_type
 
-    Args:
-        paths: List of file paths
-        logger: Logger instance
 
-    Returns:
-        List of (base64_data, mime_type) tuples
+def _read_file_bytes(path: str, size_hint: int = -1) -> bytes:
+    """Read a whole file.
 
-    Raises:
-        ValidationError: If loading fails
+    With a ``size_hint`` from an earlier stat the file is read with plain
+    ``os.read`` calls and no ``fstat``; a file that grew since is still read
+    to the end.
     """
-    from ..core.exceptions import ErrorCode
-
-    images = []
-    for path in paths:
-        try:
-            with open(path, "rb") as f:
-                image_bytes = f.read()
+    if size_hint < 0:
+        with open(path, "rb", buffering=0) as f:
+            return f.read()
 
-            mime_type, _ = mimetypes.guess_type(path)
-            if not mime_type or not mime_type.startswith("image/"):
-                mime_type = "image/png"
-
-            base64_data = base64.b64encode(image_bytes).decode("utf-8")
-            images.append((base64_data, mime_type))
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, size_hint + 1)
+        if len(data) <= size_hint:
+            return data
+        chunks = [data]
+        while chunk := os.read(fd, _READ_CHUNK_SIZE):
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _load_paths(
+    paths: list[str],
+    logger: logging.Logger,
+    read: Callable[[str], _T],
+) -> list[tuple[_T, str]]:
+    """Load each path with ``read`` and pair the result with its MIME type."""
 
-            logger.debug(f"Loaded input image: {path} ({mime_type})")
+    def _load_one(path: str) -> tuple[_T, str]:
+        try:
+            mime_type = _ext_to_mime(os.path.splitext(path)[1])
+            data = read(path)
+            logger.debug("Loaded input image: %s (%s)", path, mime_type)
+            return data, mime_type
 
         except Exception as e:
             raise ValidationError(
@@ -485,7 +566,40 @@ def _load_input_images(
                 cause=e,
             ) from e
 
-    return images
+    if len(paths) <= 1:
+        return [_load_one(path) for path in paths]
+
+    # File reads release the GIL, so load in parallel
+    with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+        return list(executor.map(_load_one, paths))
+
+
+def _load_input_images_raw(
+    paths: list[str],
+    logger: logging.Logger,
+    sizes: list[int] | None = None,
+) -> list[tuple[bytes, str]]:
+    """Load input images from file paths as raw bytes.
+
+    The Gemini client builds parts with ``Part.from_bytes``, so callers that
+    hand images straight to it can skip the base64 round trip entirely.
+
+    Args:
+        paths: List of file paths
+        logger: Logger instance
+        sizes: Optional file sizes from a prior stat, parallel to ``paths``
+
+    Returns:
+        List of (raw_bytes, mime_type) tuples
+
+    Raises:
+        ValidationError: If loading fails
+    """
+    if sizes is None:
+        return _load_paths(paths, logger, _read_file_bytes)
+
+    size_by_path = dict(zip(paths, sizes, strict=True))
+    return _load_paths(paths, logger, lambda path: _read_file_bytes(path, size_by_path[path]))
 
 
 def _build_summary(
@@ -499,12 +613,13 @@ def _build_summary(
     file_id: str | None,
     input_paths: list[str] | None,
     aspect_ratio: str | None,
+    inline_thumbnails: bool = True,
 ) -> str:
     """Build summary text for response.
 
     Args:
         mode: Operation mode
-        metadata: List of image metadata
+        metadata: List of image metadata dicts (None entries already removed)
         model_info: Model information dict
         selected_tier: Selected model tier
         thinking_level: Thinking level used
@@ -513,6 +628,7 @@ def _build_summary(
         file_id: Source file ID (for edits)
         input_paths: Input image paths
         aspect_ratio: Aspect ratio used
+        inline_thumbnails: Whether thumbnails follow as image content
 
     Returns:
         Summary text string
@@ -552,30 +668,79 @@ def _build_summary(
     lines.append(f"\n📁 **{result_label}:**")
 
     for i, meta in enumerate(metadata, 1):
-        if not meta or not isinstance(meta, dict):
-            lines.append(f"  {i}. ❌ Invalid metadata entry")
-            continue
-
-        size_bytes = meta.get("size_bytes", 0)
-        size_mb = round(size_bytes / (1024 * 1024), 1) if size_bytes else 0
+        size_mb = meta.get("size_mb")
+        if size_mb is None:
+            # Metadata from producers that don't precompute the rounded size
+            size_bytes = meta.get("size_bytes", 0)
+            size_mb = round(size_bytes / (1024 * 1024), 1) if size_bytes else 0
         full_path = meta.get("full_path", "Unknown path")
         width = meta.get("width", "?")
         height = meta.get("height", "?")
 
-        extra_info = ""
+        extra_parts: list[str] = []
         if mode == "edit":
-            files_api_info = meta.get("files_api") or {}
-            if files_api_info.get("name"):
-                extra_info += f" • 🌐 Files API: {files_api_info['name']}"
-            if meta.get("parent_file_id"):
-                extra_info += f" • 👨‍👩‍👧 Parent: {meta.get('parent_file_id')}"
-
-        lines.append(f"  {i}. `{full_path}`\n     📏 {width}x{height} • 💾 {size_mb}MB{extra_info}")
+            files_api_name = (meta.get("files_api") or {}).get("name")
+            if files_api_name:
+                extra_parts.append(f" • 🌐 Files API: {files_api_name}")
+            parent_file_id = meta.get("parent_file_id")
+            if parent_file_id:
+                extra_parts.append(f" • 👨‍👩‍👧 Parent: {parent_file_id}")
+
+        lines.extend(
+            (
+                f"  {i}. `{full_path}`",
+                f"     📏 {width}x{height} • 💾 {size_mb}MB{''.join(extra_parts)}",
+            )
+        )
 
-    lines.append("\n🖼️ **Thumbnail previews shown below** (actual images saved to disk)")
+    if inline_thumbnails:
+        lines.append("\n🖼️ **Thumbnail previews shown below** (actual images saved to disk)")
+    else:
+        lines.append("\n🔗 **Image links below** (actual images saved to disk)")
     return "\n".join(lines)
 
 
+def _build_short_summary(mode: str, metadata: list[dict], model_info: dict) -> str:
+    """Build the one-line status used when the full text summary is disabled.
+
+    Args:
+        mode: Operation mode
+        metadata: List of image metadata dicts
+        model_info: Model information dict
+
+    Returns:
+        Summary text string
+    """
+    action_verb = "Edited" if mode == "edit" else "Generated"
+    return f"✅ {action_verb} {len(metadata)} image(s) with {model_info['name']}."
+
+
+def _build_resource_links(metadata: list[dict]) -> list[ResourceLink]:
+    """Build ``resource_link`` blocks pointing at the saved full-size images.
+
+    Args:
+        metadata: List of image metadata dicts
+
+    Returns:
+        One link per entry that has a ``full_path``
+    """
+    links = []
+    for meta in metadata:
+        full_path = meta.get("full_path")
+        if not full_path:
+            continue
+        links.append(
+            ResourceLink(
+                type="resource_link",
+                uri=Path(full_path).as_uri(),
+                name=os.path.basename(full_path),
+                mimeType=_ext_to_mime(os.path.splitext(full_path)[1]),
+                size=meta.get("size_bytes"),
+            )
+        )
+    return links
+
+
 def _build_structured_content(
     mode: str,
     metadata: list[dict],
@@ -599,6 +764,23 @@ def _build_structured_content(
     Returns:
         Structured content dictionary
     """
+    # Collect the per-image fields in a single pass over the metadata
+    file_paths: list[str] = []
+    files_api_ids: list[str] = []
+    parent_relationships: list[tuple[str | None, str | None]] = []
+    total_size = 0
+    is_edit = mode == "edit"
+    for m in metadata:
+        full_path = m.get("full_path")
+        if full_path:
+            file_paths.append(full_path)
+        files_api_name = (m.get("files_api") or {}).get("name")
+        if files_api_name:
+            files_api_ids.append(files_api_name)
+        if is_edit:
+            parent_relationships.append((m.get("parent_file_id"), files_api_name))
+        total_size += m.get("size_bytes", 0)
+
     return {
         "mode": mode,
         "model_tier": selected_tier.value,
@@ -622,29 +804,10 @@ def _build_structured_content(
         "output_method": "file_system_with_files_api",
         "workflow": f"workflows.md_{mode}_sequence",
         "images": metadata,
-        "file_paths": [
-            m.get("full_path") for m in metadata if m and isinstance(m, dict) and m.get("full_path")
-        ],
-        "files_api_ids": [
-            m.get("files_api", {}).get("name")
-            for m in metadata
-            if m
-            and isinstance(m, dict)
-            and m.get("files_api", {})
-            and m.get("files_api", {}).get("name")
-        ],
-        "parent_relationships": [
-            (m.get("parent_file_id"), m.get("files_api", {}).get("name"))
-            for m in metadata
-            if m and isinstance(m, dict)
-        ]
-        if mode == "edit"
-        else [],
-        "total_size_mb": round(
-            sum(m.get("size_bytes", 0) for m in metadata if m and isinstance(m, dict))
-            / (1024 * 1024),
-            2,
-        ),
+        "file_paths": file_paths,
+        "files_api_ids": files_api_ids,
+        "parent_relationships": parent_relationships,
+        "total_size_mb": round(total_size / (1024 * 1024), 2),
     }
 
 
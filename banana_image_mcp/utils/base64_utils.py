@@ -0,0 +1,24 @@
+"""Base64 helpers backed by pybase64 when it is installed.
+
+pybase64 wraps a SIMD (AVX2/AVX-512/NEON) codec and is a drop-in
+replacement for the stdlib ``base64`` functions used here. Install the
+``speed`` extra to enable it; otherwise the stdlib module is used.
+"""
+
+try:
+    import pybase64 as _base64
+except ImportError:  # pragma: no cover - optional dependency
+    import base64 as _base64
+
+b64encode = _base64.b64encode
+b64decode = _base64.b64decode
+
+# pybase64 can produce the str directly, skipping the intermediate bytes object
+_b64encode_as_string = getattr(_base64, "b64encode_as_string", None)
+
+
+def b64encode_str(data: bytes) -> str:
+    """Encode bytes to a base64 ASCII string."""
+    if _b64encode_as_string is not None:
+        return _b64encode_as_string(data)
+    return b64encode(data).decode("ascii")
@@ -1,13 +1,16 @@
-import base64
+from functools import cache, lru_cache
 from io import BytesIO
 import logging
+from typing import Any
 
 from PIL import Image
 
 from ..config.constants import SUPPORTED_IMAGE_TYPES
 from ..core.exceptions import ImageProcessingError, ValidationError
+from .base64_utils import b64decode, b64encode_str
 
 
+@lru_cache(maxsize=32)
 def validate_image_format(mime_type: str) -> bool:
     """Validate that the MIME type is supported."""
     return mime_type.lower() in SUPPORTED_IMAGE_TYPES
@@ -16,7 +19,7 @@ def validate_image_format(mime_type: str) -> bool:
 def get_image_dimensions(image_b64: str) -> tuple[int, int]:
     """Get image dimensions from base64 data."""
     try:
-        image_data = base64.b64decode(image_b64)
+        image_data = b64decode(image_b64)
         image = Image.open(BytesIO(image_data))
         return image.size
     except Exception as e:
@@ -27,7 +30,7 @@ def get_image_dimensions(image_b64: str) -> tuple[int, int]:
 def get_image_info(image_b64: str) -> dict:
     """Get comprehensive image information from base64 data."""
     try:
-        image_data = base64.b64decode(image_b64)
+        image_data = b64decode(image_b64)
         image = Image.open(BytesIO(image_data))
 
         return {
@@ -46,13 +49,64 @@ def get_image_info(image_b64: str) -> dict:
         raise ValidationError(f"Invalid image data: {e}")
 
 
-def optimize_image_size(image_b64: str, max_size: int = 20 * 1024 * 1024) -> str:
-    """Optimize image size if it exceeds the maximum limit."""
+@cache
+def _get_turbojpeg() -> Any | None:
+    """Load the libjpeg-turbo encoder if PyTurboJPEG and its library are installed."""
     try:
-        image_data = base64.b64decode(image_b64)
+        from turbojpeg import TurboJPEG
+
+        return TurboJPEG()
+    except (ImportError, OSError, RuntimeError):
+        return None
+
+
+@cache
+def _get_oxipng() -> Any | None:
+    """Load the pyoxipng bindings if installed."""
+    try:
+        import oxipng
+
+        return oxipng
+    except ImportError:
+        return None
+
+
+def _recompress_jpeg(image: Image.Image, quality: int = 85) -> bytes:
+    """Encode an image as JPEG, calling libjpeg-turbo directly when available."""
+    encoder = _get_turbojpeg()
+    if encoder is not None:
+        import numpy as np
+        from turbojpeg import TJPF_RGB, TJSAMP_420
+
+        pixels = np.asarray(image.convert("RGB"))
+        return encoder.encode(
+            pixels, quality=quality, pixel_format=TJPF_RGB, jpeg_subsample=TJSAMP_420
+        )
+
+    output = BytesIO()
+    image.save(output, format="JPEG", quality=quality, optimize=True)
+    return output.getvalue()
+
+
+def _recompress_png(image: Image.Image) -> bytes:
+    """Encode an image as PNG, using oxipng for the optimization pass when available."""
+    oxipng = _get_oxipng()
+
+    output = BytesIO()
+    if oxipng is None:
+        image.save(output, format="PNG", optimize=True)
+        return output.getvalue()
+
+    # Fast zlib pass, then let oxipng do the (SIMD-accelerated) optimization
+    image.save(output, format="PNG", compress_level=1)
+    return oxipng.optimize_from_memory(output.getvalue(), level=2)
 
+
+def optimize_image_bytes(image_data: bytes, max_size: int = 20 * 1024 * 1024) -> bytes:
+    """Optimize raw image bytes if they exceed the maximum limit."""
+    try:
         if len(image_data) <= max_size:
-            return image_b64
+            return image_data
 
         # Implement basic compression by reducing quality/size
         image = Image.open(BytesIO(image_data))
@@ -62,18 +116,19 @@ def optimize_image_size(image_b64: str, max_size: int = 20 * 1024 * 1024) -> str
         new_width = int(image.width * scale_factor)
         new_height = int(image.height * scale_factor)
 
-        # Resize image
-        resized_image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        # Let the JPEG decoder downscale via DCT scaling (never below the target
+        # size), then resize with a cheap box reduction ahead of the LANCZOS pass
+        if image.format == "JPEG":
+            image.draft(image.mode, (new_width, new_height))
+        resized_image = image.resize(
+            (new_width, new_height), Image.Resampling.LANCZOS, reducing_gap=3.0
+        )
 
         # Save with compression
-        output = BytesIO()
         if image.format == "JPEG":
-            resized_image.save(output, format="JPEG", quality=85, optimize=True)
+            optimized_data = _recompress_jpeg(resized_image, quality=85)
         else:
-            resized_image.save(output, format="PNG", optimize=True)
-
-        output.seek(0)
-        optimized_data = output.read()
+            optimized_data = _recompress_png(resized_image)
 
         # If still too large, raise error
         if len(optimized_data) > max_size:
@@ -81,17 +136,34 @@ def optimize_image_size(image_b64: str, max_size: int = 20 * 1024 * 1024) -> str
                 f"Image size {len(optimized_data)} still exceeds maximum {max_size} after optimization"
             )
 
-        return base64.b64encode(optimized_data).decode()
+        return optimized_data
+
+    except Exception as e:
+        logging.error(f"Failed to optimize image size: {e}")
+        raise ImageProcessingError(f"Image optimization failed: {e}") from e
+
+
+def optimize_image_size(image_b64: str, max_size: int = 20 * 1024 * 1024) -> str:
+    """Optimize image size if it exceeds the maximum limit.
 
+    Base64 wrapper around `optimize_image_bytes`.
+    """
+    try:
+        image_data = b64decode(image_b64)
     except Exception as e:
         logging.error(f"Failed to optimize image size: {e}")
-        raise ImageProcessingError(f"Image optimization failed: {e}")
+        raise ImageProcessingError(f"Image optimization failed: {e}") from e
+
+    optimized_data = optimize_image_bytes(image_data, max_size)
+    if optimized_data is image_data:
+        return image_b64
+    return b64encode_str(optimized_data)
 
 
 def convert_image_format(image_b64: str, target_format: str = "PNG") -> str:
     """Convert image to specified format."""
     try:
-        image_data = base64.b64decode(image_b64)
+        image_data = b64decode(image_b64)
         image = Image.open(BytesIO(image_data))
 
         # Handle transparency for JPEG conversion
@@ -106,9 +178,7 @@ def convert_image_format(image_b64: str, target_format: str = "PNG") -> str:
 
         output = BytesIO()
         image.save(output, format=target_format.upper())
-        output.seek(0)
-
-        return base64.b64encode(output.read()).decode()
+        return b64encode_str(output.getvalue())
 
     except Exception as e:
         logging.error(f"Failed to convert image format: {e}")
@@ -151,7 +221,7 @@ def create_thumbnail(source_path: str, thumb_path: str, size: int = 256) -> None
 def create_thumbnail_base64(image_b64: str, size: tuple[int, int] = (256, 256)) -> str:
     """Create a thumbnail from base64 image data."""
     try:
-        image_data = base64.b64decode(image_b64)
+        image_data = b64decode(image_b64)
         image = Image.open(BytesIO(image_data))
 
         # Create thumbnail maintaining aspect ratio
@@ -160,9 +230,7 @@ def create_thumbnail_base64(image_b64: str, size: tuple[int, int] = (256, 256))
         output = BytesIO()
         # Use PNG for thumbnails to preserve quality
         image.save(output, format="PNG", optimize=True)
-        output.seek(0)
-
-        return base64.b64encode(output.read()).decode()
+        return b64encode_str(output.getvalue())
 
     except Exception as e:
         logging.error(f"Failed to create thumbnail: {e}")
@@ -172,8 +240,8 @@ def create_thumbnail_base64(image_b64: str, size: tuple[int, int] = (256, 256))
 def estimate_compression_ratio(original_b64: str, compressed_b64: str) -> float:
     """Estimate compression ratio between original and compressed images."""
     try:
-        original_size = len(base64.b64decode(original_b64))
-        compressed_size = len(base64.b64decode(compressed_b64))
+        original_size = len(b64decode(original_b64))
+        compressed_size = len(b64decode(compressed_b64))
 
         return compressed_size / original_size if original_size > 0 else 1.0
 
@@ -185,7 +253,7 @@ def estimate_compression_ratio(original_b64: str, compressed_b64: str) -> float:
 def validate_image_content(image_b64: str, mime_type: str) -> bool:
     """Validate that image content matches the declared MIME type."""
     try:
-        image_data = base64.b64decode(image_b64)
+        image_data = b64decode(image_b64)
         image = Image.open(BytesIO(image_data))
 
         # Map PIL formats to MIME types
@@ -207,7 +275,7 @@ def validate_image_content(image_b64: str, mime_type: str) -> bool:
 def detect_image_type(image_b64: str) -> str | None:
     """Detect the actual image type from base64 data."""
     try:
-        image_data = base64.b64decode(image_b64)
+        image_data = b64decode(image_b64)
         image = Image.open(BytesIO(image_data))
 
         # Map PIL formats to MIME types
@@ -0,0 +1,28 @@
+"""JSON helpers backed by orjson when it is installed.
+
+orjson serializes the plain dict/list/str/number shapes used for image
+metadata several times faster than the stdlib encoder. Install the ``speed``
+extra to enable it; otherwise the stdlib ``json`` module is used.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:
+    """Serialize ``obj`` to a JSON string, indenting by two spaces if requested."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def loads(data: str | bytes) -> Any:
+    """Deserialize a JSON document."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,8 +1,9 @@
 from datetime import datetime
-import json
 import logging
 import sys
 
+from .json_utils import dumps
+
 
 def setup_logging(level: str = "INFO", format_type: str = "standard") -> None:
     """
@@ -93,7 +94,7 @@ class JSONFormatter(logging.Formatter):
             ):
                 log_entry[key] = value
 
-        return json.dumps(log_entry)
+        return dumps(log_entry)
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -5,6 +5,8 @@ Build script for Banana Image MCP Server.
 This script builds the distribution packages for PyPI upload using uv.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+import os
 from pathlib import Path
 import shutil
 import subprocess
@@ -26,20 +28,15 @@ def run_command(cmd: list[str], description: str, capture_output: bool = True) -
 def clean_build_artifacts(root_dir: Path) -> None:
     """Clean previous build artifacts."""
 
-    # Directories to clean
-    dirs_to_clean = [root_dir / "dist", root_dir / "build", root_dir / "*.egg-info"]
-
-    for path in dirs_to_clean:
-        if path.exists():
-            if path.is_dir():
-                shutil.rmtree(path)
+    # One directory scan; scandir entries carry their stat results
+    with os.scandir(root_dir) as entries:
+        for entry in entries:
+            if entry.name not in ("dist", "build") and not entry.name.endswith(".egg-info"):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
             else:
-                path.unlink()
-
-    # Also clean any .egg-info directories with glob
-    for egg_info in root_dir.glob("*.egg-info"):
-        if egg_info.is_dir():
-            shutil.rmtree(egg_info)
+                os.unlink(entry.path)
 
 
 def check_uv_available() -> bool:
@@ -87,21 +84,28 @@ def main():
     root_dir = Path(__file__).parent.parent
 
     # Change to project root
-    import os
-
     os.chdir(root_dir)
 
-    # Verify configuration
+    # Verify configuration before anything can rewrite pyproject.toml
     verify_package_config(root_dir)
 
-    # Install build dependencies
-    install_build_deps(root_dir)
+    # Probe/install build dependencies on a worker thread (it mostly waits on
+    # subprocesses) while cleaning old builds
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        deps_check = executor.submit(install_build_deps, root_dir)
+
+        clean_build_artifacts(root_dir)
 
-    # Clean previous builds
-    clean_build_artifacts(root_dir)
+        # result() re-raises any SystemExit from a failed install
+        deps_check.result()
 
     # Build the package
-    run_command(["uv", "run", "python", "-m", "build"], "Building source and wheel distributions")
+    # Stream the build log straight to the terminal instead of buffering it
+    run_command(
+        ["uv", "run", "python", "-m", "build"],
+        "Building source and wheel distributions",
+        capture_output=False,
+    )
 
     # List created files with details
     dist_dir = root_dir / "dist"
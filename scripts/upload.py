@@ -10,6 +10,9 @@ import os
 from pathlib import Path
 import subprocess
 import sys
+import tomllib
+
+_MAX_PYPIRC_SIZE = 1_000_000  # bytes
 
 
 def run_command(cmd: list[str], description: str, capture_output: bool = True) -> str | None:
@@ -54,27 +57,38 @@ def check_dist_files(root_dir: Path) -> list[Path]:
     if not dist_dir.exists():
         return []
 
-    dist_files = list(dist_dir.glob("*.tar.gz")) + list(dist_dir.glob("*.whl"))
+    # One directory scan; DirEntry.stat() reuses the scan's cached result
+    with os.scandir(dist_dir) as entries:
+        dist_entries = [
+            (Path(e.path), e.stat().st_size)
+            for e in entries
+            if e.name.endswith((".tar.gz", ".whl"))
+        ]
 
-    if not dist_files:
+    if not dist_entries:
         return []
 
-    for file in dist_files:
-        file.stat().st_size / 1024
+    for _file, size in dist_entries:
+        size / 1024
 
-    return dist_files
+    return [file for file, _size in dist_entries]
 
 
 def check_pypirc() -> tuple[bool, bool]:
     """Check if .pypirc is configured."""
     pypirc_path = Path.home() / ".pypirc"
 
-    if not pypirc_path.exists():
+    # One stat covers existence and guards against reading a huge bogus file
+    try:
+        if pypirc_path.stat().st_size > _MAX_PYPIRC_SIZE:
+            return False, False
+        content = pypirc_path.read_bytes()
+    except OSError:
         return False, False
 
-    content = pypirc_path.read_text()
-    has_testpypi = "[testpypi]" in content
-    has_pypi = "[pypi]" in content
+    # Section headers are ASCII, so search the raw bytes without decoding
+    has_testpypi = b"[testpypi]" in content
+    has_pypi = b"[pypi]" in content
 
     return has_testpypi, has_pypi
 
@@ -91,16 +105,12 @@ def get_package_version(root_dir: Path) -> str | None:
         return None
 
     try:
-        content = pyproject_path.read_text()
-        for line in content.split("\n"):
-            if line.strip().startswith("version = "):
-                # Extract version from 'version = "0.1.0"'
-                version = line.split("=")[1].strip().strip("\"'")
-                return version
-    except Exception:
-        pass
+        with pyproject_path.open("rb") as f:
+            data = tomllib.load(f)
+    except (OSError, tomllib.TOMLDecodeError):
+        return None
 
-    return None
+    return data.get("project", {}).get("version")
 
 
 def upload_to_repository(repository: str, dist_files: list[Path]) -> bool:
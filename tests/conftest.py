@@ -7,38 +7,55 @@ used across the test suite.
 Requirements: 6.1, 6.2, 6.3, 6.4
 """
 
+from __future__ import annotations
+
+import base64
+from functools import cache, partial
 import io
+import os
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, Mock
 
-from PIL import Image as PILImage
+from hypothesis import settings
 import pytest
 
-from banana_image_mcp.config.settings import (
-    FlashImageConfig,
-    GeminiConfig,
-    MediaResolution,
-    ProImageConfig,
-    ServerConfig,
-    ThinkingLevel,
-)
-from banana_image_mcp.services.gemini_client import GeminiClient
-from banana_image_mcp.services.image_storage_service import (
-    ImageStorageService,
-    StoredImageInfo,
-)
+# PIL and the package modules are imported inside the fixtures that use
+# them so that collecting tests which never touch those fixtures stays cheap.
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from banana_image_mcp.config.settings import (
+        FlashImageConfig,
+        GeminiConfig,
+        ProImageConfig,
+        ServerConfig,
+    )
+    from banana_image_mcp.services.image_storage_service import StoredImageInfo
+
+# Hypothesis profiles, selected with HYPOTHESIS_PROFILE or --hypothesis-profile:
+# "dev" for quick local runs (default), "ci" for the workflow, "nightly" for
+# an occasional deep sweep. The ci profile is derandomized so every run draws
+# the same examples (which also disables the example database there)
+settings.register_profile("dev", max_examples=20, deadline=None)
+settings.register_profile("ci", max_examples=100, deadline=None, derandomize=True, print_blob=False)
+settings.register_profile("nightly", max_examples=500, deadline=None)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "dev"))
 
 # =============================================================================
 # Configuration Fixtures (Requirements 6.1)
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_server_config() -> ServerConfig:
     """Create a mock ServerConfig for testing.
 
     Returns:
         ServerConfig with test API key and default settings.
     """
+    from banana_image_mcp.config.settings import ServerConfig
+
     return ServerConfig(
         gemini_api_key="test-api-key-12345",
         server_name="test-banana-server",
@@ -58,6 +75,8 @@ def mock_gemini_config() -> GeminiConfig:
     Returns:
         GeminiConfig with default settings.
     """
+    from banana_image_mcp.config.settings import GeminiConfig
+
     return GeminiConfig(
         model_name="gemini-2.5-flash-image",
         max_images_per_request=4,
@@ -67,13 +86,15 @@ def mock_gemini_config() -> GeminiConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_flash_config() -> FlashImageConfig:
     """Create a mock FlashImageConfig for testing.
 
     Returns:
         FlashImageConfig with default Flash model settings.
     """
+    from banana_image_mcp.config.settings import FlashImageConfig
+
     return FlashImageConfig(
         model_name="gemini-2.5-flash-image",
         max_images_per_request=4,
@@ -87,13 +108,19 @@ def mock_flash_config() -> FlashImageConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_pro_config() -> ProImageConfig:
     """Create a mock ProImageConfig for testing.
 
     Returns:
         ProImageConfig with default Pro model settings.
     """
+    from banana_image_mcp.config.settings import (
+        MediaResolution,
+        ProImageConfig,
+        ThinkingLevel,
+    )
+
     return ProImageConfig(
         model_name="gemini-3-pro-image-preview",
         max_images_per_request=4,
@@ -117,13 +144,16 @@ def mock_pro_config() -> ProImageConfig:
 
 
 @pytest.fixture
-def mock_gemini_client(mock_server_config: ServerConfig, mock_gemini_config: GeminiConfig) -> Mock:
+def mock_gemini_client(
+    mock_server_config: ServerConfig, mock_gemini_config: GeminiConfig
+) -> SimpleNamespace:
     """Create a mock GeminiClient for testing.
 
     The mock client has:
     - Mocked internal _client attribute
     - Mocked models attribute for generate_content
-    - Mocked create_image_parts method
+    - Mocked generate_content_stream yielding a single chunk
+    - Mocked create_image_parts and create_image_part methods
     - Mocked extract_images method
 
     Args:
@@ -131,9 +161,9 @@ def mock_gemini_client(mock_server_config: ServerConfig, mock_gemini_config: Gem
         mock_gemini_config: Gemini configuration fixture.
 
     Returns:
-        Mock GeminiClient with pre-configured mock methods.
+        Stand-in GeminiClient whose methods are pre-configured mocks.
     """
-    client = Mock(spec=GeminiClient)
+    client = SimpleNamespace()
 
     # Mock the internal client
     client._client = MagicMock()
@@ -144,8 +174,9 @@ def mock_gemini_client(mock_server_config: ServerConfig, mock_gemini_config: Gem
     client.config = mock_server_config
     client.gemini_config = mock_gemini_config
 
-    # Mock create_image_parts to return empty list by default
+    # Mock image part creation (empty list / placeholder part by default)
     client.create_image_parts = Mock(return_value=[])
+    client.create_image_part = Mock(return_value=MagicMock())
 
     # Mock extract_images to return sample image bytes
     client.extract_images = Mock(return_value=[b"fake_image_bytes"])
@@ -156,56 +187,110 @@ def mock_gemini_client(mock_server_config: ServerConfig, mock_gemini_config: Gem
     mock_response.candidates[0].content = MagicMock()
     mock_response.candidates[0].content.parts = []
     client.generate_content = Mock(return_value=mock_response)
+    client.generate_content_stream = Mock(side_effect=lambda *args, **kwargs: iter([mock_response]))
 
     return client
 
 
-@pytest.fixture
-def mock_flash_gemini_client(
+def _build_mock_flash_gemini_client(
+    server_config: ServerConfig, flash_config: FlashImageConfig
+) -> SimpleNamespace:
+    """Build a stand-in GeminiClient configured for the Flash model."""
+    client = SimpleNamespace()
+    client._client = MagicMock()
+    client._client.models = MagicMock()
+    client.config = server_config
+    client.gemini_config = flash_config
+    client.create_image_parts = Mock(return_value=[])
+    client.create_image_part = Mock(return_value=MagicMock())
+    client.extract_images = Mock(return_value=[b"flash_image_bytes"])
+    client.generate_content = Mock(return_value=MagicMock())
+    client.generate_content_stream = Mock(side_effect=lambda *args, **kwargs: iter([MagicMock()]))
+    return client
+
+
+@pytest.fixture(scope="session")
+def mock_flash_gemini_client_factory(
     mock_server_config: ServerConfig, mock_flash_config: FlashImageConfig
-) -> Mock:
-    """Create a mock GeminiClient configured for Flash model.
+) -> Callable[[], SimpleNamespace]:
+    """Provide a builder for fresh Flash mock GeminiClient instances.
+
+    Like ``mock_storage_service_factory``, for fixtures scoped wider than
+    ``function``; they are responsible for resetting the mock between tests.
 
     Args:
         mock_server_config: Server configuration fixture.
         mock_flash_config: Flash model configuration fixture.
 
+    Returns:
+        Zero-argument callable returning a new Flash mock client.
+    """
+    return partial(_build_mock_flash_gemini_client, mock_server_config, mock_flash_config)
+
+
+@pytest.fixture
+def mock_flash_gemini_client(
+    mock_flash_gemini_client_factory: Callable[[], SimpleNamespace],
+) -> SimpleNamespace:
+    """Create a mock GeminiClient configured for Flash model.
+
+    Args:
+        mock_flash_gemini_client_factory: Flash client builder fixture.
+
     Returns:
         Mock GeminiClient configured for Flash model.
     """
-    client = Mock(spec=GeminiClient)
+    return mock_flash_gemini_client_factory()
+
+
+def _build_mock_pro_gemini_client(
+    server_config: ServerConfig, pro_config: ProImageConfig
+) -> SimpleNamespace:
+    """Build a stand-in GeminiClient configured for the Pro model."""
+    client = SimpleNamespace()
     client._client = MagicMock()
     client._client.models = MagicMock()
-    client.config = mock_server_config
-    client.gemini_config = mock_flash_config
+    client.config = server_config
+    client.gemini_config = pro_config
     client.create_image_parts = Mock(return_value=[])
-    client.extract_images = Mock(return_value=[b"flash_image_bytes"])
+    client.create_image_part = Mock(return_value=MagicMock())
+    client.extract_images = Mock(return_value=[b"pro_image_bytes"])
     client.generate_content = Mock(return_value=MagicMock())
+    client.generate_content_stream = Mock(side_effect=lambda *args, **kwargs: iter([MagicMock()]))
     return client
 
 
-@pytest.fixture
-def mock_pro_gemini_client(
+@pytest.fixture(scope="session")
+def mock_pro_gemini_client_factory(
     mock_server_config: ServerConfig, mock_pro_config: ProImageConfig
-) -> Mock:
-    """Create a mock GeminiClient configured for Pro model.
+) -> Callable[[], SimpleNamespace]:
+    """Provide a builder for fresh Pro mock GeminiClient instances.
+
+    The Pro counterpart of ``mock_flash_gemini_client_factory``.
 
     Args:
         mock_server_config: Server configuration fixture.
         mock_pro_config: Pro model configuration fixture.
 
+    Returns:
+        Zero-argument callable returning a new Pro mock client.
+    """
+    return partial(_build_mock_pro_gemini_client, mock_server_config, mock_pro_config)
+
+
+@pytest.fixture
+def mock_pro_gemini_client(
+    mock_pro_gemini_client_factory: Callable[[], SimpleNamespace],
+) -> SimpleNamespace:
+    """Create a mock GeminiClient configured for Pro model.
+
+    Args:
+        mock_pro_gemini_client_factory: Pro client builder fixture.
+
     Returns:
         Mock GeminiClient configured for Pro model.
     """
-    client = Mock(spec=GeminiClient)
-    client._client = MagicMock()
-    client._client.models = MagicMock()
-    client.config = mock_server_config
-    client.gemini_config = mock_pro_config
-    client.create_image_parts = Mock(return_value=[])
-    client.extract_images = Mock(return_value=[b"pro_image_bytes"])
-    client.generate_content = Mock(return_value=MagicMock())
-    return client
+    return mock_pro_gemini_client_factory()
 
 
 # =============================================================================
@@ -213,13 +298,24 @@ def mock_pro_gemini_client(
 # =============================================================================
 
 
-@pytest.fixture
+def _const(value):
+    """Return a plain stub that ignores its arguments and returns ``value``.
+
+    Cheaper than ``Mock(return_value=value)``; use it only for methods whose
+    calls no test inspects or reconfigures.
+    """
+    return lambda *args, **kwargs: value
+
+
+@pytest.fixture(scope="session")
 def mock_stored_image_info() -> StoredImageInfo:
     """Create a mock StoredImageInfo for testing.
 
     Returns:
         StoredImageInfo with predictable test values.
     """
+    from banana_image_mcp.services.image_storage_service import StoredImageInfo
+
     return StoredImageInfo(
         id="test-image-id-12345",
         filename="test-image-id-12345.png",
@@ -241,50 +337,39 @@ def mock_stored_image_info() -> StoredImageInfo:
     )
 
 
-@pytest.fixture
-def mock_storage_service(mock_stored_image_info: StoredImageInfo) -> Mock:
-    """Create a mock ImageStorageService for testing.
-
-    The mock service:
-    - Returns predictable StoredImageInfo objects
-    - Provides mock thumbnail base64 data
-    - Simulates storage operations without file I/O
-
-    Args:
-        mock_stored_image_info: StoredImageInfo fixture.
-
-    Returns:
-        Mock ImageStorageService with pre-configured mock methods.
-    """
-    service = Mock(spec=ImageStorageService)
+def _build_mock_storage_service(mock_stored_image_info: StoredImageInfo) -> SimpleNamespace:
+    """Build a stand-in ImageStorageService whose methods are pre-configured mocks."""
+    service = SimpleNamespace()
 
     # Mock store_image to return predictable StoredImageInfo
     service.store_image = Mock(return_value=mock_stored_image_info)
 
     # Mock get_thumbnail_base64 to return a small base64 string
-    # This is a 1x1 red pixel JPEG encoded as base64
-    service.get_thumbnail_base64 = Mock(
-        return_value="iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8DwHwAFBQIAX8jx0gAAAABJRU5ErkJggg=="
-    )
+    # This is a 1x1 red pixel PNG encoded as base64
+    thumbnail_b64 = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8DwHwAFBQIAX8jx0gAAAABJRU5ErkJggg=="
+    service.get_thumbnail_base64 = _const(thumbnail_b64)
+
+    # Mock get_thumbnail_bytes to return the same thumbnail as raw bytes
+    service.get_thumbnail_bytes = Mock(return_value=base64.b64decode(thumbnail_b64))
 
     # Mock get_image_info
-    service.get_image_info = Mock(return_value=mock_stored_image_info)
+    service.get_image_info = _const(mock_stored_image_info)
 
     # Mock get_image_bytes
-    service.get_image_bytes = Mock(return_value=b"mock_image_bytes")
+    service.get_image_bytes = _const(b"mock_image_bytes")
 
     # Mock list_images
-    service.list_images = Mock(return_value=[mock_stored_image_info])
+    service.list_images = _const([mock_stored_image_info])
 
     # Mock delete_image
-    service.delete_image = Mock(return_value=True)
+    service.delete_image = _const(True)
 
     # Mock cleanup_all
-    service.cleanup_all = Mock(return_value=1)
+    service.cleanup_all = _const(1)
 
     # Mock get_storage_stats
-    service.get_storage_stats = Mock(
-        return_value={
+    service.get_storage_stats = _const(
+        {
             "total_images": 1,
             "total_size_bytes": 102400,
             "total_size_mb": 0.1,
@@ -298,12 +383,62 @@ def mock_storage_service(mock_stored_image_info: StoredImageInfo) -> Mock:
     return service
 
 
+@pytest.fixture(scope="session")
+def mock_storage_service_factory(
+    mock_stored_image_info: StoredImageInfo,
+) -> Callable[[], SimpleNamespace]:
+    """Provide a builder for fresh mock ImageStorageService instances.
+
+    Lets fixtures with a broader scope than ``function`` build their own
+    storage mock; they are responsible for resetting it between tests.
+
+    Args:
+        mock_stored_image_info: StoredImageInfo fixture.
+
+    Returns:
+        Zero-argument callable returning a new mock storage service.
+    """
+    return partial(_build_mock_storage_service, mock_stored_image_info)
+
+
+@pytest.fixture
+def mock_storage_service(
+    mock_storage_service_factory: Callable[[], SimpleNamespace],
+) -> SimpleNamespace:
+    """Create a mock ImageStorageService for testing.
+
+    The mock service:
+    - Returns predictable StoredImageInfo objects
+    - Provides mock thumbnail base64 data
+    - Simulates storage operations without file I/O
+
+    Args:
+        mock_storage_service_factory: Storage service builder fixture.
+
+    Returns:
+        Stand-in ImageStorageService whose methods are pre-configured mocks.
+    """
+    return mock_storage_service_factory()
+
+
 # =============================================================================
 # Sample Data Fixtures (Requirements 6.4)
+#
+# Session-scoped: the encoded images are immutable and built once per run.
 # =============================================================================
 
 
-@pytest.fixture
+@cache
+def _encode_solid_image(color: str, fmt: str, **save_kwargs) -> bytes:
+    """Encode a 100x100 solid-color image, memoized per color/format/options."""
+    from PIL import Image as PILImage
+
+    buffer = io.BytesIO()
+    PILImage.new("RGB", (100, 100), color=color).save(buffer, format=fmt, **save_kwargs)
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope="session")
 def sample_image_bytes() -> bytes:
     """Generate a valid PNG image bytes for testing.
 
@@ -313,13 +448,10 @@ def sample_image_bytes() -> bytes:
         Valid PNG image as bytes.
     """
     # Create a simple 100x100 red image
-    img = PILImage.new("RGB", (100, 100), color="red")
-    buffer = io.BytesIO()
-    img.save(buffer, format="PNG")
-    return buffer.getvalue()
+    return _encode_solid_image("red", "PNG", compress_level=1)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_image_bytes_large() -> bytes:
     """Generate a larger valid PNG image bytes for testing.
 
@@ -328,23 +460,26 @@ def sample_image_bytes_large() -> bytes:
     Returns:
         Valid PNG image as bytes.
     """
-    # Create a 1024x768 gradient image
-    img = PILImage.new("RGB", (1024, 768))
-    pixels = img.load()
-    for x in range(1024):
-        for y in range(768):
-            # Create a gradient effect
-            r = int(255 * x / 1024)
-            g = int(255 * y / 768)
-            b = 128
-            pixels[x, y] = (r, g, b)
+    from PIL import Image as PILImage
+
+    # Create a 1024x768 gradient image from whole channel planes: red varies
+    # along x, green along y, blue is constant
+    width, height = 1024, 768
+    red_row = bytes(255 * x // width for x in range(width))
+    red = PILImage.frombytes("L", (width, height), red_row * height)
+    green = PILImage.frombytes(
+        "L", (width, height), b"".join(bytes((255 * y // height,)) * width for y in range(height))
+    )
+    blue = PILImage.new("L", (width, height), 128)
+    img = PILImage.merge("RGB", (red, green, blue))
 
     buffer = io.BytesIO()
-    img.save(buffer, format="PNG")
+    # Fixtures are never transmitted, so favor encode speed over size
+    img.save(buffer, format="PNG", compress_level=1, optimize=False)
     return buffer.getvalue()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_image_base64(sample_image_bytes: bytes) -> str:
     """Generate a valid PNG image as base64 string for testing.
 
@@ -354,12 +489,10 @@ def sample_image_base64(sample_image_bytes: bytes) -> str:
     Returns:
         Base64 encoded PNG image string.
     """
-    import base64
-
-    return base64.b64encode(sample_image_bytes).decode("utf-8")
+    return base64.b64encode(memoryview(sample_image_bytes)).decode("ascii")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_jpeg_bytes() -> bytes:
     """Generate a valid JPEG image bytes for testing.
 
@@ -368,13 +501,10 @@ def sample_jpeg_bytes() -> bytes:
     Returns:
         Valid JPEG image as bytes.
     """
-    img = PILImage.new("RGB", (100, 100), color="blue")
-    buffer = io.BytesIO()
-    img.save(buffer, format="JPEG", quality=85)
-    return buffer.getvalue()
+    return _encode_solid_image("blue", "JPEG", quality=85)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_webp_bytes() -> bytes:
     """Generate a valid WebP image bytes for testing.
 
@@ -383,18 +513,18 @@ def sample_webp_bytes() -> bytes:
     Returns:
         Valid WebP image as bytes.
     """
-    img = PILImage.new("RGB", (100, 100), color="green")
-    buffer = io.BytesIO()
-    img.save(buffer, format="WEBP", quality=85)
-    return buffer.getvalue()
+    return _encode_solid_image("green", "WEBP", quality=85, method=0)
 
 
 # =============================================================================
 # Helper Fixtures
+#
+# The mock responses are session-scoped; tests that reconfigure one should
+# work on a copy.
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_gemini_response_with_image(sample_image_bytes: bytes) -> MagicMock:
     """Create a mock Gemini API response containing an image.
 
@@ -429,7 +559,7 @@ def mock_gemini_response_with_image(sample_image_bytes: bytes) -> MagicMock:
     return response
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_gemini_response_empty() -> MagicMock:
     """Create a mock Gemini API response with no images.
 
@@ -441,7 +571,7 @@ def mock_gemini_response_empty() -> MagicMock:
     return response
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_gemini_response_multiple_images(sample_image_bytes: bytes) -> MagicMock:
     """Create a mock Gemini API response containing multiple images.
 
@@ -453,18 +583,16 @@ def mock_gemini_response_multiple_images(sample_image_bytes: bytes) -> MagicMock
     """
     response = MagicMock()
 
-    parts = []
-    for _i in range(3):
-        inline_data = MagicMock()
-        inline_data.data = sample_image_bytes
-        inline_data.mime_type = "image/png"
+    inline_data = MagicMock()
+    inline_data.data = sample_image_bytes
+    inline_data.mime_type = "image/png"
 
-        part = MagicMock()
-        part.inline_data = inline_data
-        parts.append(part)
+    part = MagicMock()
+    part.inline_data = inline_data
 
+    # The three image parts are identical and read-only, so one mock is shared
     content = MagicMock()
-    content.parts = parts
+    content.parts = [part] * 3
 
     candidate = MagicMock()
     candidate.content = content
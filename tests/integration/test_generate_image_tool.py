@@ -6,29 +6,57 @@ Tests the complete flow of image generation and editing with mocked Gemini API.
 Requirements: 7.1, 7.2
 """
 
-import os
-import tempfile
-from unittest.mock import MagicMock, Mock, patch
+import asyncio
+import logging
+from unittest.mock import Mock
 
+from fastmcp import FastMCP
 import pytest
 
+from banana_image_mcp import services
 from banana_image_mcp.config.settings import (
     ModelSelectionConfig,
     ModelTier,
 )
+from banana_image_mcp.core.exceptions import ValidationError
 from banana_image_mcp.services.flash_image_service import FlashImageService
-from banana_image_mcp.services.gemini_client import GeminiClient
 from banana_image_mcp.services.model_selector import ModelSelector
 from banana_image_mcp.services.pro_image_service import ProImageService
 from banana_image_mcp.tools.generate_image import (
     _build_structured_content,
     _build_summary,
-    _collect_input_paths,
+    _collect_and_validate,
     _detect_mode,
     _select_model,
-    _validate_inputs,
+    register_generate_image_tool,
 )
 
+_LOGGER = logging.getLogger(__name__)
+
+_BASE_METADATA = {
+    "full_path": "/tmp/test/image.png",
+    "size_bytes": 102400,
+    "width": 1024,
+    "height": 768,
+}
+
+
+def _make_metadata(**overrides):
+    """Return one generated-image metadata dict, with ``overrides`` applied."""
+    return {**_BASE_METADATA, **overrides}
+
+
+@pytest.fixture(scope="module")
+def shared_png_files(tmp_path_factory, sample_image_bytes):
+    """Write three sample PNGs once for the tests that need real input paths."""
+    directory = tmp_path_factory.mktemp("imgs")
+    paths = []
+    for i in range(3):
+        path = directory / f"input_{i}.png"
+        path.write_bytes(sample_image_bytes)
+        paths.append(str(path))
+    return paths
+
 
 class TestGenerateImageToolIntegration:
     """
@@ -40,37 +68,33 @@ class TestGenerateImageToolIntegration:
     to response building.
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_services(
         self,
-        mock_server_config,
         mock_flash_config,
         mock_pro_config,
-        mock_storage_service,
+        mock_storage_service_factory,
+        mock_gemini_response_with_image,
         sample_image_bytes,
     ):
-        """Set up mock services for integration testing."""
-        # Create mock Gemini clients
-        flash_client = Mock(spec=GeminiClient)
-        pro_client = Mock(spec=GeminiClient)
-
-        # Configure mock responses with image data
-        mock_response = MagicMock()
-        mock_part = MagicMock()
-        mock_part.inline_data = MagicMock()
-        mock_part.inline_data.data = sample_image_bytes
-        mock_part.inline_data.mime_type = "image/png"
-        mock_response.candidates = [MagicMock()]
-        mock_response.candidates[0].content = MagicMock()
-        mock_response.candidates[0].content.parts = [mock_part]
-
-        flash_client.generate_content = Mock(return_value=mock_response)
-        flash_client.extract_images = Mock(return_value=[sample_image_bytes])
-        flash_client.create_image_parts = Mock(return_value=[])
-
-        pro_client.generate_content = Mock(return_value=mock_response)
-        pro_client.extract_images = Mock(return_value=[sample_image_bytes])
-        pro_client.create_image_parts = Mock(return_value=[])
+        """Set up mock services for integration testing.
+
+        Built once per module; ``_reset_mocks`` clears recorded calls
+        before each test.
+        """
+        mock_storage_service = mock_storage_service_factory()
+
+        # Create mock Gemini clients; the methods the services call are configured below
+        flash_client = Mock()
+        pro_client = Mock()
+
+        flash_client.generate_content.return_value = mock_gemini_response_with_image
+        flash_client.extract_images.return_value = [sample_image_bytes]
+        flash_client.create_image_parts.return_value = []
+
+        pro_client.generate_content.return_value = mock_gemini_response_with_image
+        pro_client.extract_images.return_value = [sample_image_bytes]
+        pro_client.create_image_parts.return_value = []
 
         # Create services
         flash_service = FlashImageService(
@@ -107,227 +131,171 @@ class TestGenerateImageToolIntegration:
             "storage_service": mock_storage_service,
         }
 
-    def test_complete_generation_flow(self, mock_services, mock_stored_image_info):
+    @pytest.fixture
+    def patched_selector(self, mocker, mock_services):
+        """Route the service registry's model selector to the mock services."""
+        mocker.patch.object(
+            services, "get_model_selector", return_value=mock_services["model_selector"]
+        )
+        return mock_services
+
+    @pytest.fixture(autouse=True)
+    def _reset_mocks(self, mock_services):
+        """Clear calls recorded on the shared mocks by earlier tests."""
+        mock_services["flash_client"].reset_mock()
+        mock_services["pro_client"].reset_mock()
+        storage_service = mock_services["storage_service"]
+        storage_service.store_image.reset_mock()
+        storage_service.get_thumbnail_bytes.reset_mock()
+
+    @pytest.mark.usefixtures("patched_selector")
+    @pytest.mark.parametrize(
+        (
+            "prompt",
+            "model_tier",
+            "thinking_level",
+            "enable_grounding",
+            "file_id",
+            "n_paths",
+            "expected_mode",
+            "expected_tier",
+        ),
+        [
+            # Requirements 7.1: pure generation, no inputs
+            pytest.param(
+                "A beautiful sunset over the ocean",
+                "flash",
+                "high",
+                False,
+                None,
+                0,
+                "generate",
+                ModelTier.FLASH,
+                id="generate",
+            ),
+            # Requirements 7.2: edit an existing image by Files API ID
+            pytest.param(
+                "Make the sky more blue",
+                "pro",
+                "high",
+                True,
+                "files/abc123",
+                0,
+                "edit",
+                ModelTier.PRO,
+                id="edit-file-id",
+            ),
+            # Requirements 7.2: edit a local file (single input = edit)
+            pytest.param(
+                "Add a rainbow to the sky",
+                "flash",
+                None,
+                False,
+                None,
+                1,
+                "edit",
+                ModelTier.FLASH,
+                id="edit-file-path",
+            ),
+        ],
+    )
+    def test_complete_flow(
+        self,
+        mock_services,
+        shared_png_files,
+        prompt: str,
+        model_tier: str,
+        thinking_level: str | None,
+        enable_grounding: bool,
+        file_id: str | None,
+        n_paths: int,
+        expected_mode: str,
+        expected_tier: ModelTier,
+    ):
         """
-        Test complete image generation flow.
+        Test the complete generation and editing flows.
 
-        **Validates: Requirements 7.1**
+        **Validates: Requirements 7.1, 7.2**
 
         Tests:
-        1. Input collection
-        2. Input validation
+        1-2. Input collection and validation
         3. Mode detection
         4. Model selection
-        5. Response building
-        """
-        # Step 1: Collect input paths (no inputs for pure generation)
-        input_paths = _collect_input_paths(None, None, None)
-        assert input_paths is None
-
-        # Step 2: Validate inputs
-        _validate_inputs("generate", input_paths, None)  # Should not raise
-
-        # Step 3: Detect mode
-        mode = _detect_mode("auto", None, input_paths)
-        assert mode == "generate"
-
-        # Step 4: Model selection (mock the service registry)
-        with patch("banana_image_mcp.services.get_model_selector") as mock_get_selector:
-            mock_get_selector.return_value = mock_services["model_selector"]
-
-            import logging
 
-            logger = logging.getLogger(__name__)
-
-            service, tier, model_info = _select_model(
-                prompt="A beautiful sunset over the ocean",
-                model_tier="flash",
-                n=1,
-                resolution="high",
-                thinking_level="high",
-                enable_grounding=False,
-                input_paths=None,
-                logger=logger,
-            )
-
-            assert service is mock_services["flash_service"]
-            assert tier == ModelTier.FLASH
-            assert "Flash" in model_info["name"]
-
-        # Step 5: Build response
-        metadata = [
-            {
-                "full_path": "/tmp/test/image.png",
-                "size_bytes": 102400,
-                "width": 1024,
-                "height": 768,
-                "files_api": {"name": "files/abc123"},
-            }
-        ]
-
-        summary = _build_summary(
-            mode="generate",
-            metadata=metadata,
-            model_info=model_info,
-            selected_tier=tier,
-            thinking_level="high",
-            resolution="high",
-            enable_grounding=False,
-            file_id=None,
-            input_paths=None,
-            aspect_ratio=None,
-        )
-
-        assert "Generated" in summary
-        assert "1 image" in summary
-        assert "Flash" in summary
-
-    def test_complete_edit_flow_with_file_id(self, mock_services):
+        The response summary is covered by test_summary_contents.
         """
-        Test complete image editing flow with file_id.
+        paths = shared_png_files[:n_paths]
 
-        **Validates: Requirements 7.2**
-
-        Tests editing an existing image using Files API ID.
-        """
-        # Step 1: Collect input paths (none for file_id edit)
-        input_paths = _collect_input_paths(None, None, None)
-        assert input_paths is None
-
-        # Step 2: Validate inputs
-        _validate_inputs("edit", input_paths, "files/abc123")  # Should not raise
+        # Steps 1-2: Collect and validate input paths
+        inputs = _collect_and_validate(*paths, *[None] * (3 - n_paths), expected_mode, file_id)
+        input_paths = [path for path, _ in inputs] if inputs else None
+        assert input_paths == (paths or None)
 
         # Step 3: Detect mode
-        mode = _detect_mode("auto", "files/abc123", input_paths)
-        assert mode == "edit"
-
-        # Step 4: Model selection
-        with patch("banana_image_mcp.services.get_model_selector") as mock_get_selector:
-            mock_get_selector.return_value = mock_services["model_selector"]
-
-            import logging
-
-            logger = logging.getLogger(__name__)
+        mode = _detect_mode("auto", file_id, input_paths)
+        assert mode == expected_mode
 
-            service, tier, model_info = _select_model(
-                prompt="Make the sky more blue",
-                model_tier="pro",
-                n=1,
-                resolution="high",
-                thinking_level="high",
-                enable_grounding=True,
-                input_paths=None,
-                logger=logger,
-            )
-
-            assert service is mock_services["pro_service"]
-            assert tier == ModelTier.PRO
-
-        # Step 5: Build response
-        metadata = [
-            {
-                "full_path": "/tmp/test/edited.png",
-                "size_bytes": 102400,
-                "width": 1024,
-                "height": 768,
-                "files_api": {"name": "files/xyz789"},
-                "parent_file_id": "files/abc123",
-            }
-        ]
-
-        summary = _build_summary(
-            mode="edit",
-            metadata=metadata,
-            model_info=model_info,
-            selected_tier=tier,
-            thinking_level="high",
+        # Step 4: Model selection (mock the service registry)
+        service, tier, model_info = _select_model(
+            prompt=prompt,
+            model_tier=model_tier,
+            n=1,
             resolution="high",
-            enable_grounding=True,
-            file_id="files/abc123",
-            input_paths=None,
-            aspect_ratio=None,
+            thinking_level=thinking_level,
+            enable_grounding=enable_grounding,
+            input_paths=input_paths,
+            logger=_LOGGER,
         )
 
-        assert "Edited" in summary
-        assert "files/abc123" in summary
-
-    def test_complete_edit_flow_with_file_path(self, mock_services, sample_image_bytes):
-        """
-        Test complete image editing flow with local file path.
-
-        **Validates: Requirements 7.2**
-
-        Tests editing an existing image using local file path.
-        """
-        # Create a temporary image file
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            f.write(sample_image_bytes)
-            temp_path = f.name
-
-        try:
-            # Step 1: Collect input paths
-            input_paths = _collect_input_paths(temp_path, None, None)
-            assert input_paths == [temp_path]
-
-            # Step 2: Validate inputs
-            _validate_inputs("edit", input_paths, None)  # Should not raise
-
-            # Step 3: Detect mode (single input = edit)
-            mode = _detect_mode("auto", None, input_paths)
-            assert mode == "edit"
-
-            # Step 4: Model selection
-            with patch("banana_image_mcp.services.get_model_selector") as mock_get_selector:
-                mock_get_selector.return_value = mock_services["model_selector"]
-
-                import logging
-
-                logger = logging.getLogger(__name__)
-
-                service, tier, model_info = _select_model(
-                    prompt="Add a rainbow to the sky",
-                    model_tier="flash",
-                    n=1,
-                    resolution="high",
-                    thinking_level=None,
-                    enable_grounding=False,
-                    input_paths=input_paths,
-                    logger=logger,
-                )
-
-                assert service is mock_services["flash_service"]
-                assert tier == ModelTier.FLASH
-
-            # Step 5: Build response
-            metadata = [
-                {
-                    "full_path": "/tmp/test/edited.png",
-                    "size_bytes": 102400,
-                    "width": 1024,
-                    "height": 768,
-                }
-            ]
-
-            summary = _build_summary(
-                mode="edit",
-                metadata=metadata,
-                model_info=model_info,
-                selected_tier=tier,
-                thinking_level=None,
-                resolution="high",
-                enable_grounding=False,
-                file_id=None,
-                input_paths=input_paths,
-                aspect_ratio=None,
-            )
-
-            assert "Edited" in summary
-            assert temp_path in summary
-
-        finally:
-            os.unlink(temp_path)
-
-    def test_model_switching_flash_to_pro(self, mock_services):
+        expected_service = "pro_service" if expected_tier == ModelTier.PRO else "flash_service"
+        assert service is mock_services[expected_service]
+        assert tier == expected_tier
+        assert model_info["tier"] == expected_tier.value
+
+    @pytest.mark.usefixtures("patched_selector")
+    @pytest.mark.parametrize(
+        ("prompt", "model_tier", "resolution", "thinking_level", "enable_grounding", "expected"),
+        [
+            pytest.param(
+                "A simple cat", "flash", "high", "low", False, ModelTier.FLASH, id="explicit-flash"
+            ),
+            pytest.param(
+                "A simple cat", "pro", "high", "high", True, ModelTier.PRO, id="explicit-pro"
+            ),
+            pytest.param(
+                "A simple cat", "auto", "4k", "high", False, ModelTier.PRO, id="auto-4k-resolution"
+            ),
+            pytest.param(
+                "A highly detailed 4k portrait",
+                "auto",
+                "high",
+                "high",
+                False,
+                ModelTier.PRO,
+                id="auto-quality-keywords",
+            ),
+            # Low resolution to favor Flash
+            pytest.param(
+                "A quick simple sketch",
+                "auto",
+                "1k",
+                "low",
+                False,
+                ModelTier.FLASH,
+                id="auto-speed-keywords",
+            ),
+        ],
+    )
+    def test_model_switching_flash_to_pro(
+        self,
+        mock_services,
+        prompt: str,
+        model_tier: str,
+        resolution: str,
+        thinking_level: str,
+        enable_grounding: bool,
+        expected: ModelTier,
+    ):
         """
         Test model switching from Flash to Pro based on parameters.
 
@@ -335,82 +303,20 @@ class TestGenerateImageToolIntegration:
 
         Tests that the model selector correctly switches between models.
         """
-        with patch("banana_image_mcp.services.get_model_selector") as mock_get_selector:
-            mock_get_selector.return_value = mock_services["model_selector"]
-
-            import logging
-
-            logger = logging.getLogger(__name__)
-
-            # Test 1: Explicit Flash request
-            service, tier, _ = _select_model(
-                prompt="A simple cat",
-                model_tier="flash",
-                n=1,
-                resolution="high",
-                thinking_level="low",
-                enable_grounding=False,
-                input_paths=None,
-                logger=logger,
-            )
-            assert tier == ModelTier.FLASH
-            assert service is mock_services["flash_service"]
-
-            # Test 2: Explicit Pro request
-            service, tier, _ = _select_model(
-                prompt="A simple cat",
-                model_tier="pro",
-                n=1,
-                resolution="high",
-                thinking_level="high",
-                enable_grounding=True,
-                input_paths=None,
-                logger=logger,
-            )
-            assert tier == ModelTier.PRO
-            assert service is mock_services["pro_service"]
-
-            # Test 3: Auto with 4K resolution (should select Pro)
-            service, tier, _ = _select_model(
-                prompt="A simple cat",
-                model_tier="auto",
-                n=1,
-                resolution="4k",
-                thinking_level="high",
-                enable_grounding=False,
-                input_paths=None,
-                logger=logger,
-            )
-            assert tier == ModelTier.PRO
-            assert service is mock_services["pro_service"]
-
-            # Test 4: Auto with quality keywords (should select Pro)
-            service, tier, _ = _select_model(
-                prompt="A highly detailed 4k portrait",
-                model_tier="auto",
-                n=1,
-                resolution="high",
-                thinking_level="high",
-                enable_grounding=False,
-                input_paths=None,
-                logger=logger,
-            )
-            assert tier == ModelTier.PRO
-            assert service is mock_services["pro_service"]
-
-            # Test 5: Auto with speed keywords (should select Flash)
-            service, tier, _ = _select_model(
-                prompt="A quick simple sketch",
-                model_tier="auto",
-                n=1,
-                resolution="1k",  # Low resolution to favor Flash
-                thinking_level="low",
-                enable_grounding=False,
-                input_paths=None,
-                logger=logger,
-            )
-            assert tier == ModelTier.FLASH
-            assert service is mock_services["flash_service"]
+        service, tier, _ = _select_model(
+            prompt=prompt,
+            model_tier=model_tier,
+            n=1,
+            resolution=resolution,
+            thinking_level=thinking_level,
+            enable_grounding=enable_grounding,
+            input_paths=None,
+            logger=_LOGGER,
+        )
+
+        assert tier == expected
+        expected_service = "pro_service" if expected == ModelTier.PRO else "flash_service"
+        assert service is mock_services[expected_service]
 
     def test_structured_content_generation(self, mock_services):
         """
@@ -421,20 +327,12 @@ class TestGenerateImageToolIntegration:
         Tests that structured content contains all required fields.
         """
         metadata = [
-            {
-                "full_path": "/tmp/test/image1.png",
-                "size_bytes": 102400,
-                "width": 1024,
-                "height": 768,
-                "files_api": {"name": "files/abc123"},
-            },
-            {
-                "full_path": "/tmp/test/image2.png",
-                "size_bytes": 204800,
-                "width": 1024,
-                "height": 768,
-                "files_api": {"name": "files/def456"},
-            },
+            _make_metadata(full_path="/tmp/test/image1.png", files_api={"name": "files/abc123"}),
+            _make_metadata(
+                full_path="/tmp/test/image2.png",
+                size_bytes=204800,
+                files_api={"name": "files/def456"},
+            ),
         ]
 
         model_info = {
@@ -474,7 +372,7 @@ class TestGenerateImageToolIntegration:
         assert len(content["file_paths"]) == 2
         assert len(content["files_api_ids"]) == 2
 
-    def test_multi_image_conditioning(self, mock_services, sample_image_bytes):
+    def test_multi_image_conditioning(self, mock_services, shared_png_files):
         """
         Test generation with multiple input images for conditioning.
 
@@ -482,85 +380,148 @@ class TestGenerateImageToolIntegration:
 
         Tests that multiple input images are correctly collected and validated.
         """
-        # Create temporary image files
-        temp_paths = []
-        try:
-            for i in range(3):
-                with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-                    f.write(sample_image_bytes)
-                    temp_paths.append(f.name)
-
-            # Step 1: Collect input paths
-            input_paths = _collect_input_paths(temp_paths[0], temp_paths[1], temp_paths[2])
-            assert input_paths == temp_paths
-            assert len(input_paths) == 3
-
-            # Step 2: Validate inputs
-            _validate_inputs("generate", input_paths, None)  # Should not raise
-
-            # Step 3: Detect mode (multiple inputs = generate with conditioning)
-            mode = _detect_mode("auto", None, input_paths)
-            assert mode == "generate"  # Multiple inputs = generate mode
-
-            # Step 4: Build summary with input paths
-            metadata = [
-                {
-                    "full_path": "/tmp/test/output.png",
-                    "size_bytes": 102400,
-                    "width": 1024,
-                    "height": 768,
-                }
-            ]
-
-            model_info = {
-                "name": "Gemini 2.5 Flash Image",
-                "model_id": "gemini-2.5-flash-image",
-                "tier": "flash",
-                "emoji": "⚡",
-            }
-
-            summary = _build_summary(
-                mode="generate",
-                metadata=metadata,
-                model_info=model_info,
-                selected_tier=ModelTier.FLASH,
-                thinking_level=None,
-                resolution="high",
-                enable_grounding=False,
-                file_id=None,
-                input_paths=input_paths,
-                aspect_ratio=None,
-            )
-
-            assert "Generated" in summary
-            assert "3 input image" in summary
-
-        finally:
-            for path in temp_paths:
-                os.unlink(path)
-
-    def test_error_handling_invalid_mode(self):
+        temp_paths = shared_png_files
+
+        # Steps 1-2: Collect and validate input paths
+        inputs = _collect_and_validate(
+            temp_paths[0], temp_paths[1], temp_paths[2], "generate", None
+        )
+        input_paths = [path for path, _ in inputs]
+        assert input_paths == temp_paths
+        assert len(input_paths) == 3
+
+        # Step 3: Detect mode (multiple inputs = generate with conditioning)
+        mode = _detect_mode("auto", None, input_paths)
+        assert mode == "generate"  # Multiple inputs = generate mode
+
+    @pytest.mark.parametrize(
+        ("mode", "tier", "file_id", "input_paths", "extra_metadata", "expected"),
+        [
+            pytest.param(
+                "generate",
+                ModelTier.FLASH,
+                None,
+                None,
+                {"files_api": {"name": "files/abc123"}},
+                ["Generated", "1 image", "Flash"],
+                id="generate",
+            ),
+            pytest.param(
+                "edit",
+                ModelTier.PRO,
+                "files/abc123",
+                None,
+                {"files_api": {"name": "files/xyz789"}, "parent_file_id": "files/abc123"},
+                ["Edited", "files/abc123"],
+                id="edit-file-id",
+            ),
+            pytest.param(
+                "edit",
+                ModelTier.FLASH,
+                None,
+                ["/tmp/test/input.png"],
+                {},
+                ["Edited", "/tmp/test/input.png"],
+                id="edit-file-path",
+            ),
+            pytest.param(
+                "generate",
+                ModelTier.FLASH,
+                None,
+                ["/tmp/test/a.png", "/tmp/test/b.png", "/tmp/test/c.png"],
+                {},
+                ["Generated", "3 input image"],
+                id="multi-image-conditioning",
+            ),
+        ],
+    )
+    def test_summary_contents(
+        self,
+        mock_services,
+        mode: str,
+        tier: ModelTier,
+        file_id: str | None,
+        input_paths: list[str] | None,
+        extra_metadata: dict,
+        expected: list[str],
+    ):
         """
-        Test error handling for invalid mode.
+        Test the text summary built at the end of each tool flow.
 
-        **Validates: Requirements 7.1**
+        **Validates: Requirements 7.1, 7.2**
         """
-        from banana_image_mcp.core.exceptions import ValidationError
+        metadata = [_make_metadata(**extra_metadata)]
+
+        summary = _build_summary(
+            mode=mode,
+            metadata=metadata,
+            model_info=mock_services["model_selector"].get_model_info(tier),
+            selected_tier=tier,
+            thinking_level=None,
+            resolution="high",
+            enable_grounding=False,
+            file_id=file_id,
+            input_paths=input_paths,
+            aspect_ratio=None,
+        )
 
+        for substring in expected:
+            assert substring in summary
+
+    @pytest.mark.parametrize(
+        ("mode", "input_path", "file_id", "expected_substring"),
+        [
+            pytest.param("invalid_mode", None, None, "mode", id="invalid-mode"),
+            pytest.param(
+                "edit", "/nonexistent/path/image.png", None, "not found", id="nonexistent-path"
+            ),
+        ],
+    )
+    def test_error_handling(
+        self,
+        mode: str,
+        input_path: str | None,
+        file_id: str | None,
+        expected_substring: str,
+    ):
+        """
+        Test error handling for invalid mode and non-existent file path.
+
+        **Validates: Requirements 7.1, 7.2**
+        """
         with pytest.raises(ValidationError) as exc_info:
-            _validate_inputs("invalid_mode", None, None)
+            _collect_and_validate(input_path, None, None, mode, file_id)
 
-        assert "mode" in str(exc_info.value).lower()
+        assert expected_substring in str(exc_info.value).lower()
 
-    def test_error_handling_nonexistent_path(self):
+    @pytest.mark.usefixtures("patched_selector")
+    def test_tool_runs_service_off_the_event_loop(self, mocker):
         """
-        Test error handling for non-existent file path.
+        The async tool should await the blocking service call on a worker thread.
 
-        **Validates: Requirements 7.2**
+        **Validates: Requirements 7.1**
         """
-        from banana_image_mcp.core.exceptions import ValidationError
+        server = FastMCP("test")
+        register_generate_image_tool(server)
+        tool = asyncio.run(server.get_tool("generate_image"))
 
-        with pytest.raises(ValidationError) as exc_info:
-            _validate_inputs("edit", ["/nonexistent/path/image.png"], None)
+        ran_in_loop = []
+        metadata = _make_metadata()
+
+        def generate_images(**kwargs):
+            try:
+                asyncio.get_running_loop()
+                ran_in_loop.append(True)
+            except RuntimeError:
+                ran_in_loop.append(False)
+            return [], [metadata]
+
+        enhanced_service = Mock()
+        enhanced_service.generate_images = Mock(side_effect=generate_images)
+
+        mocker.patch.object(services, "get_enhanced_image_service", return_value=enhanced_service)
+
+        result = asyncio.run(tool.fn(prompt="A quick sketch of a cat", model_tier="flash"))
 
-        assert "not found" in str(exc_info.value).lower()
+        assert ran_in_loop == [False]
+        assert result.structured_content["file_paths"] == ["/tmp/test/image.png"]
@@ -0,0 +1,27 @@
+"""
+Shared Hypothesis strategies for the test suite.
+
+Strategies used by more than one test module live here so every test draws
+from the same strategy objects instead of rebuilding an identical one per file.
+"""
+
+from hypothesis import strategies as st
+
+# Printable ASCII characters, for text whose content the code under test only
+# measures or copies; much cheaper for Hypothesis to draw than full Unicode
+printable_ascii = st.characters(min_codepoint=32, max_codepoint=126)
+
+# Strategy for generating prompts
+prompt_strategy = st.text(min_size=1, max_size=200)
+
+# Strategy for generating printable ASCII prompts
+ascii_prompt_strategy = st.text(printable_ascii, min_size=1, max_size=200)
+
+# Strategy for generating response/image indices
+index_strategy = st.integers(min_value=1, max_value=10)
+
+# Strategy for aspect ratios
+aspect_ratio_strategy = st.one_of(
+    st.none(),
+    st.sampled_from(["1:1", "16:9", "9:16", "4:3", "3:4"]),
+)
@@ -112,6 +112,19 @@ class TestGeminiClientAspectRatio:
             call_kwargs = mock_gx.GenerateContentConfig.call_args[1]
             assert call_kwargs.get("response_modalities") == ["Image"]
 
+    def test_stream_passes_aspect_ratio(self, gemini_client):
+        """Test that generate_content_stream builds the same image config."""
+        gemini_client._client.models.generate_content_stream = Mock(return_value=iter(["chunk"]))
+        with patch("banana_image_mcp.services.gemini_client.gx") as mock_gx:
+            mock_gx.GenerateContentConfig = Mock()
+
+            chunks = list(
+                gemini_client.generate_content_stream(contents=["test"], aspect_ratio="16:9")
+            )
+
+            assert chunks == ["chunk"]
+            mock_gx.ImageConfig.assert_called_once_with(aspect_ratio="16:9")
+
 
 class TestAspectRatioMetadata:
     """Test aspect ratio in metadata tracking."""
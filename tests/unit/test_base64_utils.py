@@ -0,0 +1,48 @@
+"""
+Tests for the pybase64-backed base64 helpers and their stdlib fallback.
+"""
+
+import base64
+import importlib
+import sys
+
+import pytest
+
+from banana_image_mcp.utils import base64_utils
+
+DATA = [b"", b"a", b"ab", b"abc", bytes(range(256)) * 3]
+
+
+@pytest.fixture
+def stdlib_base64_utils(monkeypatch):
+    """Reload base64_utils as if pybase64 were not installed."""
+    with monkeypatch.context() as m:
+        m.setitem(sys.modules, "pybase64", None)
+        yield importlib.reload(base64_utils)
+    importlib.reload(base64_utils)
+
+
+@pytest.fixture
+def pybase64_base64_utils():
+    """base64_utils with pybase64 active, skipped when the speed extra is absent."""
+    pytest.importorskip("pybase64")
+    assert base64_utils._base64.__name__ == "pybase64"
+    return base64_utils
+
+
+@pytest.mark.parametrize("backend", ["pybase64_base64_utils", "stdlib_base64_utils"])
+@pytest.mark.parametrize("data", DATA)
+def test_matches_stdlib(request, backend: str, data: bytes):
+    """Both backends SHALL encode and decode exactly like the stdlib module."""
+    module = request.getfixturevalue(backend)
+    expected = base64.b64encode(data)
+
+    assert module.b64encode(data) == expected
+    assert module.b64encode_str(data) == expected.decode("ascii")
+    assert module.b64decode(expected) == data
+
+
+def test_fallback_is_selected_without_pybase64(stdlib_base64_utils):
+    """Without pybase64 the module should use the stdlib codec."""
+    assert stdlib_base64_utils._base64 is base64
+    assert stdlib_base64_utils._b64encode_as_string is None
@@ -7,22 +7,64 @@ Property-based tests for BaseImageService.
 This module tests:
 - Property 4: Content Building Completeness
 - Property 5: Image Output Processing
+- Concurrent generation loop
 """
 
-from unittest.mock import Mock
+import asyncio
+from dataclasses import replace
+import threading
+import time
+from unittest.mock import Mock, patch
 
-from hypothesis import HealthCheck, given, settings
+from fastmcp.utilities.types import Image as MCPImage
+from hypothesis import HealthCheck, Phase, example, given, settings
 from hypothesis import strategies as st
 import pytest
 
+from banana_image_mcp.services.base_image_service import EditItem
 from banana_image_mcp.services.flash_image_service import FlashImageService
+from tests.strategies import prompt_strategy
+
+
+@pytest.fixture
+def flash_service(mock_flash_gemini_client, mock_flash_config):
+    """Create a FlashImageService without storage."""
+    return FlashImageService(
+        gemini_client=mock_flash_gemini_client,
+        config=mock_flash_config,
+        storage_service=None,
+    )
 
-# =============================================================================
-# Hypothesis Strategies
-# =============================================================================
 
-# Strategy for generating prompts
-prompt_strategy = st.text(min_size=1, max_size=200)
+class _InFlightRecorder:
+    """Blocking stand-in for a Gemini call that records peak concurrency."""
+
+    def __init__(self, result=None, delay: float = 0.05):
+        self.result = result
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            return self.result() if callable(self.result) else self.result
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _with_concurrency_limit(service: FlashImageService, limit: int) -> FlashImageService:
+    """Rebuild ``service`` with ``max_concurrent_generations`` set to ``limit``."""
+    return FlashImageService(
+        gemini_client=service.gemini_client,
+        config=replace(service.config, max_concurrent_generations=limit),
+        storage_service=service.storage_service,
+    )
 
 
 # =============================================================================
@@ -42,18 +84,28 @@ class TestContentBuildingCompleteness:
     - Input image parts are included when provided
     """
 
-    @pytest.fixture
-    def flash_service(self, mock_flash_gemini_client, mock_flash_config, mock_storage_service):
-        """Create a FlashImageService for testing _build_contents."""
+    @pytest.fixture(scope="class")
+    def flash_service(
+        self, mock_flash_gemini_client_factory, mock_flash_config, mock_storage_service_factory
+    ):
+        """Create one FlashImageService for all _build_contents tests in the class."""
         return FlashImageService(
-            gemini_client=mock_flash_gemini_client,
+            gemini_client=mock_flash_gemini_client_factory(),
             config=mock_flash_config,
-            storage_service=mock_storage_service,
+            storage_service=mock_storage_service_factory(),
         )
 
+    @pytest.fixture(autouse=True)
+    def _reset_image_parts(self, flash_service):
+        """Undo create_image_parts stubbing left by an earlier test."""
+        create_image_parts = flash_service.gemini_client.create_image_parts
+        create_image_parts.reset_mock()
+        create_image_parts.return_value = []
+
     @given(prompt=prompt_strategy)
+    @example(prompt=" ")
+    @example(prompt="4K banana 🍌, 日本語\n")
     @settings(
-        max_examples=100,
         suppress_health_check=[HealthCheck.function_scoped_fixture],
     )
     def test_prompt_always_present(self, flash_service, prompt: str):
@@ -74,8 +126,9 @@ class TestContentBuildingCompleteness:
         prompt=prompt_strategy,
         negative_prompt=st.text(min_size=1, max_size=100),
     )
+    @example(prompt="a", negative_prompt="a")
+    @example(prompt="x", negative_prompt=" ")
     @settings(
-        max_examples=100,
         suppress_health_check=[HealthCheck.function_scoped_fixture],
     )
     def test_negative_prompt_appended(self, flash_service, prompt: str, negative_prompt: str):
@@ -98,8 +151,9 @@ class TestContentBuildingCompleteness:
         prompt=prompt_strategy,
         system_instruction=st.text(min_size=1, max_size=100),
     )
+    @example(prompt="a", system_instruction="a")
+    @example(prompt="x", system_instruction="\n")
     @settings(
-        max_examples=100,
         suppress_health_check=[HealthCheck.function_scoped_fixture],
     )
     def test_system_instruction_prepended(
@@ -122,7 +176,10 @@ class TestContentBuildingCompleteness:
 
     @given(prompt=prompt_strategy)
     @settings(
-        max_examples=50,
+        deadline=None,
+        # The assertions only depend on the mocked image parts, so a failing
+        # prompt would not shrink to anything more useful
+        phases=[Phase.generate],
         suppress_health_check=[HealthCheck.function_scoped_fixture],
     )
     def test_input_images_included(self, flash_service, prompt: str):
@@ -153,8 +210,9 @@ class TestContentBuildingCompleteness:
         negative_prompt=st.text(min_size=1, max_size=50),
         system_instruction=st.text(min_size=1, max_size=50),
     )
+    @example(prompt="a", negative_prompt="a", system_instruction="a")
+    @example(prompt="x", negative_prompt=" ", system_instruction="Constraints (avoid)")
     @settings(
-        max_examples=100,
         suppress_health_check=[HealthCheck.function_scoped_fixture],
     )
     def test_all_components_combined(
@@ -210,26 +268,33 @@ class TestImageOutputProcessing:
     - Store the image and return a thumbnail MCPImage when storage is enabled
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def flash_service_with_storage(
-        self, mock_flash_gemini_client, mock_flash_config, mock_storage_service
+        self, mock_flash_gemini_client_factory, mock_flash_config, mock_storage_service_factory
     ):
-        """Create a FlashImageService with storage enabled."""
+        """Create a FlashImageService with storage enabled, shared by the class."""
         return FlashImageService(
-            gemini_client=mock_flash_gemini_client,
+            gemini_client=mock_flash_gemini_client_factory(),
             config=mock_flash_config,
-            storage_service=mock_storage_service,
+            storage_service=mock_storage_service_factory(),
         )
 
-    @pytest.fixture
-    def flash_service_without_storage(self, mock_flash_gemini_client, mock_flash_config):
-        """Create a FlashImageService without storage."""
+    @pytest.fixture(scope="class")
+    def flash_service_without_storage(self, mock_flash_gemini_client_factory, mock_flash_config):
+        """Create a FlashImageService without storage, shared by the class."""
         return FlashImageService(
-            gemini_client=mock_flash_gemini_client,
+            gemini_client=mock_flash_gemini_client_factory(),
             config=mock_flash_config,
             storage_service=None,
         )
 
+    @pytest.fixture(autouse=True)
+    def _reset_storage_mocks(self, flash_service_with_storage):
+        """Clear storage calls recorded by earlier tests."""
+        storage_service = flash_service_with_storage.storage_service
+        storage_service.store_image.reset_mock()
+        storage_service.get_thumbnail_bytes.reset_mock()
+
     def test_returns_mcp_image_without_storage(
         self, flash_service_without_storage, sample_image_bytes
     ):
@@ -238,8 +303,6 @@ class TestImageOutputProcessing:
 
         Should return an MCPImage when storage is disabled.
         """
-        from fastmcp.utilities.types import Image as MCPImage
-
         metadata = {"prompt": "test", "model": "flash"}
 
         result = flash_service_without_storage._process_image_output(
@@ -252,6 +315,22 @@ class TestImageOutputProcessing:
         # MCPImage has data attribute
         assert result.data is not None
 
+    def test_small_image_returned_without_recompression(
+        self, flash_service_without_storage, sample_image_bytes
+    ):
+        """Images under the inline size limit should be returned as-is."""
+        with patch(
+            "banana_image_mcp.services.base_image_service.optimize_image_bytes"
+        ) as mock_optimize:
+            result = flash_service_without_storage._process_image_output(
+                image_bytes=sample_image_bytes,
+                metadata={},
+                use_storage=False,
+            )
+
+        mock_optimize.assert_not_called()
+        assert result.data is sample_image_bytes
+
     def test_returns_mcp_image_with_storage_disabled_flag(
         self, flash_service_with_storage, sample_image_bytes
     ):
@@ -260,8 +339,6 @@ class TestImageOutputProcessing:
 
         Should return an MCPImage when use_storage=False even if storage service exists.
         """
-        from fastmcp.utilities.types import Image as MCPImage
-
         metadata = {"prompt": "test", "model": "flash"}
 
         result = flash_service_with_storage._process_image_output(
@@ -282,8 +359,6 @@ class TestImageOutputProcessing:
 
         Should store the image and return a thumbnail MCPImage when storage is enabled.
         """
-        from fastmcp.utilities.types import Image as MCPImage
-
         metadata = {"prompt": "test", "model": "flash"}
 
         result = flash_service_with_storage._process_image_output(
@@ -294,16 +369,14 @@ class TestImageOutputProcessing:
 
         # Storage service should be called
         flash_service_with_storage.storage_service.store_image.assert_called_once()
-        flash_service_with_storage.storage_service.get_thumbnail_base64.assert_called_once()
+        flash_service_with_storage.storage_service.get_thumbnail_bytes.assert_called_once()
 
         # Result should be an MCPImage (thumbnail)
         assert isinstance(result, MCPImage)
 
-    @given(prompt=prompt_strategy)
-    @settings(
-        max_examples=50,
-        suppress_health_check=[HealthCheck.function_scoped_fixture],
-    )
+    # The prompt is only passed through, so a few representative values
+    # cover it; no need for Hypothesis here
+    @pytest.mark.parametrize("prompt", ["short", "a" * 200, "中文测试", "with spaces"])
     def test_metadata_passed_to_storage(
         self, flash_service_with_storage, sample_image_bytes, prompt: str
     ):
@@ -312,8 +385,8 @@ class TestImageOutputProcessing:
 
         Metadata should be passed to storage service.
         """
-        # Reset mock
-        flash_service_with_storage.storage_service.store_image.reset_mock()
+        store_image = flash_service_with_storage.storage_service.store_image
+        calls_before = store_image.call_count
 
         metadata = {"prompt": prompt, "model": "flash"}
 
@@ -324,7 +397,192 @@ class TestImageOutputProcessing:
         )
 
         # Verify metadata was passed
-        call_args = flash_service_with_storage.storage_service.store_image.call_args
-        assert call_args is not None
+        assert store_image.call_count == calls_before + 1
+        call_args = store_image.call_args_list[calls_before]
         # Third argument should be metadata
         assert call_args[0][2] == metadata
+
+
+# =============================================================================
+# Image Editing
+# =============================================================================
+
+
+class TestEditImage:
+    """edit_image SHALL send a single image part followed by the instruction."""
+
+    def test_edit_sends_single_part_and_instruction(self, flash_service, sample_image_base64):
+        """The source image should be converted with the scalar part helper."""
+        client = flash_service.gemini_client
+
+        images, count = flash_service.edit_image(
+            "make it blue", sample_image_base64, use_storage=False
+        )
+
+        client.create_image_part.assert_called_once_with(sample_image_base64, "image/png")
+        contents = client.generate_content.call_args[0][0]
+        assert contents == [client.create_image_part.return_value, "make it blue"]
+        assert count == len(images) == 1
+
+    def test_edit_images_keeps_order_and_skips_failures(self, flash_service, sample_image_base64):
+        """Batch edits should return per-item results in order."""
+        flash_service.gemini_client.generate_content.side_effect = [
+            Mock(),
+            RuntimeError("API error"),
+            Mock(),
+        ]
+        service = _with_concurrency_limit(flash_service, 1)
+        items = [EditItem(f"edit {i}", sample_image_base64) for i in range(3)]
+
+        results = service.edit_images(items, use_storage=False)
+
+        assert [count for _, count in results] == [1, 0, 1]
+
+    def test_edit_images_run_concurrently_within_limit(self, flash_service, sample_image_base64):
+        """Batch edits should overlap, but never exceed the concurrency limit."""
+        recorder = _InFlightRecorder(result=Mock)
+        flash_service.gemini_client.generate_content.side_effect = recorder
+        service = _with_concurrency_limit(flash_service, 2)
+        items = [EditItem(f"edit {i}", sample_image_base64) for i in range(5)]
+
+        results = service.edit_images(items, use_storage=False)
+
+        assert [count for _, count in results] == [1] * 5
+        assert recorder.peak == 2
+
+
+# =============================================================================
+# Concurrent Generation Loop
+# =============================================================================
+
+
+class TestConcurrentGenerationLoop:
+    """
+    The generation loop SHALL issue all requests concurrently, keep results in
+    request order, and skip failed requests without cancelling the batch.
+    """
+
+    def test_generates_all_requested_images(self, flash_service):
+        """All n requests should be issued and their images returned."""
+        images, metadata = flash_service._generation_loop(
+            contents=["prompt"],
+            n=4,
+            prompt="prompt",
+            gen_config=None,
+            use_storage=False,
+            progress=Mock(),
+        )
+
+        assert len(images) == 4
+        assert flash_service.gemini_client.generate_content_stream.call_count == 4
+        assert [m["response_index"] for m in metadata] == [1, 2, 3, 4]
+
+    def test_requests_run_concurrently_within_limit(self, flash_service):
+        """Requests should overlap, but never exceed the concurrency limit."""
+        recorder = _InFlightRecorder(result=lambda: iter([Mock()]))
+        flash_service.gemini_client.generate_content_stream.side_effect = recorder
+        service = _with_concurrency_limit(flash_service, 3)
+
+        images, _ = service._generation_loop(
+            contents=["prompt"],
+            n=8,
+            prompt="prompt",
+            gen_config=None,
+            use_storage=False,
+            progress=Mock(),
+        )
+
+        assert len(images) == 8
+        assert recorder.peak == 3
+
+    def test_failed_request_does_not_cancel_batch(self, flash_service):
+        """A failing request should be skipped while the others succeed."""
+        flash_service.gemini_client.generate_content_stream.side_effect = [
+            iter([Mock()]),
+            RuntimeError("API error"),
+            iter([Mock()]),
+        ]
+
+        images, metadata = flash_service._generation_loop(
+            contents=["prompt"],
+            n=3,
+            prompt="prompt",
+            gen_config=None,
+            use_storage=False,
+            progress=Mock(),
+        )
+
+        assert len(images) == 2
+        assert [m["response_index"] for m in metadata] == [1, 3]
+
+    def test_processes_every_image_in_streamed_chunks(self, flash_service):
+        """Images from every streamed chunk should be processed in arrival order."""
+        flash_service.gemini_client.generate_content_stream.side_effect = None
+        flash_service.gemini_client.generate_content_stream.return_value = iter([Mock(), Mock()])
+        flash_service.gemini_client.extract_images.side_effect = [[b"first"], [b"second"]]
+
+        images, metadata = flash_service._generation_loop(
+            contents=["prompt"],
+            n=1,
+            prompt="prompt",
+            gen_config=None,
+            use_storage=False,
+            progress=Mock(),
+        )
+
+        assert [image.data for image in images] == [b"first", b"second"]
+        assert [m["image_index"] for m in metadata] == [1, 2]
+
+    def test_stream_error_keeps_already_submitted_images(self, flash_service):
+        """Images streamed before a mid-stream failure should still be returned."""
+
+        def failing_stream(*args, **kwargs):
+            yield Mock()
+            raise RuntimeError("stream dropped")
+
+        flash_service.gemini_client.generate_content_stream.side_effect = failing_stream
+        flash_service.gemini_client.extract_images.return_value = [b"partial"]
+
+        images, metadata = flash_service._generation_loop(
+            contents=["prompt"],
+            n=1,
+            prompt="prompt",
+            gen_config=None,
+            use_storage=False,
+            progress=Mock(),
+        )
+
+        assert [image.data for image in images] == [b"partial"]
+        assert [m["image_index"] for m in metadata] == [1]
+
+    def test_single_image_response_sends_one_progress_update(self, flash_service):
+        """Per-image updates at the same percentage should be coalesced."""
+        progress = Mock()
+
+        flash_service._generation_loop(
+            contents=["prompt"],
+            n=1,
+            prompt="prompt",
+            gen_config=None,
+            use_storage=False,
+            progress=progress,
+        )
+
+        progress.update.assert_called_once_with(20, "Generating image 1/1...")
+
+    def test_runs_inside_running_event_loop(self, flash_service):
+        """The sync shim should work when called from within an event loop."""
+
+        async def call_from_loop():
+            return flash_service._generation_loop(
+                contents=["prompt"],
+                n=2,
+                prompt="prompt",
+                gen_config=None,
+                use_storage=False,
+                progress=Mock(),
+            )
+
+        images, _ = asyncio.run(call_from_loop())
+
+        assert len(images) == 2
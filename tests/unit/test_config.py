@@ -38,6 +38,20 @@ class TestConfigurationLoading:
     - Raise ValueError when neither API key is set
     """
 
+    @pytest.fixture
+    def env_keys(self, monkeypatch):
+        """Return a setter that updates only the given environment variables.
+
+        monkeypatch restores them after the test, so callers avoid snapshotting
+        and restoring the whole environment as ``patch.dict`` does.
+        """
+
+        def set_keys(values: dict[str, str]) -> None:
+            for key, value in values.items():
+                monkeypatch.setenv(key, value)
+
+        return set_keys
+
     def test_from_env_with_gemini_api_key(self, tmp_path):
         """
         **Feature: service-layer-refactoring, Property 13: Configuration Loading**
@@ -57,31 +71,20 @@ class TestConfigurationLoading:
             assert config.gemini_api_key == "test-api-key-12345"
             assert config.server_name == "banana-image-mcp"
 
-    def test_from_env_with_google_api_key(self, tmp_path):
+    def test_from_env_with_google_api_key(self, tmp_path, monkeypatch):
         """
         **Feature: service-layer-refactoring, Property 13: Configuration Loading**
 
         Should return valid config when GOOGLE_API_KEY is set.
         """
-        with patch.dict(
-            os.environ,
-            {
-                "GOOGLE_API_KEY": "google-api-key-67890",
-                "IMAGE_OUTPUT_DIR": str(tmp_path),
-            },
-            clear=False,
-        ):
-            # Remove GEMINI_API_KEY if present
-            env = os.environ.copy()
-            env.pop("GEMINI_API_KEY", None)
-
-            with patch.dict(os.environ, env, clear=True):
-                os.environ["GOOGLE_API_KEY"] = "google-api-key-67890"
-                os.environ["IMAGE_OUTPUT_DIR"] = str(tmp_path)
+        # Remove GEMINI_API_KEY if present
+        monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+        monkeypatch.setenv("GOOGLE_API_KEY", "google-api-key-67890")
+        monkeypatch.setenv("IMAGE_OUTPUT_DIR", str(tmp_path))
 
-                config = ServerConfig.from_env()
+        config = ServerConfig.from_env()
 
-                assert config.gemini_api_key == "google-api-key-67890"
+        assert config.gemini_api_key == "google-api-key-67890"
 
     def test_from_env_without_api_key_raises_error(self, tmp_path):
         """
@@ -124,86 +127,106 @@ class TestConfigurationLoading:
             assert output_dir.exists()
             assert config.image_output_dir == str(output_dir)
 
+    @pytest.mark.parametrize(("value", "expected"), [("true", True), ("FALSE", False)])
+    def test_from_env_response_toggles(self, tmp_path, value: str, expected: bool):
+        """BANANA_MCP_TEXT_SUMMARY and BANANA_MCP_INLINE_THUMBNAILS should be honored."""
+        with patch.dict(
+            os.environ,
+            {
+                "GEMINI_API_KEY": "test-key",
+                "IMAGE_OUTPUT_DIR": str(tmp_path),
+                "BANANA_MCP_TEXT_SUMMARY": value,
+                "BANANA_MCP_INLINE_THUMBNAILS": value,
+            },
+            clear=False,
+        ):
+            config = ServerConfig.from_env()
+
+            assert config.text_summary is expected
+            assert config.inline_thumbnails is expected
+
     @given(
         transport=st.sampled_from(["stdio", "http"]),
         port=st.integers(min_value=1024, max_value=65535),
     )
     @settings(
-        max_examples=20,
         suppress_health_check=[HealthCheck.function_scoped_fixture],
     )
-    def test_from_env_respects_transport_settings(self, tmp_path, transport: str, port: int):
+    def test_from_env_respects_transport_settings(
+        self, env_keys, tmp_path, transport: str, port: int
+    ):
         """
         **Feature: service-layer-refactoring, Property 13: Configuration Loading**
 
         Should respect transport and port settings from environment.
         """
-        with patch.dict(
-            os.environ,
+        env_keys(
             {
                 "GEMINI_API_KEY": "test-key",
                 "IMAGE_OUTPUT_DIR": str(tmp_path),
                 "FASTMCP_TRANSPORT": transport,
                 "FASTMCP_PORT": str(port),
-            },
-            clear=False,
-        ):
-            config = ServerConfig.from_env()
+            }
+        )
+        config = ServerConfig.from_env()
 
-            assert config.transport == transport
-            assert config.port == port
+        assert config.transport == transport
+        assert config.port == port
 
 
 class TestBaseModelConfigInheritance:
     """Test that model configs properly inherit from BaseModelConfig."""
 
-    def test_flash_config_inherits_base_fields(self):
+    @pytest.mark.parametrize(
+        ("config_cls", "timeout", "model_name", "max_resolution", "supports_thinking"),
+        [
+            (FlashImageConfig, 60, "gemini-2.5-flash-image", 1024, False),
+            # Pro has a longer timeout
+            (ProImageConfig, 90, "gemini-3-pro-image-preview", 3840, True),
+        ],
+    )
+    def test_config_inherits_base_fields(
+        self,
+        config_cls: type[BaseModelConfig],
+        timeout: int,
+        model_name: str,
+        max_resolution: int,
+        supports_thinking: bool,
+    ):
         """
         **Feature: service-layer-refactoring, Property 13: Configuration Loading**
 
-        FlashImageConfig should inherit BaseModelConfig fields.
+        Flash and Pro configs should be BaseModelConfigs and inherit its fields.
         """
-        config = FlashImageConfig()
+        config = config_cls()
+
+        assert isinstance(config, BaseModelConfig)
 
         # Base fields
         assert config.max_images_per_request == 4
         assert config.max_inline_image_size == 20 * 1024 * 1024
         assert config.default_image_format == "png"
-        assert config.request_timeout == 60
+        assert config.request_timeout == timeout
 
-        # Flash-specific fields
-        assert config.model_name == "gemini-2.5-flash-image"
-        assert config.max_resolution == 1024
-        assert config.supports_thinking is False
+        # Model-specific fields
+        assert config.model_name == model_name
+        assert config.max_resolution == max_resolution
+        assert config.supports_thinking is supports_thinking
 
-    def test_pro_config_inherits_base_fields(self):
-        """
-        **Feature: service-layer-refactoring, Property 13: Configuration Loading**
-
-        ProImageConfig should inherit BaseModelConfig fields.
-        """
-        config = ProImageConfig()
-
-        # Base fields (with Pro override for timeout)
-        assert config.max_images_per_request == 4
-        assert config.max_inline_image_size == 20 * 1024 * 1024
-        assert config.default_image_format == "png"
-        assert config.request_timeout == 90  # Pro has longer timeout
+    @pytest.mark.parametrize(("raw", "expected"), [("", 5), ("  ", 5), ("8", 8), (" 2 ", 2)])
+    def test_concurrency_from_env(self, monkeypatch, raw: str, expected: int):
+        """BANANA_MCP_CONCURRENCY should set the limit, defaulting when blank."""
+        monkeypatch.setenv("BANANA_MCP_CONCURRENCY", raw)
 
-        # Pro-specific fields
-        assert config.model_name == "gemini-3-pro-image-preview"
-        assert config.max_resolution == 3840
-        assert config.supports_thinking is True
+        assert FlashImageConfig().max_concurrent_generations == expected
 
-    def test_flash_config_is_instance_of_base(self):
-        """FlashImageConfig should be instance of BaseModelConfig."""
-        config = FlashImageConfig()
-        assert isinstance(config, BaseModelConfig)
+    @pytest.mark.parametrize("raw", ["abc", "2.5", "0", "-1"])
+    def test_invalid_concurrency_names_the_variable(self, monkeypatch, raw: str):
+        """A bad BANANA_MCP_CONCURRENCY should fail with a message naming it."""
+        monkeypatch.setenv("BANANA_MCP_CONCURRENCY", raw)
 
-    def test_pro_config_is_instance_of_base(self):
-        """ProImageConfig should be instance of BaseModelConfig."""
-        config = ProImageConfig()
-        assert isinstance(config, BaseModelConfig)
+        with pytest.raises(ValueError, match="BANANA_MCP_CONCURRENCY must be a positive integer"):
+            FlashImageConfig()
 
 
 class TestModelSelectionConfigLoading:
@@ -221,7 +244,6 @@ class TestModelSelectionConfigLoading:
             assert config.default_tier == ModelTier.AUTO
 
     @given(tier=st.sampled_from(["flash", "pro", "auto"]))
-    @settings(max_examples=10)
     def test_from_env_respects_model_tier(self, tier: str):
         """
         **Feature: service-layer-refactoring, Property 13: Configuration Loading**
@@ -0,0 +1,105 @@
+"""
+Tests for the concurrent generation path of EnhancedImageService.
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from banana_image_mcp.services.enhanced_image_service import EnhancedImageService
+
+
+def _make_service(tmp_path, limit: int) -> EnhancedImageService:
+    """Build an EnhancedImageService over mocked collaborators."""
+    client = Mock()
+    client.extract_images.return_value = [b"image"]
+    return EnhancedImageService(
+        gemini_client=client,
+        files_api_service=Mock(),
+        db_service=Mock(),
+        config=Mock(default_image_format="png"),
+        out_dir=str(tmp_path),
+        max_concurrent_generations=limit,
+    )
+
+
+class TestConcurrentGeneration:
+    """generate_images SHALL overlap API calls with each other and with processing."""
+
+    def test_api_calls_stay_within_limit(self, tmp_path):
+        """Requests should run concurrently without exceeding the configured limit."""
+        service = _make_service(tmp_path, limit=2)
+        lock = threading.Lock()
+        in_flight = peak = 0
+
+        def generate_content(*args, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            return Mock()
+
+        service.gemini_client.generate_content.side_effect = generate_content
+        service._process_generated_image = Mock(
+            side_effect=lambda image_bytes, i, j, *args: (Mock(), {"response_index": i})
+        )
+
+        images, metadata = service.generate_images("prompt", n=5)
+
+        assert len(images) == 5
+        assert [m["response_index"] for m in metadata] == [1, 2, 3, 4, 5]
+        assert peak == 2
+
+    def test_processing_overlaps_next_api_call(self, tmp_path):
+        """The next API call should start while an earlier image is still being processed."""
+        service = _make_service(tmp_path, limit=2)
+        lock = threading.Lock()
+        calls = 0
+        second_call_started = threading.Event()
+
+        def generate_content(*args, **kwargs):
+            nonlocal calls
+            with lock:
+                calls += 1
+                if calls == 2:
+                    second_call_started.set()
+            return Mock()
+
+        def process(image_bytes, response_index, *args):
+            # Only returns once another API call has begun mid-processing
+            overlapped = response_index != 1 or second_call_started.wait(timeout=2)
+            return Mock(), {"overlapped": overlapped}
+
+        service.gemini_client.generate_content.side_effect = generate_content
+        service._process_generated_image = Mock(side_effect=process)
+
+        _, metadata = service.generate_images("prompt", n=2)
+
+        assert [m["overlapped"] for m in metadata] == [True, True]
+
+    def test_failed_request_is_skipped(self, tmp_path):
+        """A failing API call should not cancel the rest of the batch."""
+        service = _make_service(tmp_path, limit=1)
+        service.gemini_client.generate_content.side_effect = [
+            Mock(),
+            RuntimeError("API error"),
+            Mock(),
+        ]
+        service._process_generated_image = Mock(
+            side_effect=lambda image_bytes, i, j, *args: (Mock(), {"response_index": i})
+        )
+
+        _, metadata = service.generate_images("prompt", n=3)
+
+        assert [m["response_index"] for m in metadata] == [1, 3]
+
+
+@pytest.mark.parametrize("limit", [0, -3])
+def test_limit_is_clamped_to_one(tmp_path, limit: int):
+    """A non-positive limit should still allow one request at a time."""
+    assert _make_service(tmp_path, limit).max_concurrent_generations == 1
@@ -9,8 +9,11 @@ This module tests:
 - Property 12: ValidationError Context Population
 """
 
+import json
+
 from hypothesis import given, settings
 from hypothesis import strategies as st
+import pytest
 
 from banana_image_mcp.core.exceptions import (
     ConfigurationError,
@@ -27,18 +30,22 @@ from banana_image_mcp.core.exceptions import (
 # =============================================================================
 
 # Strategy for generating error codes
-error_code_strategy = st.sampled_from(list(ErrorCode))
+_ERROR_CODES = tuple(ErrorCode)
+error_code_strategy = st.sampled_from(_ERROR_CODES)
+
+# Character sets and scalar values shared by the strategies below
+_ALPHANUM = st.characters(whitelist_categories=("L", "N"))
+_FIELD_ALPHA = st.characters(whitelist_categories=("L", "N", "Pc"))
+_NUMBER_OR_BOOL = st.one_of(
+    st.integers(),
+    st.floats(allow_nan=False, allow_infinity=False),
+    st.booleans(),
+)
 
 # Strategy for generating context dictionaries
 context_strategy = st.dictionaries(
-    keys=st.text(min_size=1, max_size=20, alphabet=st.characters(whitelist_categories=("L", "N"))),
-    values=st.one_of(
-        st.text(max_size=50),
-        st.integers(),
-        st.floats(allow_nan=False, allow_infinity=False),
-        st.booleans(),
-        st.none(),
-    ),
+    keys=st.text(min_size=1, max_size=20, alphabet=_ALPHANUM),
+    values=st.one_of(st.text(max_size=50), _NUMBER_OR_BOOL, st.none()),
     max_size=5,
 )
 
@@ -46,30 +53,23 @@ context_strategy = st.dictionaries(
 message_strategy = st.text(min_size=1, max_size=200)
 
 # Strategy for generating field names
-field_strategy = st.text(
-    min_size=1, max_size=50, alphabet=st.characters(whitelist_categories=("L", "N", "Pc"))
-)
+field_strategy = st.text(min_size=1, max_size=50, alphabet=_FIELD_ALPHA)
 
 # Strategy for generating field values (various types, excluding None)
 value_strategy = st.one_of(
     st.text(min_size=1, max_size=150),
-    st.integers(),
-    st.floats(allow_nan=False, allow_infinity=False),
-    st.booleans(),
+    _NUMBER_OR_BOOL,
     st.lists(st.integers(), min_size=1, max_size=5),
 )
 
 # Strategy for generating field values including None
 value_strategy_with_none = st.one_of(
     st.text(max_size=150),
-    st.integers(),
-    st.floats(allow_nan=False, allow_infinity=False),
-    st.booleans(),
+    _NUMBER_OR_BOOL,
     st.none(),
     st.lists(st.integers(), max_size=5),
 )
 
-
 # =============================================================================
 # Property 11: Exception Serialization Round-Trip
 # =============================================================================
@@ -90,7 +90,6 @@ class TestExceptionSerializationRoundTrip:
         error_code=st.one_of(st.none(), error_code_strategy),
         context=st.one_of(st.none(), context_strategy),
     )
-    @settings(max_examples=100)
     def test_to_dict_contains_all_information(
         self,
         message: str,
@@ -134,7 +133,6 @@ class TestExceptionSerializationRoundTrip:
         message=message_strategy,
         error_code=error_code_strategy,
     )
-    @settings(max_examples=100)
     def test_str_format_with_error_code(self, message: str, error_code: ErrorCode):
         """
         **Feature: service-layer-refactoring, Property 11: Exception Serialization Round-Trip**
@@ -147,8 +145,15 @@ class TestExceptionSerializationRoundTrip:
 
         assert result == f"[{error_code.value}] {message}"
 
+    @given(message=message_strategy, error_code=error_code_strategy)
+    def test_to_dict_code_is_json_serializable(self, message: str, error_code: ErrorCode):
+        """to_dict() codes are plain strings that encode without a custom hook."""
+        result = NanoBananaError(message=message, error_code=error_code).to_dict()
+
+        assert type(result["code"]) is str
+        assert json.loads(json.dumps(result))["code"] == error_code.value
+
     @given(message=message_strategy)
-    @settings(max_examples=100)
     def test_str_format_without_error_code(self, message: str):
         """
         **Feature: service-layer-refactoring, Property 11: Exception Serialization Round-Trip**
@@ -166,7 +171,6 @@ class TestExceptionSerializationRoundTrip:
         error_code=st.one_of(st.none(), error_code_strategy),
         context=st.one_of(st.none(), context_strategy),
     )
-    @settings(max_examples=100)
     def test_to_dict_with_cause_exception(
         self,
         message: str,
@@ -195,56 +199,32 @@ class TestExceptionSerializationRoundTrip:
 class TestSubclassSerializationRoundTrip:
     """Test that all exception subclasses properly serialize."""
 
-    @given(
-        message=message_strategy,
-        error_code=st.one_of(st.none(), error_code_strategy),
+    @pytest.mark.parametrize(
+        ("error_cls", "type_name"),
+        [
+            (ConfigurationError, "ConfigurationError"),
+            (GeminiAPIError, "GeminiAPIError"),
+            (ImageProcessingError, "ImageProcessingError"),
+            (FileOperationError, "FileOperationError"),
+        ],
     )
-    @settings(max_examples=50)
-    def test_configuration_error_serialization(self, message: str, error_code: ErrorCode | None):
-        """ConfigurationError should serialize correctly."""
-        error = ConfigurationError(message=message, error_code=error_code)
-        result = error.to_dict()
-
-        assert result["type"] == "ConfigurationError"
-        assert result["message"] == message
-
     @given(
         message=message_strategy,
         error_code=st.one_of(st.none(), error_code_strategy),
     )
-    @settings(max_examples=50)
-    def test_gemini_api_error_serialization(self, message: str, error_code: ErrorCode | None):
-        """GeminiAPIError should serialize correctly."""
-        error = GeminiAPIError(message=message, error_code=error_code)
-        result = error.to_dict()
-
-        assert result["type"] == "GeminiAPIError"
-        assert result["message"] == message
-
-    @given(
-        message=message_strategy,
-        error_code=st.one_of(st.none(), error_code_strategy),
-    )
-    @settings(max_examples=50)
-    def test_image_processing_error_serialization(self, message: str, error_code: ErrorCode | None):
-        """ImageProcessingError should serialize correctly."""
-        error = ImageProcessingError(message=message, error_code=error_code)
-        result = error.to_dict()
-
-        assert result["type"] == "ImageProcessingError"
-        assert result["message"] == message
-
-    @given(
-        message=message_strategy,
-        error_code=st.one_of(st.none(), error_code_strategy),
-    )
-    @settings(max_examples=50)
-    def test_file_operation_error_serialization(self, message: str, error_code: ErrorCode | None):
-        """FileOperationError should serialize correctly."""
-        error = FileOperationError(message=message, error_code=error_code)
+    @settings(deadline=None)
+    def test_subclass_serialization(
+        self,
+        error_cls: type[NanoBananaError],
+        type_name: str,
+        message: str,
+        error_code: ErrorCode | None,
+    ):
+        """Each exception subclass should serialize with its own type name."""
+        error = error_cls(message=message, error_code=error_code)
         result = error.to_dict()
 
-        assert result["type"] == "FileOperationError"
+        assert result["type"] == type_name
         assert result["message"] == message
 
 
@@ -262,12 +242,14 @@ class TestValidationErrorContextPopulation:
     keys with the provided values.
     """
 
+    # 200 characters, twice the context truncation limit
+    LONG_VALUE = "x" * 200
+
     @given(
         message=message_strategy,
         field=field_strategy,
         value=value_strategy,
     )
-    @settings(max_examples=100)
     def test_field_and_value_in_context(
         self,
         message: str,
@@ -311,7 +293,6 @@ class TestValidationErrorContextPopulation:
         ),
         extra_context=context_strategy,
     )
-    @settings(max_examples=100)
     def test_field_and_value_merged_with_existing_context(
         self,
         message: str,
@@ -341,7 +322,6 @@ class TestValidationErrorContextPopulation:
                 assert error.context[key] == val
 
     @given(message=message_strategy)
-    @settings(max_examples=50)
     def test_none_field_not_in_context(self, message: str):
         """
         **Feature: service-layer-refactoring, Property 12: ValidationError Context Population**
@@ -357,7 +337,6 @@ class TestValidationErrorContextPopulation:
         message=message_strategy,
         field=field_strategy,
     )
-    @settings(max_examples=50)
     def test_field_only_in_context(self, message: str, field: str):
         """
         **Feature: service-layer-refactoring, Property 12: ValidationError Context Population**
@@ -370,23 +349,20 @@ class TestValidationErrorContextPopulation:
         assert error.context["field"] == field
         assert "value" not in error.context
 
-    @given(message=message_strategy)
-    @settings(max_examples=50)
-    def test_long_value_truncation(self, message: str):
+    def test_long_value_truncation(self):
         """
         **Feature: service-layer-refactoring, Property 12: ValidationError Context Population**
 
         Long values should be truncated to 100 characters.
         """
-        long_value = "x" * 200  # 200 character string
-        error = ValidationError(message=message, field="test_field", value=long_value)
+        error = ValidationError(message="Invalid value", field="test_field", value=self.LONG_VALUE)
 
         # Value in context should be truncated
         assert len(error.context["value"]) == 100
         assert error.context["value"] == "x" * 100
 
         # Original value should be preserved in attribute
-        assert error.value == long_value
+        assert error.value == self.LONG_VALUE
 
     @given(
         message=message_strategy,
@@ -394,7 +370,6 @@ class TestValidationErrorContextPopulation:
         field=field_strategy,
         value=value_strategy,
     )
-    @settings(max_examples=100)
     def test_validation_error_to_dict_includes_context(
         self,
         message: str,
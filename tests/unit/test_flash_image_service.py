@@ -9,28 +9,19 @@ This module tests:
 - Property 2: Flash Service Behavior Consistency
 """
 
-from hypothesis import HealthCheck, given, settings
-from hypothesis import strategies as st
+from hypothesis import given
 import pytest
 
 from banana_image_mcp.services.base_image_service import BaseImageService
 from banana_image_mcp.services.flash_image_service import FlashImageService
+from tests.strategies import aspect_ratio_strategy, index_strategy, prompt_strategy
 
 # =============================================================================
-# Hypothesis Strategies
+# Test Values
 # =============================================================================
 
-# Strategy for generating prompts
-prompt_strategy = st.text(min_size=1, max_size=200)
-
-# Strategy for generating response/image indices
-index_strategy = st.integers(min_value=1, max_value=10)
-
-# Strategy for aspect ratios
-aspect_ratio_strategy = st.one_of(
-    st.none(),
-    st.sampled_from(["1:1", "16:9", "9:16", "4:3", "3:4"]),
-)
+# Representative prompts for the pass-through checks
+SAMPLE_PROMPTS = ["", "a", "unicode 🎨 prompt", "  padded  ", "x" * 200]
 
 
 # =============================================================================
@@ -119,13 +110,15 @@ class TestFlashServiceBehaviorConsistency:
     - `_enhance_prompt(prompt)` SHALL return the original prompt unchanged
     """
 
-    @pytest.fixture
-    def flash_service(self, mock_flash_gemini_client, mock_flash_config, mock_storage_service):
-        """Create a FlashImageService for testing."""
+    @pytest.fixture(scope="class")
+    def flash_service(
+        self, mock_flash_gemini_client_factory, mock_flash_config, mock_storage_service_factory
+    ):
+        """Create one FlashImageService for the class; the tests only read from it."""
         return FlashImageService(
-            gemini_client=mock_flash_gemini_client,
+            gemini_client=mock_flash_gemini_client_factory(),
             config=mock_flash_config,
-            storage_service=mock_storage_service,
+            storage_service=mock_storage_service_factory(),
         )
 
     def test_build_generation_config_returns_empty_dict(self, flash_service):
@@ -144,10 +137,6 @@ class TestFlashServiceBehaviorConsistency:
         response_index=index_strategy,
         image_index=index_strategy,
     )
-    @settings(
-        max_examples=100,
-        suppress_health_check=[HealthCheck.function_scoped_fixture],
-    )
     def test_build_metadata_includes_required_fields(
         self,
         flash_service,
@@ -182,10 +171,6 @@ class TestFlashServiceBehaviorConsistency:
         image_index=index_strategy,
         aspect_ratio=aspect_ratio_strategy,
     )
-    @settings(
-        max_examples=100,
-        suppress_health_check=[HealthCheck.function_scoped_fixture],
-    )
     def test_build_metadata_with_optional_fields(
         self,
         flash_service,
@@ -213,11 +198,20 @@ class TestFlashServiceBehaviorConsistency:
         assert metadata["negative_prompt"] == "avoid blur"
         assert metadata["system_instruction"] == "be creative"
 
-    @given(prompt=prompt_strategy)
-    @settings(
-        max_examples=100,
-        suppress_health_check=[HealthCheck.function_scoped_fixture],
-    )
+    def test_build_metadata_is_read_only_mapping(self, flash_service):
+        """Metadata should be an immutable record that still reads like a dict."""
+        metadata = flash_service._build_metadata(prompt="cat", response_index=1, image_index=2)
+
+        with pytest.raises(AttributeError):
+            metadata.prompt = "dog"
+
+        as_dict = metadata.to_dict()
+        assert type(as_dict) is dict
+        assert as_dict == metadata
+        assert metadata.get("image_index") == 2
+        assert "missing" not in metadata
+
+    @pytest.mark.parametrize("prompt", SAMPLE_PROMPTS)
     def test_enhance_prompt_returns_unchanged(self, flash_service, prompt: str):
         """
         **Feature: service-layer-refactoring, Property 2: Flash Service Behavior Consistency**
@@ -228,11 +222,7 @@ class TestFlashServiceBehaviorConsistency:
 
         assert result == prompt
 
-    @given(prompt=prompt_strategy)
-    @settings(
-        max_examples=50,
-        suppress_health_check=[HealthCheck.function_scoped_fixture],
-    )
+    @pytest.mark.parametrize("prompt", SAMPLE_PROMPTS)
     def test_enhance_prompt_ignores_kwargs(self, flash_service, prompt: str):
         """
         **Feature: service-layer-refactoring, Property 2: Flash Service Behavior Consistency**
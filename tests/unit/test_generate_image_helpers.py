@@ -12,44 +12,42 @@ This module tests:
 - Property 10: Response Building
 """
 
+import itertools
+import logging
+import mimetypes
 import os
-import tempfile
 
-from hypothesis import HealthCheck, given, settings
+from hypothesis import given
 from hypothesis import strategies as st
 import pytest
 
 from banana_image_mcp.config.settings import ModelTier
 from banana_image_mcp.core.exceptions import ValidationError
+from banana_image_mcp.tools import generate_image
 from banana_image_mcp.tools.generate_image import (
+    _build_resource_links,
+    _build_short_summary,
     _build_structured_content,
     _build_summary,
-    _collect_input_paths,
+    _collect_and_validate,
     _detect_mode,
-    _validate_inputs,
+    _ext_to_mime,
+    _load_input_images_raw,
+    _read_file_bytes,
 )
 
 # =============================================================================
-# Hypothesis Strategies
+# Test Values and Hypothesis Strategies
 # =============================================================================
 
-# Strategy for generating file paths (non-empty strings)
-path_strategy = st.text(
-    min_size=1,
-    max_size=100,
-    alphabet=st.characters(whitelist_categories=("L", "N", "Pc"), whitelist_characters="/-_."),
-)
-
-# Strategy for optional paths
-optional_path_strategy = st.one_of(st.none(), path_strategy)
+# Valid mode values
+VALID_MODES = ["auto", "generate", "edit"]
 
-# Strategy for mode values
-mode_strategy = st.sampled_from(["auto", "generate", "edit"])
+# Near-miss and arbitrary invalid mode values
+INVALID_MODES = ["", "EDIT", "auto ", "xxx", "generate2"]
 
-# Strategy for invalid mode values
-invalid_mode_strategy = st.text(min_size=1, max_size=20).filter(
-    lambda x: x not in ["auto", "generate", "edit"]
-)
+# Strategy for explicit (non-auto) modes
+explicit_mode_strategy = st.sampled_from(["edit", "generate"])
 
 # Strategy for file IDs
 file_id_strategy = st.one_of(
@@ -58,6 +56,25 @@ file_id_strategy = st.one_of(
 )
 
 
+# Contents of the placeholder input images
+DUMMY_IMAGE_BYTES = b"fake image data"
+
+
+@pytest.fixture(scope="module")
+def dummy_image_files(tmp_path_factory):
+    """Create three placeholder image files once for the validation tests.
+
+    Validation only stats the paths, so only the first file (whose size is
+    asserted) gets contents; the rest are left empty.
+    """
+    directory = tmp_path_factory.mktemp("images")
+    paths = [directory / f"image_{i}.png" for i in range(3)]
+    paths[0].write_bytes(DUMMY_IMAGE_BYTES)
+    for path in paths[1:]:
+        path.touch()
+    return [str(path) for path in paths]
+
+
 # =============================================================================
 # Property 6: Input Path Collection
 # =============================================================================
@@ -67,37 +84,30 @@ class TestInputPathCollection:
     """
     **Feature: service-layer-refactoring, Property 6: Input Path Collection**
 
-    *For any* combination of three optional path strings, `_collect_input_paths()`
-    SHALL return a list containing only the non-None values, or None if all inputs are None.
+    *For any* combination of three optional path strings, `_collect_and_validate()`
+    SHALL return only the non-None paths in slot order, or None if all inputs are None.
     """
 
-    @given(
-        path1=optional_path_strategy,
-        path2=optional_path_strategy,
-        path3=optional_path_strategy,
+    @pytest.mark.parametrize(
+        "paths",
+        list(itertools.product([None, "/a.png"], [None, "/b.png"], [None, "/c.png"])),
     )
-    @settings(max_examples=100)
     def test_collects_non_none_paths(
-        self,
-        path1: str | None,
-        path2: str | None,
-        path3: str | None,
+        self, dummy_image_files, paths: tuple[str | None, str | None, str | None]
     ):
         """
         **Feature: service-layer-refactoring, Property 6: Input Path Collection**
 
-        Should return list of non-None paths.
+        Should return list of non-None paths for every None/not-None combination.
         """
-        result = _collect_input_paths(path1, path2, path3)
+        slots = [dummy_image_files[i] if p else None for i, p in enumerate(paths)]
+
+        result = _collect_and_validate(*slots, "auto", None)
 
-        # Count non-None inputs
-        non_none_inputs = [p for p in [path1, path2, path3] if p]
+        non_none_inputs = [p for p in slots if p]
 
         if non_none_inputs:
-            assert result is not None
-            assert len(result) == len(non_none_inputs)
-            for p in non_none_inputs:
-                assert p in result
+            assert [p for p, _ in result] == non_none_inputs
         else:
             assert result is None
 
@@ -107,26 +117,27 @@ class TestInputPathCollection:
 
         Should return None when all inputs are None.
         """
-        result = _collect_input_paths(None, None, None)
+        result = _collect_and_validate(None, None, None, "auto", None)
         assert result is None
 
-    def test_single_path_returns_list(self):
+    def test_single_path_returns_list(self, dummy_image_files):
         """
         **Feature: service-layer-refactoring, Property 6: Input Path Collection**
 
         Should return list with single path.
         """
-        result = _collect_input_paths("/path/to/image.png", None, None)
-        assert result == ["/path/to/image.png"]
+        result = _collect_and_validate(dummy_image_files[0], None, None, "auto", None)
+        assert [p for p, _ in result] == dummy_image_files[:1]
 
-    def test_preserves_order(self):
+    def test_preserves_order(self, dummy_image_files):
         """
         **Feature: service-layer-refactoring, Property 6: Input Path Collection**
 
         Should preserve order of paths.
         """
-        result = _collect_input_paths("/first.png", "/second.png", "/third.png")
-        assert result == ["/first.png", "/second.png", "/third.png"]
+        first, second, third = dummy_image_files[2::-1]
+        result = _collect_and_validate(first, second, third, "auto", None)
+        assert [p for p, _ in result] == [first, second, third]
 
 
 # =============================================================================
@@ -145,8 +156,7 @@ class TestInputValidation:
     - Valid inputs SHALL not raise any exception
     """
 
-    @given(mode=invalid_mode_strategy)
-    @settings(max_examples=50)
+    @pytest.mark.parametrize("mode", INVALID_MODES)
     def test_invalid_mode_raises_error(self, mode: str):
         """
         **Feature: service-layer-refactoring, Property 7: Input Validation**
@@ -154,12 +164,11 @@ class TestInputValidation:
         Invalid mode values should raise ValidationError.
         """
         with pytest.raises(ValidationError) as exc_info:
-            _validate_inputs(mode, None, None)
+            _collect_and_validate(None, None, None, mode, None)
 
         assert "mode" in str(exc_info.value).lower() or exc_info.value.field == "mode"
 
-    @given(mode=mode_strategy)
-    @settings(max_examples=50)
+    @pytest.mark.parametrize("mode", VALID_MODES)
     def test_valid_mode_no_error(self, mode: str):
         """
         **Feature: service-layer-refactoring, Property 7: Input Validation**
@@ -167,7 +176,7 @@ class TestInputValidation:
         Valid mode values should not raise error.
         """
         # Should not raise
-        _validate_inputs(mode, None, None)
+        _collect_and_validate(None, None, None, mode, None)
 
     def test_nonexistent_path_raises_error(self):
         """
@@ -176,43 +185,124 @@ class TestInputValidation:
         Non-existent paths should raise ValidationError.
         """
         with pytest.raises(ValidationError) as exc_info:
-            _validate_inputs("auto", ["/nonexistent/path/image.png"], None)
+            _collect_and_validate("/nonexistent/path/image.png", None, None, "auto", None)
 
         assert "not found" in str(exc_info.value).lower()
 
-    def test_exceeding_max_images_raises_error(self):
+    def test_exceeding_max_images_raises_error(self, dummy_image_files, monkeypatch):
         """
         **Feature: service-layer-refactoring, Property 7: Input Validation**
 
         Exceeding MAX_INPUT_IMAGES should raise ValidationError.
         """
-        # Create temporary files
-        with tempfile.TemporaryDirectory() as tmpdir:
-            paths = []
-            for i in range(10):  # More than MAX_INPUT_IMAGES (3)
-                path = os.path.join(tmpdir, f"image_{i}.png")
-                with open(path, "wb") as f:
-                    f.write(b"fake image data")
-                paths.append(path)
+        from banana_image_mcp.core.exceptions import ErrorCode
 
-            with pytest.raises(ValidationError) as exc_info:
-                _validate_inputs("auto", paths, None)
+        # The tool has three slots, so lower the limit to exceed it
+        monkeypatch.setattr(generate_image, "MAX_INPUT_IMAGES", 2)
 
-            assert "maximum" in str(exc_info.value).lower()
+        with pytest.raises(ValidationError) as exc_info:
+            _collect_and_validate(*dummy_image_files, "auto", None)
 
-    def test_valid_existing_paths_no_error(self):
+        assert exc_info.value.error_code == ErrorCode.VALIDATION_FILE_COUNT_EXCEEDED
+        assert "maximum 2" in str(exc_info.value).lower()
+
+    def test_directory_path_raises_error(self, dummy_image_files):
+        """A directory passed as an input image should be rejected as not a file."""
+        from banana_image_mcp.core.exceptions import ErrorCode
+
+        with pytest.raises(ValidationError) as exc_info:
+            _collect_and_validate(os.path.dirname(dummy_image_files[0]), None, None, "auto", None)
+
+        assert exc_info.value.error_code == ErrorCode.VALIDATION_INVALID_PATH
+
+    def test_valid_existing_paths_no_error(self, dummy_image_files):
         """
         **Feature: service-layer-refactoring, Property 7: Input Validation**
 
         Valid existing paths should not raise error.
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = os.path.join(tmpdir, "test_image.png")
-            with open(path, "wb") as f:
-                f.write(b"fake image data")
+        # Should not raise
+        _collect_and_validate(dummy_image_files[0], None, None, "auto", None)
+
+    def test_collect_and_validate_returns_stats(self, dummy_image_files):
+        """Collected paths should keep their slot order and carry their stat."""
+        path = dummy_image_files[0]
+
+        inputs = _collect_and_validate(None, path, None, "auto", None)
+
+        assert [p for p, _ in inputs] == [path]
+        assert inputs[0][1].st_size == len(DUMMY_IMAGE_BYTES)
+        assert _collect_and_validate(None, None, None, "auto", None) is None
+
+    def test_collect_and_validate_reports_slot(self):
+        """Errors should name the input slot the bad path came from."""
+        with pytest.raises(ValidationError) as exc_info:
+            _collect_and_validate(None, None, "/nonexistent/image.png", "auto", None)
 
-            # Should not raise
-            _validate_inputs("auto", [path], None)
+        assert exc_info.value.field == "input_image_path_3"
+
+
+# =============================================================================
+# Input Image Loading
+# =============================================================================
+
+
+class TestInputImageLoading:
+    """Input images SHALL be loaded as (raw_bytes, mime_type) tuples in order."""
+
+    def test_loads_images_with_mime_types(self, tmp_path):
+        """Each path should yield its bytes and guessed MIME type, in order."""
+        png_path = tmp_path / "a.png"
+        jpg_path = tmp_path / "b.jpg"
+        png_path.write_bytes(b"png data")
+        jpg_path.write_bytes(b"jpeg data")
+
+        images = _load_input_images_raw([str(png_path), str(jpg_path)], logging.getLogger(__name__))
+
+        assert images == [(b"png data", "image/png"), (b"jpeg data", "image/jpeg")]
+
+    @pytest.mark.parametrize("size_hint", [-1, 0, 5, 4096])
+    def test_read_file_bytes_with_size_hint(self, tmp_path, size_hint: int):
+        """A stale or missing size hint should still read the whole file."""
+        data = bytes(range(256)) * 20
+        path = tmp_path / "image.bin"
+        path.write_bytes(data)
+
+        assert _read_file_bytes(str(path), size_hint) == data
+
+    def test_raw_loader_returns_bytes(self, tmp_path):
+        """The raw loader should return file bytes without base64 encoding."""
+        path = tmp_path / "a.webp"
+        path.write_bytes(b"webp data")
+
+        images = _load_input_images_raw([str(path)], logging.getLogger(__name__))
+
+        assert images == [(b"webp data", "image/webp")]
+
+    @pytest.mark.parametrize(
+        ("ext", "expected"),
+        [
+            (".png", "image/png"),
+            (".JPG", "image/jpeg"),
+            (".webp", "image/webp"),
+            (".txt", "image/png"),
+        ],
+    )
+    def test_ext_to_mime(self, ext: str, expected: str):
+        """Extensions should map to image MIME types, falling back to PNG."""
+        assert _ext_to_mime(ext) == expected
+
+    def test_ext_to_mime_keeps_host_registered_types(self):
+        """Types the host application registered should survive the lazy MIME init."""
+        mimetypes.add_type("image/x-banana-test", ".bananatest")
+        _ext_to_mime.cache_clear()
+
+        assert _ext_to_mime(".bananatest") == "image/x-banana-test"
+
+    def test_missing_file_raises_validation_error(self):
+        """Unreadable paths should raise ValidationError."""
+        with pytest.raises(ValidationError):
+            _load_input_images_raw(["/nonexistent/path/image.png"], logging.getLogger(__name__))
 
 
 # =============================================================================
@@ -231,8 +321,7 @@ class TestModeDetection:
     - When mode is explicit ("edit" or "generate"), detected mode SHALL match
     """
 
-    @given(file_id=st.text(min_size=5, max_size=20))
-    @settings(max_examples=50)
+    @pytest.mark.parametrize("file_id", ["files/abc123", "x", "file-with-dashes_and_underscores"])
     def test_auto_with_file_id_returns_edit(self, file_id: str):
         """
         **Feature: service-layer-refactoring, Property 8: Mode Detection**
@@ -269,8 +358,7 @@ class TestModeDetection:
         result = _detect_mode("auto", None, ["/path1.png", "/path2.png"])
         assert result == "generate"
 
-    @given(mode=st.sampled_from(["edit", "generate"]))
-    @settings(max_examples=50)
+    @given(mode=explicit_mode_strategy)
     def test_explicit_mode_returns_same(self, mode: str):
         """
         **Feature: service-layer-refactoring, Property 8: Mode Detection**
@@ -281,10 +369,9 @@ class TestModeDetection:
         assert result == mode
 
     @given(
-        mode=st.sampled_from(["edit", "generate"]),
+        mode=explicit_mode_strategy,
         file_id=file_id_strategy,
     )
-    @settings(max_examples=50)
     def test_explicit_mode_ignores_inputs(self, mode: str, file_id: str | None):
         """
         **Feature: service-layer-refactoring, Property 8: Mode Detection**
@@ -311,9 +398,9 @@ class TestResponseBuilding:
     - structured_content with mode, model_tier, and images fields
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_metadata(self):
-        """Sample metadata for testing."""
+        """Sample metadata for testing; shared by the class, so copy before changing it."""
         return [
             {
                 "full_path": "/tmp/image_001.png",
@@ -324,7 +411,7 @@ class TestResponseBuilding:
             }
         ]
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_model_info(self):
         """Sample model info for testing."""
         return {
@@ -380,6 +467,63 @@ class TestResponseBuilding:
         assert "Edited" in summary
         assert "files/abc123" in summary
 
+    def test_build_short_summary(self, sample_metadata, sample_model_info):
+        """The short summary should be a single status line."""
+        summary = _build_short_summary("generate", sample_metadata, sample_model_info)
+
+        assert summary == "✅ Generated 1 image(s) with Gemini Flash."
+
+    def test_build_summary_uses_precomputed_size_mb(self, sample_metadata, sample_model_info):
+        """A size_mb field from the service should be shown as-is."""
+        metadata = [{**sample_metadata[0], "size_mb": 2.5}]
+        summary = _build_summary(
+            mode="generate",
+            metadata=metadata,
+            model_info=sample_model_info,
+            selected_tier=ModelTier.FLASH,
+            thinking_level="high",
+            resolution="high",
+            enable_grounding=False,
+            file_id=None,
+            input_paths=None,
+            aspect_ratio=None,
+        )
+
+        assert "💾 2.5MB" in summary
+
+    def test_build_resource_links(self, sample_metadata):
+        """Each saved image should become a file:// resource link."""
+        links = _build_resource_links([*sample_metadata, {"size_bytes": 1}])
+
+        assert len(links) == 1
+        assert links[0].type == "resource_link"
+        assert str(links[0].uri) == "file:///tmp/image_001.png"
+        assert links[0].name == "image_001.png"
+        assert links[0].mimeType == "image/png"
+        assert links[0].size == 1024 * 100
+
+    def test_build_summary_image_block(self, sample_metadata, sample_model_info):
+        """Each image should render as a path line followed by a details line."""
+        metadata = [{**sample_metadata[0], "parent_file_id": "files/parent"}]
+        summary = _build_summary(
+            mode="edit",
+            metadata=metadata,
+            model_info=sample_model_info,
+            selected_tier=ModelTier.FLASH,
+            thinking_level="high",
+            resolution="high",
+            enable_grounding=False,
+            file_id="files/parent",
+            input_paths=None,
+            aspect_ratio=None,
+        )
+
+        assert (
+            "  1. `/tmp/image_001.png`\n"
+            "     📏 1024x768 • 💾 0.1MB • 🌐 Files API: files/abc123"
+            " • 👨‍👩‍👧 Parent: files/parent\n"
+        ) in summary
+
     def test_build_structured_content_contains_required_fields(
         self, sample_metadata, sample_model_info
     ):
@@ -413,11 +557,43 @@ class TestResponseBuilding:
         assert "images" in content
         assert content["images"] == sample_metadata
 
-    @given(mode=st.sampled_from(["generate", "edit"]))
-    @settings(
-        max_examples=20,
-        suppress_health_check=[HealthCheck.function_scoped_fixture],
-    )
+    def test_build_structured_content_aggregates_images(self, sample_model_info):
+        """Per-image fields should skip missing values."""
+        metadata = [
+            {
+                "full_path": "/tmp/a.png",
+                "size_bytes": 1024 * 1024,
+                "files_api": {"name": "files/a"},
+                "parent_file_id": "files/p",
+            },
+            {"size_bytes": 1024 * 1024, "files_api": None},
+        ]
+
+        content = _build_structured_content(
+            mode="edit",
+            metadata=metadata,
+            model_info=sample_model_info,
+            selected_tier=ModelTier.FLASH,
+            tier=ModelTier.AUTO,
+            model_tier="auto",
+            thinking_level="high",
+            resolution="high",
+            enable_grounding=False,
+            n=2,
+            thumbnail_count=2,
+            negative_prompt=None,
+            input_paths=None,
+            file_id="files/p",
+            aspect_ratio=None,
+            prompt="test prompt",
+        )
+
+        assert content["file_paths"] == ["/tmp/a.png"]
+        assert content["files_api_ids"] == ["files/a"]
+        assert content["parent_relationships"] == [("files/p", "files/a"), (None, None)]
+        assert content["total_size_mb"] == 2.0
+
+    @given(mode=explicit_mode_strategy)
     def test_build_structured_content_mode_specific_fields(
         self, sample_metadata, sample_model_info, mode: str
     ):
@@ -0,0 +1,31 @@
+"""
+Tests for the image registry persisted by ImageStorageService.
+"""
+
+from dataclasses import replace
+import time
+
+from banana_image_mcp.services.image_storage_service import ImageStorageService
+
+
+class TestImageRegistry:
+    """The registry SHALL survive a save/load round trip unchanged."""
+
+    def test_non_ascii_prompt_round_trips(
+        self, tmp_path, mock_gemini_config, mock_stored_image_info
+    ):
+        """Non-ASCII prompts should be written as UTF-8 and read back intact."""
+        prompt = "一只戴着墨镜的香蕉 🍌, café"
+        info = replace(
+            mock_stored_image_info,
+            expires_at=time.time() + 3600,
+            metadata={"prompt": prompt},
+        )
+        service = ImageStorageService(mock_gemini_config, base_dir=str(tmp_path))
+        service.image_registry[info.id] = info
+
+        service._save_registry()
+        reloaded = ImageStorageService(mock_gemini_config, base_dir=str(tmp_path))
+
+        assert prompt in service.metadata_file.read_bytes().decode("utf-8")
+        assert reloaded.image_registry == {info.id: info}
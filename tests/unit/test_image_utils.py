@@ -0,0 +1,98 @@
+"""
+Tests for recompressing oversized images in image_utils.
+
+Each format is exercised on the Pillow fallback and, when the ``speed``
+extra is installed, on the native encoder (libjpeg-turbo / oxipng).
+"""
+
+from io import BytesIO
+import random
+
+from PIL import Image
+import pytest
+
+from banana_image_mcp.core.exceptions import ImageProcessingError
+from banana_image_mcp.utils import image_utils
+from banana_image_mcp.utils.base64_utils import b64decode, b64encode_str
+
+MAX_SIZE = 200 * 1024
+
+
+def _noise_image(fmt: str, size: tuple[int, int], mode: str = "RGB") -> bytes:
+    """Encode seeded noise, which compresses poorly, so the result is oversized."""
+    width, height = size
+    pixels = random.Random(0).randbytes(width * height * len(mode))
+    output = BytesIO()
+    Image.frombytes(mode, size, pixels).save(output, format=fmt, quality=95)
+    return output.getvalue()
+
+
+@pytest.fixture(params=["fallback", "native"])
+def encoder_backend(request, monkeypatch):
+    """Run a test on the Pillow fallback and on the native encoders."""
+    if request.param == "fallback":
+        monkeypatch.setattr(image_utils, "_get_turbojpeg", lambda: None)
+        monkeypatch.setattr(image_utils, "_get_oxipng", lambda: None)
+    return request.param
+
+
+class TestOptimizeImageBytes:
+    """Oversized images SHALL shrink below max_size, keeping format and aspect ratio."""
+
+    @pytest.mark.parametrize(
+        ("fmt", "mode", "size"),
+        [
+            ("JPEG", "RGB", (1200, 800)),
+            ("PNG", "RGB", (600, 400)),
+            ("PNG", "RGBA", (400, 600)),
+        ],
+    )
+    def test_oversized_image_is_recompressed(
+        self, encoder_backend: str, fmt: str, mode: str, size: tuple[int, int]
+    ):
+        native = image_utils._get_turbojpeg() if fmt == "JPEG" else image_utils._get_oxipng()
+        if encoder_backend == "native" and native is None:
+            pytest.skip(f"native {fmt} encoder not installed")
+        data = _noise_image(fmt, size, mode)
+        assert len(data) > MAX_SIZE
+
+        optimized = image_utils.optimize_image_bytes(data, max_size=MAX_SIZE)
+
+        assert len(optimized) <= MAX_SIZE
+        with Image.open(BytesIO(optimized)) as result:
+            assert result.format == fmt
+            assert result.width < size[0]
+            assert result.width / result.height == pytest.approx(size[0] / size[1], rel=0.01)
+
+    def test_small_image_is_returned_unchanged(self):
+        data = _noise_image("PNG", (8, 8))
+
+        assert image_utils.optimize_image_bytes(data, max_size=MAX_SIZE) is data
+
+    def test_invalid_data_raises_with_cause(self):
+        with pytest.raises(ImageProcessingError) as exc_info:
+            image_utils.optimize_image_bytes(b"not an image" * 100, max_size=10)
+
+        assert exc_info.value.__cause__ is not None
+
+
+class TestOptimizeImageSize:
+    """The base64 wrapper SHALL round-trip through optimize_image_bytes."""
+
+    def test_small_image_keeps_its_base64(self):
+        image_b64 = b64encode_str(_noise_image("PNG", (8, 8)))
+
+        assert image_utils.optimize_image_size(image_b64, max_size=MAX_SIZE) is image_b64
+
+    def test_oversized_image_is_reencoded(self):
+        data = _noise_image("JPEG", (1200, 800))
+
+        optimized = image_utils.optimize_image_size(b64encode_str(data), max_size=MAX_SIZE)
+
+        assert len(b64decode(optimized)) <= MAX_SIZE
+
+    def test_invalid_base64_raises_with_cause(self):
+        with pytest.raises(ImageProcessingError) as exc_info:
+            image_utils.optimize_image_size("a", max_size=10)
+
+        assert exc_info.value.__cause__ is not None
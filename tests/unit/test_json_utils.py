@@ -0,0 +1,54 @@
+"""
+Tests for the orjson-backed JSON helpers and their stdlib fallback.
+"""
+
+import importlib
+import json
+import sys
+
+import pytest
+
+from banana_image_mcp.utils import json_utils
+
+DOCUMENT = {"prompt": "香蕉 🍌", "size": 1024, "ratio": 1.5, "tags": ["a", None, True]}
+
+
+@pytest.fixture
+def stdlib_json_utils(monkeypatch):
+    """Reload json_utils as if orjson were not installed."""
+    with monkeypatch.context() as m:
+        m.setitem(sys.modules, "orjson", None)
+        yield importlib.reload(json_utils)
+    importlib.reload(json_utils)
+
+
+@pytest.fixture
+def orjson_json_utils():
+    """json_utils with orjson active, skipped when the speed extra is absent."""
+    pytest.importorskip("orjson")
+    assert json_utils.orjson is not None
+    return json_utils
+
+
+@pytest.mark.parametrize("backend", ["orjson_json_utils", "stdlib_json_utils"])
+class TestJsonBackends:
+    """Both backends SHALL produce JSON the stdlib parser agrees with."""
+
+    def test_round_trip(self, request, backend: str):
+        module = request.getfixturevalue(backend)
+
+        assert module.loads(module.dumps(DOCUMENT)) == DOCUMENT
+        assert module.loads(module.dumps(DOCUMENT).encode("utf-8")) == DOCUMENT
+
+    def test_indent_uses_two_spaces(self, request, backend: str):
+        module = request.getfixturevalue(backend)
+
+        text = module.dumps({"a": [1]}, indent=True)
+
+        assert text.splitlines()[1].startswith('  "a"')
+        assert json.loads(text) == {"a": [1]}
+
+
+def test_fallback_is_selected_without_orjson(stdlib_json_utils):
+    """Without orjson the module should fall back to the stdlib encoder."""
+    assert stdlib_json_utils.orjson is None
@@ -8,26 +8,14 @@ This module tests:
 - Property 9: Model Selection
 """
 
-from unittest.mock import Mock
+from types import SimpleNamespace
 
-from hypothesis import HealthCheck, given, settings
-from hypothesis import strategies as st
+from hypothesis import given
 import pytest
 
 from banana_image_mcp.config.settings import ModelSelectionConfig, ModelTier
-from banana_image_mcp.services.base_image_service import BaseImageService
 from banana_image_mcp.services.model_selector import ModelSelector
-
-# =============================================================================
-# Hypothesis Strategies
-# =============================================================================
-
-# Strategy for generating prompts
-prompt_strategy = st.text(min_size=1, max_size=200)
-
-# Strategy for model tiers
-model_tier_strategy = st.sampled_from([ModelTier.FLASH, ModelTier.PRO, ModelTier.AUTO, None])
-
+from tests.strategies import prompt_strategy
 
 # =============================================================================
 # Property 9: Model Selection
@@ -45,21 +33,17 @@ class TestModelSelection:
     - The returned service SHALL be an instance of BaseImageService
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_flash_service(self):
-        """Create a mock Flash service."""
-        service = Mock(spec=BaseImageService)
-        service.name = "flash"
-        return service
+        """Create a stand-in Flash service (selection only checks identity)."""
+        return SimpleNamespace(name="flash")
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_pro_service(self):
-        """Create a mock Pro service."""
-        service = Mock(spec=BaseImageService)
-        service.name = "pro"
-        return service
+        """Create a stand-in Pro service."""
+        return SimpleNamespace(name="pro")
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def selection_config(self):
         """Create a selection config."""
         return ModelSelectionConfig(
@@ -68,9 +52,13 @@ class TestModelSelection:
             auto_speed_keywords=["quick", "fast", "draft", "prototype"],
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def model_selector(self, mock_flash_service, mock_pro_service, selection_config):
-        """Create a ModelSelector for testing."""
+        """Create one ModelSelector shared by the class.
+
+        Selection only returns the service mocks without calling them, so they
+        carry no call history to reset between tests.
+        """
         return ModelSelector(
             flash_service=mock_flash_service,
             pro_service=mock_pro_service,
@@ -78,88 +66,27 @@ class TestModelSelection:
         )
 
     @given(prompt=prompt_strategy)
-    @settings(
-        max_examples=50,
-        suppress_health_check=[HealthCheck.function_scoped_fixture],
-    )
-    def test_explicit_flash_returns_flash_service(
-        self, model_selector, mock_flash_service, prompt: str
-    ):
-        """
-        **Feature: service-layer-refactoring, Property 9: Model Selection**
-
-        Explicit FLASH request should return Flash service.
-        """
-        service, tier = model_selector.select_model(
-            prompt=prompt,
-            requested_tier=ModelTier.FLASH,
-        )
-
-        assert service is mock_flash_service
-        assert tier == ModelTier.FLASH
-
-    @given(prompt=prompt_strategy)
-    @settings(
-        max_examples=50,
-        suppress_health_check=[HealthCheck.function_scoped_fixture],
-    )
-    def test_explicit_pro_returns_pro_service(self, model_selector, mock_pro_service, prompt: str):
-        """
-        **Feature: service-layer-refactoring, Property 9: Model Selection**
-
-        Explicit PRO request should return Pro service.
-        """
-        service, tier = model_selector.select_model(
-            prompt=prompt,
-            requested_tier=ModelTier.PRO,
-        )
-
-        assert service is mock_pro_service
-        assert tier == ModelTier.PRO
-
-    @given(prompt=prompt_strategy)
-    @settings(
-        max_examples=50,
-        suppress_health_check=[HealthCheck.function_scoped_fixture],
-    )
-    def test_auto_returns_valid_service(
+    def test_select_model_invariants(
         self, model_selector, mock_flash_service, mock_pro_service, prompt: str
     ):
         """
         **Feature: service-layer-refactoring, Property 9: Model Selection**
 
-        AUTO request should return a valid service.
+        For any prompt: explicit FLASH/PRO requests return that service, and
+        AUTO or no tier returns one of the two services (the same one for both).
         """
-        service, tier = model_selector.select_model(
-            prompt=prompt,
-            requested_tier=ModelTier.AUTO,
+        assert model_selector.select_model(prompt, ModelTier.FLASH) == (
+            mock_flash_service,
+            ModelTier.FLASH,
         )
-
-        # Should return one of the services
-        assert service in [mock_flash_service, mock_pro_service]
-        assert tier in [ModelTier.FLASH, ModelTier.PRO]
-
-    @given(prompt=prompt_strategy)
-    @settings(
-        max_examples=50,
-        suppress_health_check=[HealthCheck.function_scoped_fixture],
-    )
-    def test_none_tier_returns_valid_service(
-        self, model_selector, mock_flash_service, mock_pro_service, prompt: str
-    ):
-        """
-        **Feature: service-layer-refactoring, Property 9: Model Selection**
-
-        None tier should behave like AUTO.
-        """
-        service, tier = model_selector.select_model(
-            prompt=prompt,
-            requested_tier=None,
+        assert model_selector.select_model(prompt, ModelTier.PRO) == (
+            mock_pro_service,
+            ModelTier.PRO,
         )
 
-        # Should return one of the services
-        assert service in [mock_flash_service, mock_pro_service]
-        assert tier in [ModelTier.FLASH, ModelTier.PRO]
+        auto = model_selector.select_model(prompt, ModelTier.AUTO)
+        assert auto in [(mock_flash_service, ModelTier.FLASH), (mock_pro_service, ModelTier.PRO)]
+        assert model_selector.select_model(prompt, None) == auto
 
     def test_quality_keywords_favor_pro(self, model_selector, mock_pro_service):
         """
@@ -221,6 +148,15 @@ class TestModelSelection:
         assert service is mock_pro_service
         assert tier == ModelTier.PRO
 
+    def test_keyword_scores_merge_overlapping_lists(self, model_selector):
+        """Keywords in several lists should get one entry with their combined weight."""
+        scores = model_selector._keyword_scores
+
+        assert scores["4k"] == (3, 0)  # configured (1) + strong (2)
+        assert scores["production"] == (2, 0)  # strong only
+        assert scores["detailed"] == (1, 0)
+        assert scores["quick"] == (0, 1)
+
     def test_get_model_info_flash(self, model_selector):
         """
         **Feature: service-layer-refactoring, Property 9: Model Selection**
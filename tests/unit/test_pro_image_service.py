@@ -8,29 +8,21 @@ This module tests:
 - Property 3: Pro Service Behavior Consistency
 """
 
-from hypothesis import HealthCheck, given, settings
+from hypothesis import given
 from hypothesis import strategies as st
 import pytest
 
 from banana_image_mcp.config.settings import MediaResolution, ThinkingLevel
 from banana_image_mcp.services.base_image_service import BaseImageService
 from banana_image_mcp.services.pro_image_service import ProImageService
+from tests.strategies import ascii_prompt_strategy, index_strategy, printable_ascii
 
 # =============================================================================
 # Hypothesis Strategies
 # =============================================================================
 
-# Strategy for generating prompts
-prompt_strategy = st.text(min_size=1, max_size=200)
-
 # Strategy for short prompts (< 50 chars) that trigger enhancement
-short_prompt_strategy = st.text(min_size=1, max_size=49)
-
-# Strategy for long prompts (>= 50 chars) that don't trigger enhancement
-long_prompt_strategy = st.text(min_size=50, max_size=200)
-
-# Strategy for response/image indices
-index_strategy = st.integers(min_value=1, max_value=10)
+short_prompt_strategy = st.text(printable_ascii, min_size=1, max_size=49)
 
 # Strategy for thinking levels
 thinking_level_strategy = st.sampled_from([ThinkingLevel.LOW, ThinkingLevel.HIGH])
@@ -41,6 +33,42 @@ media_resolution_strategy = st.sampled_from([MediaResolution.LOW, MediaResolutio
 # Strategy for resolution strings
 resolution_strategy = st.sampled_from(["4k", "high", "2k", "1k"])
 
+# Fields every Pro metadata record must carry
+REQUIRED_PRO_METADATA_KEYS = frozenset(
+    {
+        "model_tier",
+        "resolution",
+        "model",
+        "synthid_watermark",
+        "prompt",
+        "response_index",
+        "image_index",
+    }
+)
+
+# Strategy for the positional arguments of _build_metadata
+metadata_args_strategy = st.fixed_dictionaries(
+    {
+        "prompt": ascii_prompt_strategy,
+        "response_index": index_strategy,
+        "image_index": index_strategy,
+    }
+)
+
+
+# Narrative lead-in that Pro enhancement puts in front of short prompts
+SHORT_PROMPT_LEAD_IN = "Create a high-quality, detailed image: "
+
+
+def _original_prompt_slice(result: str, prompt: str) -> str:
+    """Return the part of an enhanced prompt where the original should sit.
+
+    Enhancement keeps the original prompt whole at a fixed offset: at the start
+    for prompts of 50+ characters, right after the lead-in for shorter ones.
+    """
+    offset = 0 if len(prompt) >= 50 else len(SHORT_PROMPT_LEAD_IN)
+    return result[offset : offset + len(prompt)]
+
 
 # =============================================================================
 # Property 3: Pro Service Behavior Consistency
@@ -57,13 +85,19 @@ class TestProServiceBehaviorConsistency:
     - `_enhance_prompt(prompt, resolution)` SHALL return a string containing the original prompt
     """
 
-    @pytest.fixture
-    def pro_service(self, mock_pro_gemini_client, mock_pro_config, mock_storage_service):
-        """Create a ProImageService for testing."""
+    @pytest.fixture(scope="class")
+    def pro_service(
+        self, mock_pro_gemini_client_factory, mock_pro_config, mock_storage_service_factory
+    ):
+        """Create one ProImageService shared by the class.
+
+        None of these tests call the client or storage mocks, so they need no
+        resetting between tests.
+        """
         return ProImageService(
-            gemini_client=mock_pro_gemini_client,
+            gemini_client=mock_pro_gemini_client_factory(),
             config=mock_pro_config,
-            storage_service=mock_storage_service,
+            storage_service=mock_storage_service_factory(),
         )
 
     def test_pro_service_inherits_from_base(
@@ -83,10 +117,6 @@ class TestProServiceBehaviorConsistency:
         thinking_level=thinking_level_strategy,
         media_resolution=media_resolution_strategy,
     )
-    @settings(
-        max_examples=50,
-        suppress_health_check=[HealthCheck.function_scoped_fixture],
-    )
     def test_build_generation_config_includes_required_keys(
         self,
         pro_service,
@@ -123,91 +153,61 @@ class TestProServiceBehaviorConsistency:
         assert config["thinking_level"] == pro_service.pro_config.default_thinking_level.value
 
     @given(
-        prompt=prompt_strategy,
-        response_index=index_strategy,
-        image_index=index_strategy,
+        args=metadata_args_strategy,
         resolution=resolution_strategy,
-    )
-    @settings(
-        max_examples=100,
-        suppress_health_check=[HealthCheck.function_scoped_fixture],
-    )
-    def test_build_metadata_includes_required_fields(
-        self,
-        pro_service,
-        prompt: str,
-        response_index: int,
-        image_index: int,
-        resolution: str,
-    ):
-        """
-        **Feature: service-layer-refactoring, Property 3: Pro Service Behavior Consistency**
-
-        _build_metadata() should include model_tier="pro" and resolution key.
-        """
-        metadata = pro_service._build_metadata(
-            prompt=prompt,
-            response_index=response_index,
-            image_index=image_index,
-            resolution=resolution,
-        )
-
-        # Required fields
-        assert metadata["model_tier"] == "pro"
-        assert metadata["resolution"] == resolution
-        assert metadata["model"] == pro_service.pro_config.model_name
-        assert metadata["synthid_watermark"] is True
-
-        # Passed parameters
-        assert metadata["prompt"] == prompt
-        assert metadata["response_index"] == response_index
-        assert metadata["image_index"] == image_index
-
-    @given(
-        prompt=prompt_strategy,
-        response_index=index_strategy,
-        image_index=index_strategy,
         thinking_level=thinking_level_strategy,
         media_resolution=media_resolution_strategy,
     )
-    @settings(
-        max_examples=100,
-        suppress_health_check=[HealthCheck.function_scoped_fixture],
-    )
-    def test_build_metadata_includes_pro_specific_fields(
+    def test_build_metadata_contract(
         self,
         pro_service,
-        prompt: str,
-        response_index: int,
-        image_index: int,
+        args: dict,
+        resolution: str,
         thinking_level: ThinkingLevel,
         media_resolution: MediaResolution,
     ):
         """
         **Feature: service-layer-refactoring, Property 3: Pro Service Behavior Consistency**
 
-        _build_metadata() should include Pro-specific fields.
+        _build_metadata() should include model_tier="pro", the resolution and
+        the passed parameters, plus the Pro-specific fields.
         """
         metadata = pro_service._build_metadata(
-            prompt=prompt,
-            response_index=response_index,
-            image_index=image_index,
+            **args,
+            resolution=resolution,
             thinking_level=thinking_level,
             media_resolution=media_resolution,
         )
 
+        missing = REQUIRED_PRO_METADATA_KEYS - metadata.keys()
+        assert not missing, missing
+        assert {key: metadata[key] for key in REQUIRED_PRO_METADATA_KEYS} == {
+            "model_tier": "pro",
+            "resolution": resolution,
+            "model": pro_service.pro_config.model_name,
+            "synthid_watermark": True,
+            **args,
+        }
+
         # Pro-specific fields
-        assert "thinking_level" in metadata
         assert metadata["thinking_level"] == thinking_level.value
-        assert "media_resolution" in metadata
         assert metadata["media_resolution"] == media_resolution.value
         assert "grounding_enabled" in metadata
 
-    @given(prompt=prompt_strategy)
-    @settings(
-        max_examples=100,
-        suppress_health_check=[HealthCheck.function_scoped_fixture],
-    )
+    def test_resolve_defaults_is_read_only(self, pro_service):
+        """Resolved defaults should be frozen and match per-image metadata."""
+        resolved = pro_service._resolve_defaults(thinking_level=ThinkingLevel.HIGH)
+
+        with pytest.raises(TypeError):
+            resolved["thinking_level"] = "low"
+
+        metadata = pro_service._build_metadata(
+            prompt="prompt", response_index=1, image_index=1, resolved=resolved
+        )
+        assert metadata["thinking_level"] == ThinkingLevel.HIGH.value
+        assert metadata["mime_type"] == resolved["mime_type"]
+
+    @given(prompt=ascii_prompt_strategy)
     def test_enhance_prompt_contains_original(self, pro_service, prompt: str):
         """
         **Feature: service-layer-refactoring, Property 3: Pro Service Behavior Consistency**
@@ -216,16 +216,12 @@ class TestProServiceBehaviorConsistency:
         """
         result = pro_service._enhance_prompt(prompt)
 
-        assert prompt in result
+        assert _original_prompt_slice(result, prompt) == prompt
 
     @given(
-        prompt=prompt_strategy,
+        prompt=ascii_prompt_strategy,
         resolution=resolution_strategy,
     )
-    @settings(
-        max_examples=100,
-        suppress_health_check=[HealthCheck.function_scoped_fixture],
-    )
     def test_enhance_prompt_with_resolution(self, pro_service, prompt: str, resolution: str):
         """
         **Feature: service-layer-refactoring, Property 3: Pro Service Behavior Consistency**
@@ -235,13 +231,9 @@ class TestProServiceBehaviorConsistency:
         result = pro_service._enhance_prompt(prompt, resolution=resolution)
 
         # Original prompt should always be present
-        assert prompt in result
+        assert _original_prompt_slice(result, prompt) == prompt
 
     @given(prompt=short_prompt_strategy)
-    @settings(
-        max_examples=50,
-        suppress_health_check=[HealthCheck.function_scoped_fixture],
-    )
     def test_enhance_prompt_enhances_short_prompts(self, pro_service, prompt: str):
         """
         **Feature: service-layer-refactoring, Property 3: Pro Service Behavior Consistency**
@@ -252,8 +244,7 @@ class TestProServiceBehaviorConsistency:
 
         # Short prompts get enhanced
         assert len(result) > len(prompt)
-        assert prompt in result
-        assert "high-quality" in result.lower() or "detailed" in result.lower()
+        assert result.startswith(SHORT_PROMPT_LEAD_IN + prompt)
 
     def test_enhance_prompt_adds_4k_hint(self, pro_service):
         """